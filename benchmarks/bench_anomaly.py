@@ -0,0 +1,100 @@
+"""Benchmark fleet-wide anomaly scoring.
+
+Builds synthetic fleets of heat pumps reporting every compared property
+(normally distributed around typical readings, with one heater per 50
+drifting well away) and times ``anomaly.FleetAnomalyDetector.analyze``,
+which the status coordinator runs on every refresh that changed the
+snapshot. Also reports how many of the planted outliers were flagged
+and how many healthy heaters were flagged with them.
+
+Run from the repository root::
+
+    python benchmarks/bench_anomaly.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import sys
+import time
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+_INTEGRATION_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "bradford_white_connect"
+)
+
+# Import the pure modules by their dotted name without running the
+# package __init__ (which needs Home Assistant).
+_package = ModuleType("custom_components.bradford_white_connect")
+_package.__path__ = [str(_INTEGRATION_DIR)]
+sys.modules.setdefault(_package.__name__, _package)
+sys.path.insert(0, str(_INTEGRATION_DIR.parent.parent))
+
+# pylint: disable=wrong-import-position
+from custom_components.bradford_white_connect.anomaly import (  # noqa: E402
+    FleetAnomalyDetector,
+)
+
+# (mean, standard deviation) of each property across a healthy fleet.
+_TYPICAL = {
+    "superheat_evap": (8.0, 1.5),
+    "comp_discharge_temp": (160.0, 6.0),
+    "evap_inlet_temp": (62.0, 2.0),
+    "evap_outlet_temp": (55.0, 2.0),
+    "hp_current": (4.5, 0.4),
+    "eev_pos": (120.0, 12.0),
+}
+
+FLEET_SIZES = (10, 100, 300, 1000)
+ROUNDS = 20
+
+
+def synthetic_fleet(size: int, seed: int = 1) -> tuple[dict[str, Any], set[str]]:
+    """Return ``{dsn: Device}`` and the DSNs of the planted outliers."""
+    rng = random.Random(seed)
+    devices: dict[str, Any] = {}
+    outliers: set[str] = set()
+    for index in range(size):
+        dsn = f"AC{index:05d}"
+        drifting = index % 50 == 7
+        properties = {}
+        for name, (mean, sigma) in _TYPICAL.items():
+            value = rng.gauss(mean, sigma)
+            if drifting and name == "superheat_evap":
+                value += 8 * sigma
+            properties[name] = SimpleNamespace(value=f"{value:.1f}")
+        if drifting:
+            outliers.add(dsn)
+        devices[dsn] = SimpleNamespace(properties=properties)
+    return devices, outliers
+
+
+def run(size: int) -> None:
+    """Time ``analyze`` on a fleet of ``size`` heaters and print the result."""
+    devices, outliers = synthetic_fleet(size)
+    detector = FleetAnomalyDetector()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        detector.analyze(devices)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    flagged = {dsn for dsn, result in detector.results.items() if result.anomalous}
+    print(
+        f"{size:>6} heaters  {elapsed * 1e3:8.2f} ms/run  "
+        f"{elapsed / size * 1e6:6.2f} us/heater  "
+        f"outliers flagged {len(flagged & outliers)}/{len(outliers)}  "
+        f"false positives {len(flagged - outliers)}"
+    )
+
+
+def main() -> None:
+    """Benchmark every fleet size."""
+    for size in FLEET_SIZES:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
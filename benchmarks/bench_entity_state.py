@@ -0,0 +1,236 @@
+"""Micro-benchmark: per-entity cost of a state write, before and after caching.
+
+Home Assistant reads an entity's state properties several times for every
+state write (``state``, ``state_attributes``, ``capability_attributes``).
+Entities used to answer each read by looking the device up in
+``coordinator.data`` and re-parsing the property; they now compute their
+values once per coordinator update into ``_attr_*`` fields, and skip even
+that when the snapshot reused their device object.
+
+The old read path is reproduced here for the water heater and a property
+sensor; the new one is the integration's own entities, running their real
+``_update_attrs`` against a realistic device (130 properties). The read
+lists mirror what HA's water_heater and sensor base classes read per write.
+
+Needs Home Assistant and the upstream client (``pip install -r
+requirements.test.txt bradford-white-connect-client``). Run from the
+repository root::
+
+    python benchmarks/bench_entity_state.py
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+import timeit
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from custom_components.bradford_white_connect.capabilities import (  # noqa: E402
+    CapabilityIndex,
+)
+from custom_components.bradford_white_connect.sensor import (  # noqa: E402
+    PROPERTY_SENSORS,
+    BradfordWhiteConnectPropertySensor,
+)
+from custom_components.bradford_white_connect.water_heater import (  # noqa: E402
+    BradfordWhiteConnectWaterHeaterEntity,
+)
+
+DSN = "AC000W000000001"
+VACATION = 5
+MODE_NAMES = {1: "eco", 2: "electric", 3: "heat_pump", 4: "high_demand", 5: "off"}
+
+# Properties HA reads per state write (state + state/capability attributes).
+WATER_HEATER_READS = (
+    "current_operation",
+    "current_temperature",
+    "target_temperature",
+    "current_operation",
+    "is_away_mode_on",
+    "min_temp",
+    "max_temp",
+    "operation_list",
+    "supported_features",
+    "supported_features",
+    "supported_features",
+)
+SENSOR_READS = ("native_value", "extra_state_attributes")
+
+
+def _device() -> SimpleNamespace:
+    properties = {
+        f"prop_{index}": SimpleNamespace(name=f"prop_{index}", value=index)
+        for index in range(124)
+    }
+    for name, value in (
+        ("tank_temp", 118),
+        ("water_setpoint_out", "120"),
+        ("water_setpoint_min", 90),
+        ("water_setpoint_max", 140),
+        ("current_heat_mode", "3"),
+        ("mains_current", "4.25"),
+    ):
+        properties[name] = SimpleNamespace(name=name, value=value)
+    return SimpleNamespace(dsn=DSN, properties=properties)
+
+
+class _Coordinator:
+    """The parts of the status coordinator the entities read."""
+
+    def __init__(self) -> None:
+        self.data = {DSN: _device()}
+        self.capabilities = CapabilityIndex()
+        self.capabilities.rebuild(self.data)
+        self.operation_list = ("eco", "electric", "heat_pump", "off")
+
+
+class OldWaterHeater:
+    """Every read resolves the device and re-parses the property."""
+
+    def __init__(self, coordinator: _Coordinator) -> None:
+        self.coordinator = coordinator
+
+    @property
+    def device(self) -> Any:
+        return self.coordinator.data.get(DSN)
+
+    def _mode(self) -> int | None:
+        prop = self.device.properties.get("current_heat_mode")
+        if prop is None or prop.value is None:
+            return None
+        try:
+            return int(prop.value)
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def current_temperature(self) -> Any:
+        prop = self.device.properties.get("tank_temp")
+        return prop.value if prop else None
+
+    @property
+    def target_temperature(self) -> Any:
+        prop = self.device.properties.get("water_setpoint_out")
+        return prop.value if prop else None
+
+    @property
+    def min_temp(self) -> Any:
+        prop = self.device.properties.get("water_setpoint_min")
+        return prop.value if prop else None
+
+    @property
+    def max_temp(self) -> Any:
+        prop = self.device.properties.get("water_setpoint_max")
+        return prop.value if prop else None
+
+    @property
+    def current_operation(self) -> str:
+        mode = self._mode()
+        return "off" if mode is None else MODE_NAMES.get(mode, "off")
+
+    @property
+    def is_away_mode_on(self) -> bool:
+        return self._mode() == VACATION
+
+    @property
+    def operation_list(self) -> list[str]:
+        return list(self.coordinator.operation_list)
+
+    @property
+    def supported_features(self) -> int:
+        return 3 if len(self.operation_list) > 1 else 1
+
+
+def _sensor_value(device: Any) -> Any:
+    prop = (device.properties or {}).get("mains_current")
+    return None if prop is None else getattr(prop, "value", None)
+
+
+class OldSensor:
+    def __init__(self, coordinator: _Coordinator) -> None:
+        self.coordinator = coordinator
+
+    @property
+    def native_value(self) -> Any:
+        try:
+            return _sensor_value(self.coordinator.data.get(DSN))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    @property
+    def extra_state_attributes(self) -> None:
+        return None
+
+
+def _state_write(entity: Any, reads: tuple[str, ...]) -> Callable[[], None]:
+    def _write() -> None:
+        for name in reads:
+            getattr(entity, name)
+
+    return _write
+
+
+def _update_and_write(entity: Any, reads: tuple[str, ...]) -> Callable[[], None]:
+    """Recompute the cached state, as for a replaced device, then write it."""
+    write = _state_write(entity, reads)
+
+    def _cycle() -> None:
+        entity._update_attrs()  # pylint: disable=protected-access
+        write()
+
+    return _cycle
+
+
+def _measure(stmt: Callable[[], None], number: int) -> float:
+    """Return the best per-call time in microseconds over five repeats."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def _new_entities(coordinator: _Coordinator) -> tuple[Any, Any]:
+    device = coordinator.data[DSN]
+    description = next(d for d in PROPERTY_SENSORS if d.key == "mains_current")
+    return (
+        BradfordWhiteConnectWaterHeaterEntity(coordinator, DSN, device),
+        BradfordWhiteConnectPropertySensor(coordinator, DSN, device, description),
+    )
+
+
+def main(number: int = 20_000) -> None:
+    """Print the per-entity cost of one coordinator update + state write.
+
+    "replaced" recomputes the cached state first, as a poll that changed
+    the heater does; "reused" is a poll that left its device object alone.
+    """
+    coordinator = _Coordinator()
+    water_heater, sensor = _new_entities(coordinator)
+    cases = (
+        (
+            "water_heater",
+            _state_write(OldWaterHeater(coordinator), WATER_HEATER_READS),
+            _update_and_write(water_heater, WATER_HEATER_READS),
+            _state_write(water_heater, WATER_HEATER_READS),
+        ),
+        (
+            "sensor",
+            _state_write(OldSensor(coordinator), SENSOR_READS),
+            _update_and_write(sensor, SENSOR_READS),
+            _state_write(sensor, SENSOR_READS),
+        ),
+    )
+    print(f"{'entity':<14}{'before (us)':>13}{'replaced (us)':>15}{'reused (us)':>13}")
+    for name, before, replaced, reused in cases:
+        old = _measure(before, number)
+        print(
+            f"{name:<14}{old:>13.2f}{_measure(replaced, number):>15.2f}"
+            f"{_measure(reused, number):>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
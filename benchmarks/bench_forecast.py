@@ -0,0 +1,202 @@
+"""Benchmark the hot water forecaster on a recorded or synthetic trace.
+
+Replays fill-level samples through ``forecast.CapacityForecasts`` exactly
+as the status coordinator feeds them, then reports:
+
+* the cost of one update, in microseconds;
+* for every "time until full" / "time until depleted" forecast issued,
+  how far off it was from the moment the tank actually got there
+  (forecasts whose event never happened in the trace are not scored).
+
+The trace is either a capture file written with the "Record cloud
+responses" option (``<config>/bradford_white_connect/capture-*.jsonl.gz``)
+or, without an argument, a synthetic two-day trace with showers, a
+dishwasher run and one tank-emptying draw, polled every five minutes and
+rounded to whole percent as the heater reports it.
+
+Run from the repository root::
+
+    python benchmarks/bench_forecast.py [capture.jsonl.gz]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import re
+import statistics
+import sys
+import time
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+_INTEGRATION_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "bradford_white_connect"
+)
+
+# Import the pure modules by their dotted name without running the
+# package __init__ (which needs Home Assistant).
+_package = ModuleType("custom_components.bradford_white_connect")
+_package.__path__ = [str(_INTEGRATION_DIR)]
+sys.modules.setdefault(_package.__name__, _package)
+sys.path.insert(0, str(_INTEGRATION_DIR.parent.parent))
+
+# pylint: disable=wrong-import-position
+from custom_components.bradford_white_connect.capture import (  # noqa: E402
+    load_capture,
+)
+from custom_components.bradford_white_connect.forecast import (  # noqa: E402
+    EMPTY,
+    FULL,
+    CapacityForecasts,
+    fill_fraction,
+)
+
+_PROPERTIES_URL = re.compile(r"/dsns/([^/]+)/properties\.json$")
+
+Trace = list[tuple[str, float, dict[str, Any]]]
+
+
+def capture_trace(path: Path) -> Trace:
+    """Extract ``(dsn, t, {name: Property})`` per property poll from a capture."""
+    merged: dict[str, dict[str, Any]] = {}
+    trace: Trace = []
+    for record in load_capture(path):
+        match = _PROPERTIES_URL.search(record.get("url", ""))
+        if match is None or record.get("method") != "GET":
+            continue
+        dsn = match.group(1)
+        properties = merged.setdefault(dsn, {})
+        if record.get("status") == 200 and isinstance(record.get("body"), list):
+            for item in record["body"]:
+                prop = item.get("property", {})
+                if "name" in prop:
+                    properties[prop["name"]] = SimpleNamespace(value=prop.get("value"))
+        elif record.get("status") != 304:
+            continue
+        trace.append((dsn, float(record["t"]), dict(properties)))
+    return trace
+
+
+def synthetic_trace(seed: int = 1, days: int = 2) -> Trace:
+    """Simulate one heater's fill level, polled every five minutes."""
+    rng = random.Random(seed)
+    draws: list[tuple[float, float, float]] = []  # (start, duration, % per min)
+    for day in range(days):
+        base = day * 86400
+        draws.append((base + 7 * 3600 + rng.uniform(0, 1800), 600, 3.0))
+        draws.append((base + 7.5 * 3600 + rng.uniform(0, 1800), 480, 3.0))
+        draws.append((base + 20 * 3600, 5400, 0.4))
+        draws.append((base + 22 * 3600, 2700, 3.0 if day == days - 1 else 1.5))
+    level, heating = 100.0, False
+    trace: Trace = []
+    for step in range(days * 86400 // 60):
+        at = step * 60.0
+        draw = sum(
+            rate for start, length, rate in draws if start <= at < start + length
+        )
+        level -= draw + 0.01
+        heating = level < 60 or (heating and level < 100)
+        if heating:
+            level += 0.65
+        level = min(max(level, 0.0), 100.0)
+        if step % 5 == 0:
+            reading = round(level + rng.uniform(-0.4, 0.4))
+            trace.append(
+                (
+                    "dsn-1",
+                    at,
+                    {"available_thermal_capacity": SimpleNamespace(value=reading)},
+                )
+            )
+    return trace
+
+
+def _arrival(
+    fractions: list[tuple[float, float]], start: int, full: bool
+) -> float | None:
+    """Return when the tank got full (or empty) without first turning around.
+
+    A forecast is only about the recovery or draw it was issued in; if the
+    level moves back the other way by more than two percent first, the
+    forecast is not scored.
+    """
+    issued_at = fractions[start][1]
+    for at, fraction in fractions[start:]:
+        if (fraction >= FULL) if full else (fraction <= EMPTY):
+            return at
+        if (fraction < issued_at - 0.02) if full else (fraction > issued_at + 0.02):
+            return None
+    return None
+
+
+def _errors(
+    issued: list[tuple[int, float]], fractions: list[tuple[float, float]], full: bool
+) -> list[float]:
+    """Minutes between each forecast's predicted and actual arrival."""
+    errors = []
+    for index, seconds in issued:
+        at = fractions[index][0]
+        actual = _arrival(fractions, index, full)
+        if actual is not None:
+            errors.append(abs(at + seconds - actual) / 60)
+    return errors
+
+
+def _describe(label: str, errors: list[float], issued: int) -> str:
+    if not errors:
+        return f"{label:<22}{issued:>8} issued, none scored"
+    return (
+        f"{label:<22}{issued:>8} issued, {len(errors):>5} scored, "
+        f"median error {statistics.median(errors):6.1f} min, "
+        f"p90 {sorted(errors)[int(0.9 * (len(errors) - 1))]:6.1f} min"
+    )
+
+
+def run(trace: Trace) -> None:
+    """Replay ``trace`` and print timing and accuracy per heater."""
+    forecasts = CapacityForecasts()
+    fractions: dict[str, list[tuple[float, float]]] = {}
+    until_full: dict[str, list[tuple[int, float]]] = {}
+    until_depleted: dict[str, list[tuple[int, float]]] = {}
+    elapsed = 0.0
+    for dsn, at, properties in trace:
+        started = time.perf_counter()
+        forecasts.update(dsn, at, properties)
+        elapsed += time.perf_counter() - started
+        fraction = fill_fraction(properties)
+        forecaster = forecasts.get(dsn)
+        if fraction is None or forecaster is None:
+            continue
+        series = fractions.setdefault(dsn, [])
+        series.append((at, fraction))
+        if (seconds := forecaster.time_until_full()) is not None and seconds > 0:
+            until_full.setdefault(dsn, []).append((len(series) - 1, seconds))
+        if (seconds := forecaster.time_until_depleted()) is not None and seconds > 0:
+            until_depleted.setdefault(dsn, []).append((len(series) - 1, seconds))
+
+    print(f"{len(trace)} samples, {elapsed / max(len(trace), 1) * 1e6:.2f} us/update")
+    for dsn, series in fractions.items():
+        full, depleted = until_full.get(dsn, []), until_depleted.get(dsn, [])
+        print(dsn)
+        print(" ", _describe("time until full", _errors(full, series, True), len(full)))
+        print(
+            " ",
+            _describe(
+                "time until depleted",
+                _errors(depleted, series, False),
+                len(depleted),
+            ),
+        )
+
+
+def main(argv: list[str]) -> None:
+    """Benchmark a capture file, or the synthetic trace."""
+    trace = capture_trace(Path(argv[1])) if len(argv) > 1 else synthetic_trace()
+    run(trace)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
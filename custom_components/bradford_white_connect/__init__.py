@@ -2,24 +2,54 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+import logging
+from typing import Any
 
 from bradford_white_connect_client import BradfordWhiteConnectClient
+from bradford_white_connect_client.types import Device
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import (
     aiohttp_client,
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .archive import TelemetryArchive, write_archive
+from .capture import CaptureRecorder, CapturingSession, write_capture
+from .const import (
+    ARCHIVE_FLUSH_INTERVAL,
+    ARCHIVE_RETENTION,
+    CAPTURE_FLUSH_INTERVAL,
+    CONF_ARCHIVE,
+    CONF_CAPTURE,
+    CONF_METRICS,
+    DEFAULT_ARCHIVE,
+    DEFAULT_CAPTURE,
+    DEFAULT_METRICS,
+    DOMAIN,
+    METRICS_URL,
+    REQUEST_BURST,
+    REQUEST_RATE,
+    STORAGE_VERSION,
+)
 from .coordinator import (
     BradfordWhiteConnectEnergyCoordinator,
     BradfordWhiteConnectStatusCoordinator,
+    alarm_history_storage_key,
+    outbox_storage_key,
 )
 from .helper import get_device_property_value
+from .metrics import OpenMetricsExposition
+from .scheduler import RequestScheduler
+from .view import async_register_metrics_view
+
+_LOGGER = logging.getLogger(__name__)
 
 REMOVED_BUTTON_SUFFIXES: tuple[str, ...] = (
     "_clear_alarm_counts",
@@ -44,6 +74,8 @@ class BradfordWhiteConnectData:
     client: BradfordWhiteConnectClient
     status_coordinator: BradfordWhiteConnectStatusCoordinator
     energy_coordinator: BradfordWhiteConnectEnergyCoordinator
+    scheduler: RequestScheduler
+    capture: CaptureRecorder | None = None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -52,39 +84,169 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data[CONF_PASSWORD]
 
     session = aiohttp_client.async_get_clientsession(hass)
+    capture: CaptureRecorder | None = None
+    if entry.options.get(CONF_CAPTURE, DEFAULT_CAPTURE):
+        capture = CaptureRecorder()
+        session = CapturingSession(session, capture)
+        _async_setup_capture(hass, entry, capture)
     client = BradfordWhiteConnectClient(email, password, session)
     await client.authenticate()
 
-    status_coordinator = BradfordWhiteConnectStatusCoordinator(hass, client)
-    energy_coordinator = BradfordWhiteConnectEnergyCoordinator(hass, client)
+    # One request budget per account, shared by both coordinators and writes.
+    scheduler = RequestScheduler(REQUEST_RATE, REQUEST_BURST)
+    entry.async_on_unload(scheduler.async_shutdown)
+
+    status_coordinator = BradfordWhiteConnectStatusCoordinator(
+        hass, client, entry, scheduler
+    )
+    energy_coordinator = BradfordWhiteConnectEnergyCoordinator(
+        hass, client, entry, scheduler, status_coordinator.state
+    )
+    if entry.options.get(CONF_METRICS, DEFAULT_METRICS):
+        status_coordinator.exposition = OpenMetricsExposition()
+        async_register_metrics_view(hass)
+        _LOGGER.info(
+            "Serving OpenMetrics at %s", METRICS_URL.format(entry_id=entry.entry_id)
+        )
+    if entry.options.get(CONF_ARCHIVE, DEFAULT_ARCHIVE):
+        status_coordinator.archive = TelemetryArchive()
+        _async_setup_archive(hass, entry, status_coordinator.archive)
+    await status_coordinator.async_load_alarm_history()
+    await status_coordinator.async_load_outbox()
     await status_coordinator.async_config_entry_first_refresh()
     await energy_coordinator.async_config_entry_first_refresh()
 
     device_registry = dr.async_get(hass)
     for dsn, device in status_coordinator.data.items():
-        device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, dsn)},
-            manufacturer="Bradford White",
-            name=get_device_property_value(device, "product_name"),
-            model=get_device_property_value(device, "appliance_model_out"),
-            serial_number=get_device_property_value(
-                device, "appliance_serial_number_out"
-            ),
-            sw_version=get_device_property_value(device, "controller_sw"),
-        )
+        _async_register_device(device_registry, entry, dsn, device)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = BradfordWhiteConnectData(
-        client, status_coordinator, energy_coordinator
+        client, status_coordinator, energy_coordinator, scheduler, capture
     )
 
     _async_cleanup_removed_buttons(hass, entry)
 
+    # Registered before the platforms so that, on a refresh that discovers a
+    # heater, its device exists before the platforms add entities to it.
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(
+            _async_device_registry_syncer(hass, entry, status_coordinator)
+        )
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def capture_file_name(entry_id: str) -> str:
+    """Return the config-directory file a config entry captures into."""
+    return f"{DOMAIN}_capture_{entry_id}.jsonl.gz"
+
+
+@callback
+def _async_setup_capture(
+    hass: HomeAssistant, entry: ConfigEntry, capture: CaptureRecorder
+) -> None:
+    """Flush captured responses to disk periodically and on unload."""
+    path = hass.config.path(capture_file_name(entry.entry_id))
+    _LOGGER.warning("Capturing Bradford White Connect cloud responses to %s", path)
+
+    async def _async_flush(*_: Any) -> None:
+        if lines := capture.drain():
+            await hass.async_add_executor_job(write_capture, path, lines)
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_flush, CAPTURE_FLUSH_INTERVAL)
+    )
+    entry.async_on_unload(_async_flush)
+
+
+def archive_directory_name(entry_id: str) -> str:
+    """Return the config-directory folder a config entry archives into."""
+    return f"{DOMAIN}_archive_{entry_id}"
+
+
+@callback
+def _async_setup_archive(
+    hass: HomeAssistant, entry: ConfigEntry, archive: TelemetryArchive
+) -> None:
+    """Write archived telemetry to disk periodically and on unload."""
+    directory = hass.config.path(archive_directory_name(entry.entry_id))
+    _LOGGER.info("Archiving Bradford White Connect telemetry to %s", directory)
+
+    async def _async_flush(*_: Any) -> None:
+        if lines := archive.drain():
+            await hass.async_add_executor_job(
+                write_archive, directory, lines, ARCHIVE_RETENTION
+            )
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_flush, ARCHIVE_FLUSH_INTERVAL)
+    )
+    entry.async_on_unload(_async_flush)
+
+
+@callback
+def _async_register_device(
+    device_registry: dr.DeviceRegistry, entry: ConfigEntry, dsn: str, device: Device
+) -> None:
+    """Create (or refresh) the device-registry entry for one heater."""
+    device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, dsn)},
+        manufacturer="Bradford White",
+        name=get_device_property_value(device, "product_name"),
+        model=get_device_property_value(device, "appliance_model_out"),
+        serial_number=get_device_property_value(device, "appliance_serial_number_out"),
+        sw_version=get_device_property_value(device, "controller_sw"),
+    )
+
+
+def _async_device_registry_syncer(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: BradfordWhiteConnectStatusCoordinator,
+) -> Callable[[], None]:
+    """Build a coordinator listener that mirrors inventory changes into HA.
+
+    New DSNs get a device-registry entry before the platforms' entity
+    trackers add their entities; retired DSNs have this config entry
+    removed from their device, which also removes their entities. The
+    work only happens when ``inventory.version`` moves.
+    """
+    seen_version = coordinator.inventory.version
+
+    @callback
+    def _async_sync() -> None:
+        nonlocal seen_version
+        inventory = coordinator.inventory
+        if inventory.version == seen_version:
+            return
+        seen_version = inventory.version
+        device_registry = dr.async_get(hass)
+        change = inventory.last_change
+        for dsn in change.added:
+            if (device := coordinator.data.get(dsn)) is not None:
+                _async_register_device(device_registry, entry, dsn, device)
+        for dsn in change.retired:
+            if device_entry := device_registry.async_get_device(
+                identifiers={(DOMAIN, dsn)}
+            ):
+                device_registry.async_update_device(
+                    device_entry.id, remove_config_entry_id=entry.entry_id
+                )
+
+    return _async_sync
+
+
 def _async_cleanup_removed_buttons(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Delete entity-registry rows for buttons that were removed in 0.5.0.
 
@@ -100,9 +262,36 @@ def _async_cleanup_removed_buttons(hass: HomeAssistant, entry: ConfigEntry) -> N
             entity_reg.async_remove(entity.entity_id)
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry
+) -> bool:
+    """Allow manually deleting a heater that is no longer on the account.
+
+    The account hub device (identified by the entry ID) cannot be deleted.
+    """
+    data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
+    return not any(
+        identifier[0] == DOMAIN
+        and (
+            identifier[1] == entry.entry_id
+            or identifier[1] in data.status_coordinator.inventory
+        )
+        for identifier in device_entry.identifiers
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted alarm history and outbox when the entry is removed."""
+    for key in (
+        alarm_history_storage_key(entry.entry_id),
+        outbox_storage_key(entry.entry_id),
+    ):
+        await Store(hass, STORAGE_VERSION, key).async_remove()
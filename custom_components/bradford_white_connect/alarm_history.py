@@ -0,0 +1,234 @@
+"""Incremental alarm history for Bradford White Connect.
+
+``AlarmHistoryTracker`` diffs each alarm bitmap against the previous one
+for the same DSN to list the bits that set or cleared between polls, and
+keeps a bounded per-``(dsn, bit)`` fault log. It round-trips through
+``as_dict`` / ``from_dict`` so latched faults survive a restart.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .fault_codes import (
+    decode_alarm,
+    fault_code_for_bit,
+    fault_description_for_bit,
+)
+
+# Upper bound on fault-log rows kept across all devices. Inactive entries
+# that have not been seen for the longest time are evicted first.
+DEFAULT_MAX_LOG_ENTRIES = 200
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmTransition:
+    """A single alarm bit changing state between two polls."""
+
+    dsn: str
+    bit: int
+    tentative_code: str
+    tentative_description: str
+    active: bool
+    at: datetime
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return the payload fired on the HA event bus."""
+        return {
+            "dsn": self.dsn,
+            "bit": self.bit,
+            "tentative_code": self.tentative_code,
+            "tentative_description": self.tentative_description,
+            "state": "set" if self.active else "cleared",
+            "at": self.at.isoformat(),
+        }
+
+
+@dataclass(slots=True)
+class FaultLogEntry:
+    """Lifetime record for one alarm bit on one device."""
+
+    dsn: str
+    bit: int
+    tentative_code: str
+    first_seen: datetime
+    last_seen: datetime
+    set_count: int = 0
+    clear_count: int = 0
+    active: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for storage and diagnostics."""
+        return {
+            "dsn": self.dsn,
+            "bit": self.bit,
+            "tentative_code": self.tentative_code,
+            "first_seen": self.first_seen.isoformat(),
+            "last_seen": self.last_seen.isoformat(),
+            "set_count": self.set_count,
+            "clear_count": self.clear_count,
+            "active": self.active,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FaultLogEntry:
+        """Rebuild an entry written by ``as_dict``."""
+        return cls(
+            dsn=data["dsn"],
+            bit=int(data["bit"]),
+            tentative_code=data["tentative_code"],
+            first_seen=datetime.fromisoformat(data["first_seen"]),
+            last_seen=datetime.fromisoformat(data["last_seen"]),
+            set_count=int(data.get("set_count", 0)),
+            clear_count=int(data.get("clear_count", 0)),
+            active=bool(data.get("active", False)),
+        )
+
+
+def _bitmap_to_mask(bitmap: str | None) -> int:
+    """Fold the (cached) active bit list into an integer mask."""
+    mask = 0
+    for bit in decode_alarm(bitmap).active_bits:
+        mask |= 1 << bit
+    return mask
+
+
+def _iter_bits(mask: int):
+    """Yield the indices of the set bits in ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class AlarmHistoryTracker:
+    """Diff successive alarm bitmaps per DSN and keep a bounded fault log."""
+
+    def __init__(self, max_log_entries: int = DEFAULT_MAX_LOG_ENTRIES) -> None:
+        """Initialize an empty tracker."""
+        self._max_log_entries = max_log_entries
+        self._masks: dict[str, int] = {}
+        self._log: OrderedDict[tuple[str, int], FaultLogEntry] = OrderedDict()
+        # Set whenever anything worth persisting changed; the owner clears
+        # it after scheduling a save.
+        self.dirty = False
+
+    def update(
+        self, dsn: str, bitmap: str | None, now: datetime
+    ) -> list[AlarmTransition]:
+        """Record a new bitmap for ``dsn`` and return the bits that changed.
+
+        The first bitmap seen for a DSN only establishes the baseline:
+        bits already set are logged (so ``first_seen`` is populated) but
+        do not produce transitions, because we cannot tell whether they
+        just set or have been latched for months.
+        """
+        mask = _bitmap_to_mask(bitmap)
+        previous = self._masks.get(dsn)
+        self._masks[dsn] = mask
+        if previous != mask or mask:
+            self.dirty = True
+
+        if previous is None:
+            for bit in _iter_bits(mask):
+                entry = self._touch(dsn, bit, now)
+                entry.active = True
+            self._evict()
+            return []
+
+        transitions: list[AlarmTransition] = []
+        changed = previous ^ mask
+        for bit in _iter_bits(changed):
+            active = bool(mask & (1 << bit))
+            entry = self._touch(dsn, bit, now)
+            entry.active = active
+            if active:
+                entry.set_count += 1
+            else:
+                entry.clear_count += 1
+            transitions.append(
+                AlarmTransition(
+                    dsn=dsn,
+                    bit=bit,
+                    tentative_code=entry.tentative_code,
+                    tentative_description=fault_description_for_bit(bit),
+                    active=active,
+                    at=now,
+                )
+            )
+        # Bits that stayed set are still "seen" on this poll.
+        for bit in _iter_bits(mask & ~changed):
+            self._touch(dsn, bit, now)
+        if changed:
+            self._evict()
+        return transitions
+
+    def forget(self, dsn: str) -> None:
+        """Drop the baseline for a device that left the account."""
+        if self._masks.pop(dsn, None) is not None:
+            self.dirty = True
+
+    def log_for(self, dsn: str) -> list[FaultLogEntry]:
+        """Return the fault-log entries for one device, oldest-seen first."""
+        return [
+            entry for (entry_dsn, _), entry in self._log.items() if entry_dsn == dsn
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize the baselines and fault log for storage/diagnostics."""
+        return {
+            "masks": {dsn: format(mask, "x") for dsn, mask in self._masks.items()},
+            "log": [entry.as_dict() for entry in self._log.values()],
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any] | None,
+        max_log_entries: int = DEFAULT_MAX_LOG_ENTRIES,
+    ) -> AlarmHistoryTracker:
+        """Rebuild a tracker from ``as_dict`` output; tolerate missing data."""
+        tracker = cls(max_log_entries)
+        if not data:
+            return tracker
+        for dsn, mask in (data.get("masks") or {}).items():
+            tracker._masks[dsn] = int(mask, 16)
+        for raw in data.get("log") or []:
+            entry = FaultLogEntry.from_dict(raw)
+            tracker._log[(entry.dsn, entry.bit)] = entry
+        tracker._evict()
+        return tracker
+
+    def _touch(self, dsn: str, bit: int, now: datetime) -> FaultLogEntry:
+        key = (dsn, bit)
+        entry = self._log.get(key)
+        if entry is None:
+            entry = FaultLogEntry(
+                dsn=dsn,
+                bit=bit,
+                tentative_code=fault_code_for_bit(bit),
+                first_seen=now,
+                last_seen=now,
+            )
+            self._log[key] = entry
+        else:
+            entry.last_seen = now
+            self._log.move_to_end(key)
+        return entry
+
+    def _evict(self) -> None:
+        """Trim the log, preferring to drop inactive least-recently-seen rows."""
+        overflow = len(self._log) - self._max_log_entries
+        if overflow <= 0:
+            return
+        for key in [key for key, entry in self._log.items() if not entry.active]:
+            if overflow <= 0:
+                return
+            del self._log[key]
+            overflow -= 1
+        while overflow > 0:
+            self._log.popitem(last=False)
+            overflow -= 1
@@ -0,0 +1,187 @@
+"""Fleet-wide anomaly detection for Bradford White Connect heat pumps.
+
+``FleetAnomalyDetector`` scores each heater's readings against the rest
+of the account with a robust z-score (median and scaled MAD per
+property) and reports when a heater starts or stops standing out.
+Properties with fewer than ``min_fleet`` readings are skipped.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass
+import math
+import statistics
+from typing import Any
+
+# Compared properties, with the smallest scale (in the property's unit)
+# a deviation is measured against.
+ANOMALY_PROPERTIES: dict[str, float] = {
+    "superheat_evap": 1.0,
+    "comp_discharge_temp": 2.0,
+    "evap_inlet_temp": 1.0,
+    "evap_outlet_temp": 1.0,
+    "hp_current": 0.2,
+    "eev_pos": 5.0,
+}
+
+# Robust z-score at which a heater is reported as anomalous...
+DEFAULT_THRESHOLD = 3.5
+
+# ...and the fraction of it the score must fall below to clear.
+CLEAR_RATIO = 0.75
+
+# Heaters reporting a property before it is compared across the fleet.
+MIN_FLEET = 5
+
+# Scale factors that make the MAD / mean absolute deviation estimate the
+# standard deviation of normally distributed readings.
+_MAD_TO_SIGMA = 1.4826
+_MEAN_AD_TO_SIGMA = 1.2533
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceAnomaly:
+    """One heater's standing against the fleet after a refresh."""
+
+    score: float
+    property: str | None
+    scores: dict[str, float]
+    anomalous: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "score": round(self.score, 2),
+            "property": self.property,
+            "scores": {name: round(z, 2) for name, z in self.scores.items()},
+            "anomalous": self.anomalous,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AnomalyTransition:
+    """A heater starting or ceasing to stand out from the fleet."""
+
+    dsn: str
+    property: str | None
+    value: float | None
+    score: float
+    active: bool
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return the payload fired on the HA event bus."""
+        return {
+            "dsn": self.dsn,
+            "property": self.property,
+            "value": self.value,
+            "score": round(self.score, 2),
+            "state": "detected" if self.active else "cleared",
+        }
+
+
+def _reading(prop: Any) -> float:
+    try:
+        value = float(prop.value)
+    except (AttributeError, TypeError, ValueError):
+        return math.nan
+    return value if math.isfinite(value) else math.nan
+
+
+def robust_center(column: array, floor: float) -> tuple[float, float] | None:
+    """Return ``(median, scale)`` of the finite readings, or None if too few."""
+    values = [value for value in column if value == value]
+    if len(values) < 2:
+        return None
+    median = statistics.median(values)
+    deviations = [abs(value - median) for value in values]
+    scale = statistics.median(deviations) * _MAD_TO_SIGMA
+    if scale == 0:
+        scale = statistics.fmean(deviations) * _MEAN_AD_TO_SIGMA
+    return median, max(scale, floor)
+
+
+class FleetAnomalyDetector:
+    """Score every heater's readings against the rest of the account."""
+
+    def __init__(
+        self,
+        properties: Mapping[str, float] | None = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_fleet: int = MIN_FLEET,
+    ) -> None:
+        """Initialize with no results."""
+        self.properties = dict(ANOMALY_PROPERTIES if properties is None else properties)
+        self._threshold = threshold
+        self._min_fleet = min_fleet
+        self.results: dict[str, DeviceAnomaly] = {}
+        self.runs = 0
+        self.compared: list[str] = []
+
+    def analyze(self, devices: Mapping[str, Any]) -> list[AnomalyTransition]:
+        """Score ``{dsn: Device}`` and return the heaters whose state changed."""
+        dsns = list(devices)
+        property_maps = [
+            getattr(devices[dsn], "properties", None) or {} for dsn in dsns
+        ]
+        scores: list[dict[str, float]] = [{} for _ in dsns]
+        readings: list[dict[str, float]] = [{} for _ in dsns]
+        self.compared = []
+        for name, floor in self.properties.items():
+            column = array(
+                "d", (_reading(properties.get(name)) for properties in property_maps)
+            )
+            if sum(1 for value in column if value == value) < self._min_fleet:
+                continue
+            center = robust_center(column, floor)
+            if center is None:
+                continue
+            self.compared.append(name)
+            median, scale = center
+            for index, value in enumerate(column):
+                if value == value:
+                    scores[index][name] = (value - median) / scale
+                    readings[index][name] = value
+
+        transitions: list[AnomalyTransition] = []
+        results: dict[str, DeviceAnomaly] = {}
+        for index, dsn in enumerate(dsns):
+            device_scores = scores[index]
+            top = max(
+                device_scores, key=lambda name: abs(device_scores[name]), default=None
+            )
+            score = 0.0 if top is None else abs(device_scores[top])
+            previous = self.results.get(dsn)
+            was_anomalous = previous is not None and previous.anomalous
+            anomalous = score >= self._threshold or (
+                was_anomalous and score >= self._threshold * CLEAR_RATIO
+            )
+            results[dsn] = DeviceAnomaly(score, top, device_scores, anomalous)
+            if anomalous != was_anomalous:
+                flagged = top if anomalous else previous.property  # type: ignore[union-attr]
+                transitions.append(
+                    AnomalyTransition(
+                        dsn,
+                        flagged,
+                        readings[index].get(flagged) if flagged else None,
+                        score,
+                        anomalous,
+                    )
+                )
+        self.results = results
+        self.runs += 1
+        return transitions
+
+    def get(self, dsn: str) -> DeviceAnomaly | None:
+        """Return the latest result for a heater."""
+        return self.results.get(dsn)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "runs": self.runs,
+            "compared": self.compared,
+            "anomalous": sum(result.anomalous for result in self.results.values()),
+            "devices": {dsn: result.as_dict() for dsn, result in self.results.items()},
+        }
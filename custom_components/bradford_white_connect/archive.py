@@ -0,0 +1,210 @@
+"""Append-only local archive of raw Bradford White Connect telemetry.
+
+``TelemetryArchive`` turns each refresh into compact JSON lines holding
+only the property values that changed; ``write_archive`` appends them to
+one gzip file per UTC day and prunes old days. ``load_device_history``
+reads a heater's change points back into ``array`` columns.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+import gzip
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+from .metrics import numeric_value
+
+# Bound on lines waiting to be written, should writing fall behind.
+DEFAULT_MAX_PENDING = 50_000
+
+_FILE_PREFIX = "telemetry-"
+_FILE_SUFFIX = ".jsonl.gz"
+
+
+def _day(timestamp: float) -> date:
+    return datetime.fromtimestamp(timestamp, UTC).date()
+
+
+def archive_file(directory: str | Path, day: date) -> Path:
+    """Return the file a UTC day's lines are appended to."""
+    return Path(directory) / f"{_FILE_PREFIX}{day.isoformat()}{_FILE_SUFFIX}"
+
+
+def _file_day(path: Path) -> date | None:
+    name = path.name
+    if not (name.startswith(_FILE_PREFIX) and name.endswith(_FILE_SUFFIX)):
+        return None
+    try:
+        return date.fromisoformat(name[len(_FILE_PREFIX) : -len(_FILE_SUFFIX)])
+    except ValueError:
+        return None
+
+
+def _archived_value(prop: Any) -> Any:
+    """Return a property's value, with numeric strings stored as numbers."""
+    value = prop.value
+    if isinstance(value, str) and (number := numeric_value(prop)) is not None:
+        return number
+    return value
+
+
+class TelemetryArchive:
+    """Turn successive snapshots into buffered change lines."""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        """Initialize with nothing recorded yet."""
+        # DSN -> {name: Property} as last recorded.
+        self._last: dict[str, dict[str, Any]] = {}
+        self._pending: deque[tuple[float, str]] = deque(maxlen=max_pending)
+        self.recorded = 0
+        self.dropped = 0
+
+    def record(self, devices: Mapping[str, Any], dsns: Iterable[str], at: float) -> int:
+        """Buffer the changed properties of ``dsns``; returns the lines added.
+
+        ``at`` is a Unix timestamp. DSNs missing from ``devices`` are
+        skipped.
+        """
+        added = 0
+        for dsn in dsns:
+            if (device := devices.get(dsn)) is None:
+                continue
+            last = self._last.setdefault(dsn, {})
+            changes: dict[str, Any] = {}
+            for name, prop in (device.properties or {}).items():
+                old = last.get(name)
+                # Unchanged properties are shared between snapshots.
+                if old is prop:
+                    continue
+                last[name] = prop
+                if old is None or old.value != prop.value:
+                    changes[name] = _archived_value(prop)
+            if not changes:
+                continue
+            line = json.dumps(
+                {"t": round(at, 3), "d": dsn, "p": changes},
+                separators=(",", ":"),
+                default=str,
+            )
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append((at, line))
+            added += 1
+        self.recorded += added
+        return added
+
+    def forget(self, dsn: str) -> None:
+        """Drop a retired heater; if it rejoins it starts a new baseline."""
+        self._last.pop(dsn, None)
+
+    def drain(self) -> list[tuple[float, str]]:
+        """Return and clear the ``(timestamp, line)`` pairs waiting to be written."""
+        lines = list(self._pending)
+        self._pending.clear()
+        return lines
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize archive progress for diagnostics."""
+        return {
+            "recorded": self.recorded,
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "devices": len(self._last),
+        }
+
+
+def write_archive(
+    directory: str | Path,
+    lines: Iterable[tuple[float, str]],
+    retention: timedelta | None = None,
+) -> None:
+    """Append drained lines to their day's file and prune old days (blocking)."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    by_day: dict[date, list[str]] = {}
+    for at, line in lines:
+        by_day.setdefault(_day(at), []).append(line)
+    for day, day_lines in by_day.items():
+        with gzip.open(archive_file(directory, day), "at", encoding="utf-8") as file:
+            file.write("\n".join(day_lines) + "\n")
+    if retention is not None and by_day:
+        oldest = max(by_day) - retention
+        for path in directory.iterdir():
+            if (day := _file_day(path)) is not None and day < oldest:
+                path.unlink()
+
+
+@dataclass(slots=True)
+class PropertyHistory:
+    """Change points of one property: parallel timestamp and value columns.
+
+    ``values`` holds the numeric reading, or NaN where the value was not
+    a number (strings included - numeric properties were stored as
+    numbers); ``raw`` keeps those non-numeric values by index.
+    """
+
+    times: array = field(default_factory=lambda: array("d"))
+    values: array = field(default_factory=lambda: array("d"))
+    raw: dict[int, Any] = field(default_factory=dict)
+
+    def append(self, at: float, value: Any) -> None:
+        """Add one change point."""
+        if isinstance(value, bool | int | float):
+            self.values.append(float(value))
+        else:
+            self.raw[len(self.values)] = value
+            self.values.append(math.nan)
+        self.times.append(at)
+
+    def __len__(self) -> int:
+        """Return the number of change points."""
+        return len(self.times)
+
+
+def load_device_history(
+    directory: str | Path,
+    dsn: str,
+    names: Iterable[str] | None = None,
+    start: float | None = None,
+    end: float | None = None,
+) -> dict[str, PropertyHistory]:
+    """Read one heater's archived change points (blocking).
+
+    ``names`` narrows the properties returned; ``start`` and ``end`` are
+    Unix timestamps bounding the change points (inclusive). Days outside
+    the window are not opened.
+    """
+    wanted = None if names is None else set(names)
+    first = None if start is None else _day(start)
+    last = None if end is None else _day(end)
+    # Lines for other heaters are skipped before being decoded.
+    marker = json.dumps({"d": dsn}, separators=(",", ":"))[1:-1]
+    history: dict[str, PropertyHistory] = {}
+    directory = Path(directory)
+    if not directory.is_dir():
+        return history
+    for path in sorted(directory.iterdir()):
+        day = _file_day(path)
+        if day is None or (first and day < first) or (last and day > last):
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if marker not in line:
+                    continue
+                record = json.loads(line)
+                at = record["t"]
+                if record["d"] != dsn or (start is not None and at < start):
+                    continue
+                if end is not None and at > end:
+                    continue
+                for name, value in record["p"].items():
+                    if wanted is None or name in wanted:
+                        history.setdefault(name, PropertyHistory()).append(at, value)
+    return history
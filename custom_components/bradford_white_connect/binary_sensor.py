@@ -13,12 +13,17 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BradfordWhiteConnectData
+from .capabilities import DeviceCapabilities
 from .const import DOMAIN
-from .entity import BradfordWhiteConnectDescribedStatusEntity
+from .entity import (
+    BradfordWhiteConnectDescribedStatusEntity,
+    async_add_status_entities,
+    described_entity_factory,
+)
 from .helper import get_device_property_value, has_property
 
 
@@ -38,7 +43,7 @@ class BWBinarySensorDescription(BinarySensorEntityDescription):
     """Describes a BW property exposed as a binary sensor."""
 
     value_fn: Callable[[Device], bool | None]
-    supported_fn: Callable[[Device], bool] = lambda device: True
+    supported_fn: Callable[[DeviceCapabilities], bool] = lambda capabilities: True
 
 
 PROPERTY_BINARY_SENSORS: tuple[BWBinarySensorDescription, ...] = (
@@ -97,15 +102,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bradford White Connect binary_sensor platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
-    entities = [
-        BradfordWhiteConnectPropertyBinarySensor(
-            data.status_coordinator, dsn, device, desc
-        )
-        for dsn, device in data.status_coordinator.data.items()
-        for desc in PROPERTY_BINARY_SENSORS
-        if desc.supported_fn(device)
-    ]
-    async_add_entities(entities)
+    async_add_status_entities(
+        entry,
+        data.status_coordinator,
+        async_add_entities,
+        described_entity_factory(
+            data.status_coordinator,
+            BradfordWhiteConnectPropertyBinarySensor,
+            PROPERTY_BINARY_SENSORS,
+        ),
+    )
 
 
 class BradfordWhiteConnectPropertyBinarySensor(
@@ -115,7 +121,7 @@ class BradfordWhiteConnectPropertyBinarySensor(
 
     entity_description: BWBinarySensorDescription
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if the underlying property reports an active state."""
-        return self.entity_description.value_fn(self.device)
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache whether the underlying property reports an active state."""
+        self._attr_is_on = self.entity_description.value_fn(self.device)
@@ -20,7 +20,6 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from bradford_white_connect_client.types import Device
 from homeassistant.components.button import (
     ButtonDeviceClass,
     ButtonEntity,
@@ -32,8 +31,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BradfordWhiteConnectData
+from .capabilities import DeviceCapabilities
 from .const import DOMAIN
-from .entity import BradfordWhiteConnectDescribedStatusEntity
+from .entity import (
+    BradfordWhiteConnectDescribedStatusEntity,
+    async_add_status_entities,
+    described_entity_factory,
+)
 from .helper import has_property
 
 
@@ -42,7 +46,7 @@ class BWButtonDescription(ButtonEntityDescription):
     """Describes a one-shot write button."""
 
     property_name: str
-    supported_fn: Callable[[Device], bool] = lambda device: True
+    supported_fn: Callable[[DeviceCapabilities], bool] = lambda capabilities: True
 
 
 BUTTONS: tuple[BWButtonDescription, ...] = (
@@ -72,11 +76,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bradford White Connect button platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        BradfordWhiteConnectButton(data.status_coordinator, dsn, device, desc)
-        for dsn, device in data.status_coordinator.data.items()
-        for desc in BUTTONS
-        if desc.supported_fn(device)
+    async_add_status_entities(
+        entry,
+        data.status_coordinator,
+        async_add_entities,
+        described_entity_factory(
+            data.status_coordinator, BradfordWhiteConnectButton, BUTTONS
+        ),
     )
 
 
@@ -90,5 +96,8 @@ class BradfordWhiteConnectButton(
     async def async_press(self) -> None:
         """Send the underlying datapoint write."""
         await self.coordinator.async_set_property(
-            self.device, self.entity_description.property_name, True
+            self.device,
+            self.entity_description.property_name,
+            True,
+            idempotent=False,
         )
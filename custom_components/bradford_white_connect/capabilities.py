@@ -0,0 +1,192 @@
+"""Per-appliance capability registry for Bradford White Connect.
+
+``CapabilityRegistry`` derives each heater's ``ModelCapabilities`` from
+its appliance model and controller software and recomputes them only
+when those change. ``CapabilityIndex`` records, after every refresh, the
+properties each DSN reports; its ``version`` moves only when that set
+changes, which drives adding entities without a reload.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from bradford_white_connect_client.constants import BradfordWhiteConnectHeatingModes
+from bradford_white_connect_client.helper import BradfordWhiteConnectHelper
+
+# Properties whose value feeds the capability cache key.
+MODEL_PROPERTY = "appliance_model_out"
+PERSONALITY_PROPERTY = "controller_sw"
+
+
+@dataclass(frozen=True, slots=True)
+class ModelCapabilities:
+    """What a given appliance model supports.
+
+    ``heating_modes`` is empty when the model is unknown or unreported;
+    callers decide what default to fall back to in that case.
+    """
+
+    appliance_model: str | None
+    heating_modes: tuple[int, ...]
+
+    @property
+    def known(self) -> bool:
+        """Return True when the model reported a usable mode list."""
+        return bool(self.heating_modes)
+
+    def supports_mode(self, mode: int) -> bool:
+        """Return True if the model accepts ``mode`` (or is unknown)."""
+        return not self.heating_modes or mode in self.heating_modes
+
+    @property
+    def has_heat_pump(self) -> bool:
+        """Return True if the model can run its compressor (or is unknown)."""
+        return self.supports_mode(BradfordWhiteConnectHeatingModes.HEAT_PUMP)
+
+
+UNKNOWN_MODEL = ModelCapabilities(appliance_model=None, heating_modes=())
+
+
+@lru_cache(maxsize=32)
+def model_capabilities(appliance_model: str | None) -> ModelCapabilities:
+    """Derive (and share) the capabilities for a stripped model string."""
+    if not appliance_model:
+        return UNKNOWN_MODEL
+    return ModelCapabilities(
+        appliance_model=appliance_model,
+        heating_modes=tuple(
+            BradfordWhiteConnectHelper.get_appliance_model_heating_modes(
+                appliance_model
+            )
+        ),
+    )
+
+
+def _normalize(value: Any) -> str | None:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+class CapabilityRegistry:
+    """Cache ``ModelCapabilities`` per DSN, keyed by model + personality."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._entries: dict[
+            str, tuple[tuple[str | None, str | None], ModelCapabilities]
+        ] = {}
+
+    def update(
+        self, dsn: str, appliance_model: Any, personality: Any = None
+    ) -> ModelCapabilities:
+        """Record the latest model/personality for ``dsn`` and return its capabilities.
+
+        Returns the previously computed instance untouched when neither
+        input changed, so callers can compare capabilities by identity.
+        """
+        key = (_normalize(appliance_model), _normalize(personality))
+        cached = self._entries.get(dsn)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        capabilities = model_capabilities(key[0])
+        self._entries[dsn] = (key, capabilities)
+        return capabilities
+
+    def get(self, dsn: str) -> ModelCapabilities:
+        """Return the cached capabilities for ``dsn``, or ``UNKNOWN_MODEL``."""
+        cached = self._entries.get(dsn)
+        return UNKNOWN_MODEL if cached is None else cached[1]
+
+    def forget(self, dsn: str) -> None:
+        """Drop the cache entry for a device that left the account."""
+        self._entries.pop(dsn, None)
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceCapabilities:
+    """Everything entity setup needs to know about one device."""
+
+    dsn: str
+    property_names: frozenset[str]
+    model: ModelCapabilities
+    has_connection_status: bool = False
+
+
+class CapabilityIndex(Mapping[str, DeviceCapabilities]):
+    """Per-DSN ``DeviceCapabilities`` rebuilt in one pass after each refresh.
+
+    Unchanged devices keep their previous ``DeviceCapabilities`` object,
+    so consumers can detect per-device changes by identity and the index
+    as a whole by ``version``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.models = CapabilityRegistry()
+        self.version = 0
+        self._devices: dict[str, DeviceCapabilities] = {}
+
+    def __getitem__(self, dsn: str) -> DeviceCapabilities:
+        """Return the capabilities for ``dsn``."""
+        return self._devices[dsn]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the indexed DSNs."""
+        return iter(self._devices)
+
+    def __len__(self) -> int:
+        """Return the number of indexed devices."""
+        return len(self._devices)
+
+    def model(self, dsn: str) -> ModelCapabilities:
+        """Shortcut to the cached model capabilities for ``dsn``."""
+        return self.models.get(dsn)
+
+    def rebuild(self, devices: Mapping[str, Any]) -> bool:
+        """Re-index ``{dsn: device}``; return True if anything changed."""
+        previous = self._devices
+        index: dict[str, DeviceCapabilities] = {}
+        changed = previous.keys() != devices.keys()
+        for dsn, device in devices.items():
+            properties = getattr(device, "properties", None) or {}
+            model = self.models.update(
+                dsn,
+                _property_value(properties, MODEL_PROPERTY),
+                _property_value(properties, PERSONALITY_PROPERTY),
+            )
+            has_connection_status = (
+                getattr(device, "connection_status", None) is not None
+            )
+            old = previous.get(dsn)
+            if (
+                old is not None
+                and old.model is model
+                and old.has_connection_status == has_connection_status
+                and old.property_names == properties.keys()
+            ):
+                index[dsn] = old
+                continue
+            index[dsn] = DeviceCapabilities(
+                dsn=dsn,
+                property_names=frozenset(properties),
+                model=model,
+                has_connection_status=has_connection_status,
+            )
+            changed = True
+        for dsn in previous.keys() - devices.keys():
+            self.models.forget(dsn)
+        self._devices = index
+        if changed:
+            self.version += 1
+        return changed
+
+
+def _property_value(properties: Mapping[str, Any], name: str) -> Any:
+    prop = properties.get(name)
+    return None if prop is None else getattr(prop, "value", None)
@@ -0,0 +1,321 @@
+"""Record-and-replay capture of Bradford White Connect cloud traffic.
+
+With capture mode enabled, ``CapturingSession`` hands every cloud
+exchange to a ``CaptureRecorder``, which redacts it (secrets, location,
+names, and DSNs swapped for stable pseudonyms) and keeps it as one JSON
+line. ``write_capture`` and ``load_capture`` store and read the lines;
+``ReplayIndex`` serves them back for the ``replay`` session.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Mapping
+import gzip
+import json
+from pathlib import Path
+import re
+import time
+from typing import Any
+
+REDACTED = "**REDACTED**"
+
+# Body keys whose values are secrets or locate the installation.
+_REDACT_KEYS = frozenset(
+    {
+        "access_token",
+        "refresh_token",
+        "email",
+        "password",
+        "mac",
+        "unique_hardware_id",
+        "lan_ip",
+        "ip",
+        "lat",
+        "lng",
+        "locality",
+        "ssid",
+    }
+)
+
+# Properties whose *values* identify the heater or its owner.
+_REDACT_PROPERTIES = frozenset(
+    {
+        "appliance_serial_number_out",
+        "heater_name",
+        "wifi_ssid",
+    }
+)
+
+# Cache validators worth keeping so conditional requests replay faithfully.
+_KEPT_HEADERS = ("ETag", "Last-Modified")
+
+# Query parameters that pin a request to a time window; they are ignored
+# when matching, so a capture replays on any day.
+_WINDOW_PARAM = re.compile(r"^filter\[created_at_")
+
+# Bound on records waiting to be flushed, should writing fall behind.
+DEFAULT_MAX_PENDING = 5000
+
+Params = list[tuple[str, str]]
+
+
+def _normalize_params(params: Any) -> Params:
+    if not params:
+        return []
+    items = params.items() if isinstance(params, Mapping) else params
+    return [(str(key), str(value)) for key, value in items]
+
+
+def request_key(method: str, url: str, params: Any) -> tuple[str, str, tuple]:
+    """Return the key a request is matched on during replay."""
+    return (
+        method.upper(),
+        url,
+        tuple(
+            sorted(
+                (key, value)
+                for key, value in _normalize_params(params)
+                if not _WINDOW_PARAM.match(key)
+            )
+        ),
+    )
+
+
+class CaptureRecorder:
+    """Redact exchanges and buffer them as compact JSON lines."""
+
+    def __init__(
+        self,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty capture starting now."""
+        self.clock = clock
+        self._started = clock()
+        self._pending: deque[str] = deque(maxlen=max_pending)
+        self._pseudonyms: dict[str, str] = {}
+        self.recorded = 0
+        self.dropped = 0
+
+    def pseudonym(self, dsn: str) -> str:
+        """Return the stable stand-in for a DSN."""
+        if (alias := self._pseudonyms.get(dsn)) is None:
+            alias = self._pseudonyms[dsn] = f"dsn-{len(self._pseudonyms) + 1}"
+        return alias
+
+    def _redact(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._redact(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        redacted: dict[str, Any] = {}
+        for key, item in value.items():
+            if key in _REDACT_KEYS:
+                redacted[key] = REDACTED
+            elif key == "dsn" and isinstance(item, str):
+                redacted[key] = self.pseudonym(item)
+            else:
+                redacted[key] = self._redact(item)
+        if value.get("name") in _REDACT_PROPERTIES and "value" in value:
+            redacted["value"] = REDACTED
+        return redacted
+
+    def _substitute(self, text: str) -> str:
+        for dsn, alias in self._pseudonyms.items():
+            text = text.replace(dsn, alias)
+        return text
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        status: int,
+        headers: Mapping[str, str] | None,
+        body: Any,
+        started: float,
+    ) -> None:
+        """Add one redacted exchange; ``started`` is from ``clock``."""
+        now = self.clock()
+        # Redact the body first so DSNs it introduces are known for the URL.
+        body = self._redact(body)
+        entry = {
+            "t": round(started - self._started, 3),
+            "ms": round((now - started) * 1000, 1),
+            "method": method.upper(),
+            "url": self._substitute(url),
+            "params": [
+                [key, self._substitute(value)]
+                for key, value in _normalize_params(params)
+            ],
+            "status": status,
+            "headers": {
+                name: headers[name]
+                for name in _KEPT_HEADERS
+                if headers is not None and name in headers
+            },
+            "body": body,
+        }
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(json.dumps(entry, separators=(",", ":")))
+        self.recorded += 1
+
+    def drain(self) -> list[str]:
+        """Return and clear the records waiting to be written."""
+        lines = list(self._pending)
+        self._pending.clear()
+        return lines
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize capture progress for diagnostics."""
+        return {
+            "recorded": self.recorded,
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "devices": len(self._pseudonyms),
+        }
+
+
+def write_capture(path: str | Path, lines: Iterable[str]) -> None:
+    """Append records to a capture file as one more gzip member (blocking)."""
+    with gzip.open(path, "at", encoding="utf-8") as file:
+        for line in lines:
+            file.write(line + "\n")
+
+
+def load_capture(path: str | Path) -> list[dict[str, Any]]:
+    """Read every record of a capture file (blocking)."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def _decode(raw: bytes) -> Any:
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw.decode("utf-8", "replace")
+
+
+class _CapturedResponse:
+    """Proxy a response, keeping whatever body the caller reads."""
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.body: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    async def read(self) -> bytes:
+        raw = await self._response.read()
+        self.body = _decode(raw)
+        return raw
+
+    async def json(self, **kwargs: Any) -> Any:
+        self.body = await self._response.json(**kwargs)
+        return self.body
+
+
+class _CapturedRequest:
+    """Async context manager recording one exchange when it closes."""
+
+    def __init__(
+        self,
+        recorder: CaptureRecorder,
+        method: str,
+        url: str,
+        params: Any,
+        request: Any,
+    ) -> None:
+        self._recorder = recorder
+        self._method = method
+        self._url = url
+        self._params = params
+        self._request = request
+        self._response: _CapturedResponse | None = None
+        self._started = 0.0
+
+    async def __aenter__(self) -> _CapturedResponse:
+        self._started = self._recorder.clock()
+        self._response = _CapturedResponse(await self._request.__aenter__())
+        return self._response
+
+    async def __aexit__(self, *exc_info: Any) -> Any:
+        response = self._response
+        if response is not None:
+            self._recorder.record(
+                self._method,
+                self._url,
+                self._params,
+                response.status,
+                response.headers,
+                response.body,
+                self._started,
+            )
+        return await self._request.__aexit__(*exc_info)
+
+
+class CapturingSession:
+    """Wrap an HTTP session so every GET and POST is recorded.
+
+    Only ``get`` and ``post`` are intercepted, which is all the upstream
+    client and the coordinators use; everything else passes through.
+    Request headers and bodies are never recorded.
+    """
+
+    def __init__(self, session: Any, recorder: CaptureRecorder) -> None:
+        """Wrap ``session``, sending exchanges to ``recorder``."""
+        self._session = session
+        self.recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything that is not captured."""
+        return getattr(self._session, name)
+
+    def get(self, url: str, *, params: Any = None, **kwargs: Any) -> Any:
+        """Issue (and record) a GET request."""
+        return _CapturedRequest(
+            self.recorder,
+            "GET",
+            url,
+            params,
+            self._session.get(url, params=params, **kwargs),
+        )
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        """Issue (and record) a POST request."""
+        return _CapturedRequest(
+            self.recorder,
+            "POST",
+            url,
+            kwargs.get("params"),
+            self._session.post(url, **kwargs),
+        )
+
+
+class ReplayIndex:
+    """Recorded responses per request, served back in capture order.
+
+    Once a request's recorded responses are used up, its last response
+    keeps being served, so a short capture can drive a long benchmark.
+    """
+
+    def __init__(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Index capture records by their request key."""
+        self._queues: dict[tuple, deque[Mapping[str, Any]]] = defaultdict(deque)
+        for record in records:
+            key = request_key(record["method"], record["url"], record["params"])
+            self._queues[key].append(record)
+        self.served = 0
+        self.misses = 0
+
+    def next(self, method: str, url: str, params: Any) -> Mapping[str, Any] | None:
+        """Return the next recorded response, or None if never captured."""
+        queue = self._queues.get(request_key(method, url, params))
+        if not queue:
+            self.misses += 1
+            return None
+        self.served += 1
+        return queue.popleft() if len(queue) > 1 else queue[0]
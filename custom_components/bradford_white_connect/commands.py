@@ -0,0 +1,180 @@
+"""Ordered per-device command lanes for Bradford White Connect writes.
+
+``CommandLanes`` gives each DSN a FIFO lane so writes to one heater reach
+the cloud in the order they were issued. A write is suppressed when the
+polled value already matches it and no unconfirmed write to a different
+value is in flight, unless the command is not idempotent; per-command
+counters feed diagnostics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+import time
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+# How long an unconfirmed write keeps a matching cached value from
+# suppressing the next write.
+DEFAULT_PENDING_TTL = 300.0
+
+
+@dataclass(frozen=True, slots=True)
+class Command:
+    """One write to a heater.
+
+    ``name`` labels the command in metrics; ``state_property`` is the
+    property that reflects the written value once the cloud applies it.
+    """
+
+    dsn: str
+    name: str
+    value: Any
+    state_property: str
+    idempotent: bool = True
+
+
+@dataclass(slots=True)
+class CommandStats:
+    """Counters and latencies for one command name."""
+
+    sent: int = 0
+    suppressed: int = 0
+    failed: int = 0
+    wait_ms_max: float = 0.0
+    send_ms_total: float = 0.0
+    send_ms_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        attempts = self.sent + self.failed
+        return {
+            "sent": self.sent,
+            "suppressed": self.suppressed,
+            "failed": self.failed,
+            "wait_ms_max": round(self.wait_ms_max, 1),
+            "send_ms_mean": round(self.send_ms_total / attempts, 1) if attempts else 0,
+            "send_ms_max": round(self.send_ms_max, 1),
+        }
+
+
+def same_value(current: Any, value: Any) -> bool:
+    """Compare a cached property value with a value about to be written.
+
+    Ayla reports numbers and booleans loosely (``"120"``, ``1``), so
+    numeric-looking values are compared as numbers.
+    """
+    if current is None:
+        return False
+    try:
+        return float(current) == float(value)
+    except (TypeError, ValueError):
+        return str(current) == str(value)
+
+
+class CommandLanes:
+    """Serialize writes per DSN and suppress writes that change nothing."""
+
+    def __init__(
+        self,
+        pending_ttl: float = DEFAULT_PENDING_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with no lanes; they are created on first use."""
+        self._pending_ttl = pending_ttl
+        self._clock = clock
+        self._lanes: dict[str, asyncio.Lock] = {}
+        # (dsn, state_property) -> (value written, when)
+        self._pending: dict[tuple[str, str], tuple[Any, float]] = {}
+        self._stats: dict[str, CommandStats] = {}
+
+    def _redundant(self, command: Command, current: Any) -> bool:
+        """Return whether the heater is known to hold the command's value.
+
+        The polled value has to match: a write the cloud never applied
+        does not count. An unconfirmed write to another value means the
+        polled value is about to change, so it does not count either.
+        """
+        if not same_value(current, command.value):
+            return False
+        pending = self._pending.get((command.dsn, command.state_property))
+        return (
+            pending is None
+            or self._clock() - pending[1] >= self._pending_ttl
+            or same_value(pending[0], command.value)
+        )
+
+    async def run(
+        self,
+        command: Command,
+        current: Callable[[], Any],
+        send: Callable[[], Awaitable[_T]],
+        wanted: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Send ``command`` in its device's lane; return False if suppressed.
+
+        ``current`` is called inside the lane, after every earlier write
+        to the device has finished, to read the cached property value.
+        ``wanted``, if given, is checked there too; the command is
+        suppressed when it returns False.
+        """
+        stats = self._stats.setdefault(command.name, CommandStats())
+        lane = self._lanes.setdefault(command.dsn, asyncio.Lock())
+        queued = self._clock()
+        async with lane:
+            started = self._clock()
+            stats.wait_ms_max = max(stats.wait_ms_max, (started - queued) * 1000)
+            if (wanted is not None and not wanted()) or (
+                command.idempotent and self._redundant(command, current())
+            ):
+                stats.suppressed += 1
+                return False
+            try:
+                await send()
+            except Exception:
+                stats.failed += 1
+                raise
+            finally:
+                elapsed_ms = (self._clock() - started) * 1000
+                stats.send_ms_total += elapsed_ms
+                stats.send_ms_max = max(stats.send_ms_max, elapsed_ms)
+            stats.sent += 1
+            self._pending[(command.dsn, command.state_property)] = (
+                command.value,
+                self._clock(),
+            )
+            return True
+
+    def reconcile(self, dsn: str, properties: Mapping[str, Any]) -> None:
+        """Drop unconfirmed writes the latest ``{name: Property}`` poll confirms.
+
+        Writes older than the pending TTL are dropped too; from then on
+        the cached value is trusted again.
+        """
+        now = self._clock()
+        for key in [key for key in self._pending if key[0] == dsn]:
+            value, written_at = self._pending[key]
+            prop = properties.get(key[1])
+            if now - written_at >= self._pending_ttl or (
+                prop is not None and same_value(prop.value, value)
+            ):
+                del self._pending[key]
+
+    def forget(self, dsn: str) -> None:
+        """Drop state for a device that left the account."""
+        lane = self._lanes.get(dsn)
+        if lane is not None and not lane.locked():
+            del self._lanes[dsn]
+        for key in [key for key in self._pending if key[0] == dsn]:
+            del self._pending[key]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize lane state and per-command metrics for diagnostics."""
+        return {
+            "busy_lanes": sum(lane.locked() for lane in self._lanes.values()),
+            "unconfirmed": len(self._pending),
+            "commands": {name: stats.as_dict() for name, stats in self._stats.items()},
+        }
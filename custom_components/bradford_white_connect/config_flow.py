@@ -12,11 +12,22 @@ from bradford_white_connect_client import (
 )
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import aiohttp_client
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CONF_ARCHIVE,
+    CONF_CAPTURE,
+    CONF_METRICS,
+    CONF_RECORDER_EFFICIENCY,
+    DEFAULT_ARCHIVE,
+    DEFAULT_CAPTURE,
+    DEFAULT_METRICS,
+    DEFAULT_RECORDER_EFFICIENCY,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +39,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     _reauth_email: str | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def _async_validate_credentials(
         self, email: str, password: str
     ) -> str | None:
@@ -108,3 +127,46 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={CONF_EMAIL: self._reauth_email},
             errors=errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Bradford White Connect options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_RECORDER_EFFICIENCY,
+                        default=self.config_entry.options.get(
+                            CONF_RECORDER_EFFICIENCY, DEFAULT_RECORDER_EFFICIENCY
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_CAPTURE,
+                        default=self.config_entry.options.get(
+                            CONF_CAPTURE, DEFAULT_CAPTURE
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_METRICS,
+                        default=self.config_entry.options.get(
+                            CONF_METRICS, DEFAULT_METRICS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_ARCHIVE,
+                        default=self.config_entry.options.get(
+                            CONF_ARCHIVE, DEFAULT_ARCHIVE
+                        ),
+                    ): bool,
+                }
+            ),
+        )
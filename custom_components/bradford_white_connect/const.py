@@ -16,6 +16,10 @@ REGULAR_INTERVAL = timedelta(minutes=5)
 # Update interval to be used while a mode or setpoint change is in progress.
 FAST_INTERVAL = timedelta(seconds=5)
 
+# A write the cloud has not reflected within this long stops being timed
+# (and stops holding the fast update interval).
+PROPAGATION_TIMEOUT = timedelta(minutes=15)
+
 # Update interval to be used for energy usage data.
 ENERGY_USAGE_INTERVAL = timedelta(minutes=30)
 
@@ -28,6 +32,80 @@ ENERGY_USAGE_INTERVAL = timedelta(minutes=30)
 # as ``UpdateFailed`` and the next interval retries.
 REQUEST_TIMEOUT = timedelta(seconds=60)
 
+# Account-wide request budget shared by both coordinators and the write
+# path (see ``scheduler.RequestScheduler``): a sustained rate in requests
+# per second plus a burst allowance so a normal poll never has to wait.
+REQUEST_RATE = 2.0
+REQUEST_BURST = 10
+
+# Options flow: hold back insignificant diagnostic sensor changes
+# (per-description deadbands) to shrink the recorder database. Off by default so every
+# reported change is recorded unless the user opts in.
+CONF_RECORDER_EFFICIENCY = "recorder_efficiency"
+DEFAULT_RECORDER_EFFICIENCY = False
+
+# Options flow: record redacted cloud responses to a capture file in the
+# config directory (see ``capture``) so a slow or misbehaving install can
+# be replayed locally. Pending records are flushed on this interval and
+# when the entry unloads.
+CONF_CAPTURE = "capture"
+DEFAULT_CAPTURE = False
+CAPTURE_FLUSH_INTERVAL = timedelta(minutes=1)
+
+# Options flow: serve device telemetry and integration health in the
+# OpenMetrics text format (see ``metrics``) for Prometheus to scrape, at
+# this URL (formatted with the config entry id). Scrapes authenticate
+# with a long-lived access token like any other Home Assistant API call.
+CONF_METRICS = "metrics"
+DEFAULT_METRICS = False
+METRICS_URL = f"/api/{DOMAIN}/{{entry_id}}/metrics"
+
+# Options flow: archive every refresh's changed property values to daily
+# compressed files in the config directory (see ``archive``) for
+# long-term analysis. Buffered lines are written on this interval and
+# when the entry unloads; days older than the retention are deleted.
+CONF_ARCHIVE = "archive"
+DEFAULT_ARCHIVE = False
+ARCHIVE_FLUSH_INTERVAL = timedelta(minutes=5)
+ARCHIVE_RETENTION = timedelta(days=365)
+
 # energy types
 ENERGY_TYPE_RESISTANCE = "resistance"
 ENERGY_TYPE_HEAT_PUMP = "heat_pump"
+
+# Dispatcher signal (formatted with the config entry id) sent whenever the
+# power-integrated energy estimates move, either from a status poll's power
+# samples or from a cloud daily total re-anchoring them.
+SIGNAL_ENERGY_ESTIMATES_UPDATED = f"{DOMAIN}_energy_estimates_updated_{{}}"
+
+# Dispatcher signal (formatted with the config entry id) sent whenever the
+# outbox of writes waiting for a retry changes.
+SIGNAL_OUTBOX_UPDATED = f"{DOMAIN}_outbox_updated_{{}}"
+
+# Dispatcher signal (formatted with the config entry id) sent whenever a
+# status poll adds samples to the per-property time series or the hot
+# water forecasts.
+SIGNAL_SERIES_UPDATED = f"{DOMAIN}_series_updated_{{}}"
+
+# Writes that fail during a cloud outage are queued and retried for this
+# long before they are dropped; persisted shortly after every change.
+OUTBOX_TTL = timedelta(minutes=30)
+OUTBOX_SAVE_DELAY = 1
+
+# Event fired on the HA bus whenever an alarm bit sets or clears between
+# two polls. Payload: ``dsn``, ``bit``, ``tentative_code``,
+# ``tentative_description``, ``state`` ("set" / "cleared") and ``at``.
+EVENT_ALARM_TRANSITION = f"{DOMAIN}_alarm_transition"
+
+# Event fired on the HA bus whenever a heater starts or stops standing out
+# from the rest of the account's heat pumps. Payload: ``dsn``,
+# ``property``, ``value``, ``score`` and ``state`` ("detected" / "cleared").
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+
+# Version of the on-disk ``Store`` payloads owned by this integration.
+STORAGE_VERSION = 1
+
+# Coalesce alarm-history writes so a burst of transitions (or a latched
+# fault refreshing ``last_seen`` every poll) costs at most one disk write
+# per window.
+ALARM_HISTORY_SAVE_DELAY = 60
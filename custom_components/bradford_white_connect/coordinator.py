@@ -2,79 +2,231 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 import datetime
+from functools import partial
 import json
 import logging
-from typing import Any
+import time
+from typing import Any, TypeVar
 
+import aiohttp
 from bradford_white_connect_client import (
     BradfordWhiteConnectAuthenticationError,
     BradfordWhiteConnectClient,
     BradfordWhiteConnectUnknownException,
 )
-from bradford_white_connect_client.constants import BradfordWhiteConnectHeatingModes
 from bradford_white_connect_client.types import Device
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .alarm_history import AlarmHistoryTracker
+from .archive import TelemetryArchive
+from .commands import Command, CommandLanes
 from .const import (
+    ALARM_HISTORY_SAVE_DELAY,
+    CONF_RECORDER_EFFICIENCY,
+    DEFAULT_RECORDER_EFFICIENCY,
     DOMAIN,
-    ENERGY_TYPE_HEAT_PUMP,
-    ENERGY_TYPE_RESISTANCE,
     ENERGY_USAGE_INTERVAL,
+    EVENT_ALARM_TRANSITION,
+    EVENT_ANOMALY,
     FAST_INTERVAL,
+    OUTBOX_SAVE_DELAY,
+    OUTBOX_TTL,
+    PROPAGATION_TIMEOUT,
     REGULAR_INTERVAL,
+    SIGNAL_ENERGY_ESTIMATES_UPDATED,
+    SIGNAL_OUTBOX_UPDATED,
+    SIGNAL_SERIES_UPDATED,
+    STORAGE_VERSION,
 )
+from .core import FleetState, PollResult
+from .energy_statistics import EnergyStatisticsImporter
+from .latency import PropagationTracker
+from .metrics import OpenMetricsExposition, RefreshMetrics
+from .outbox import Outbox
+from .poller import StatusPoller, async_fetch_energy_totals
+from .scheduler import RequestPriority, RequestScheduler
+from .snapshot import Snapshot
+from .state_writes import StateWriteTracker
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Ayla datapoint write endpoint (same shape the upstream client uses for
 # the two specialised setters - we just parametrise the property name).
 _DATAPOINT_URL = "https://ads-field.aylanetworks.com/apiv1/dsns/{dsn}/properties/{name}/datapoints.json"
 
-# Properties worth warning about when the cloud returns obviously bad data.
-# These checks are diagnostic only. We still keep the device in coordinator
-# data so HA entities remain available and can surface whatever values the
-# cloud did return.
-_REQUIRED_TEMP_PROPERTIES: tuple[str, ...] = (
-    "tank_temp",
-    "water_setpoint_out",
-    "water_setpoint_min",
-    "water_setpoint_max",
+# Command names for the two writes the upstream client performs itself.
+_HEAT_MODE_COMMAND = "set_heat_mode"
+_SETPOINT_COMMAND = "water_setpoint_in"
+
+# Write failures that may be queued in the outbox (see ``_is_transient``).
+_WRITE_ERRORS = (
+    BradfordWhiteConnectAuthenticationError,
+    BradfordWhiteConnectUnknownException,
+    aiohttp.ClientError,
+    TimeoutError,
 )
 
 
-def _coerce_float(value: Any) -> float | None:
-    """Parse telemetry that may arrive as number-like strings."""
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
+def _is_transient(err: Exception) -> bool:
+    """Return whether a failed write is worth retrying later.
+
+    Client errors (4xx other than auth, timeout and rate limiting) mean
+    the cloud rejected the write itself; retrying would not help.
+    """
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500 or err.status in (401, 408, 429)
+    return True
+
+
+def alarm_history_storage_key(entry_id: str) -> str:
+    """Return the ``Store`` key holding a config entry's alarm history."""
+    return f"{DOMAIN}.{entry_id}.alarm_history"
 
 
-def _coerce_int(value: Any) -> int | None:
-    """Parse integer-like telemetry values safely."""
-    if value is None:
-        return None
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
+def outbox_storage_key(entry_id: str) -> str:
+    """Return the ``Store`` key holding a config entry's queued writes."""
+    return f"{DOMAIN}.{entry_id}.outbox"
 
 
-class BradfordWhiteConnectStatusCoordinator(DataUpdateCoordinator[dict[str, Device]]):
+class BradfordWhiteConnectStatusCoordinator(DataUpdateCoordinator[Snapshot]):
     """Coordinator for device status, updating with a frequent interval."""
 
-    def __init__(self, hass: HomeAssistant, client: BradfordWhiteConnectClient) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: BradfordWhiteConnectClient,
+        entry: ConfigEntry,
+        scheduler: RequestScheduler,
+    ) -> None:
         """Initialize the coordinator."""
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=REGULAR_INTERVAL)
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=REGULAR_INTERVAL,
+            # An unchanged poll returns the previous snapshot itself, and
+            # snapshots compare by device identity, so the equality check
+            # is cheap and spares every entity a state write.
+            always_update=False,
+        )
         self.client = client
+        self.scheduler = scheduler
         self.shared_data: dict[str, Any] = {}
+        # Polling and everything derived from the snapshots is shared with
+        # the headless poller; the coordinator adds writes, events,
+        # dispatcher signals and storage on top.
+        self.poller = StatusPoller(client, scheduler)
+        self.state = FleetState(local_now=dt_util.now, utc_now=dt_util.utcnow)
+        self.refresh_plan = self.poller.refresh_plan
+        self.http_cache = self.poller.http_cache
+        self.capabilities = self.state.capabilities
+        self.inventory = self.state.inventory
+        self.energy_estimates = self.state.energy_estimates
+        self.series = self.state.series
+        self.forecasts = self.state.forecasts
+        self.anomalies = self.state.anomalies
+        self.fleet = self.state.fleet
+        self.state.register_refresh_tiers(self.refresh_plan)
+        self.state_writes = StateWriteTracker()
+        self.commands = CommandLanes(REGULAR_INTERVAL.total_seconds())
+        self.outbox = Outbox(OUTBOX_TTL.total_seconds())
+        self.propagation = PropagationTracker(PROPAGATION_TIMEOUT.total_seconds())
+        self.refresh_metrics = RefreshMetrics()
+        # Set up by ``__init__`` when the OpenMetrics endpoint is enabled.
+        self.exposition: OpenMetricsExposition | None = None
+        # Set up by ``__init__`` when the telemetry archive is enabled.
+        self.archive: TelemetryArchive | None = None
+        self._outbox_flush: asyncio.Task[None] | None = None
+        self.recorder_efficiency: bool = entry.options.get(
+            CONF_RECORDER_EFFICIENCY, DEFAULT_RECORDER_EFFICIENCY
+        )
+        self._alarm_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, alarm_history_storage_key(entry.entry_id)
+        )
+        self._outbox_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, outbox_storage_key(entry.entry_id)
+        )
+
+    @property
+    def alarm_history(self) -> AlarmHistoryTracker:
+        """Return the alarm baselines and fault log."""
+        return self.state.alarm_history
+
+    async def async_load_alarm_history(self) -> None:
+        """Restore the persisted alarm baselines and fault log.
+
+        Must run before the first refresh so faults that were already
+        latched before a restart are not reported as new transitions.
+        """
+        self.state.alarm_history = AlarmHistoryTracker.from_dict(
+            await self._alarm_store.async_load()
+        )
+
+    def _handle_poll(self, result: PollResult) -> None:
+        """Act on one processed poll: writes, events, signals and storage.
+
+        Listeners (device registry sync in ``__init__`` and the per-platform
+        entity trackers) react to ``inventory.version`` moving on their own.
+        A heater is retired on a later miss, when the poll returns the
+        previous snapshot unchanged and the coordinator would not notify
+        them, so that case notifies them here.
+        """
+        snapshot = result.snapshot
+        if result.changed:
+            for dsn in snapshot.changed:
+                self._on_device_changed(snapshot[dsn])
+            if self.archive is not None:
+                self.archive.record(snapshot, snapshot.changed, time.time())
+        for dsn in result.inventory.retired:
+            self.poller.forget(dsn)
+            if self.archive is not None:
+                self.archive.forget(dsn)
+            self.commands.forget(dsn)
+            self.outbox.forget(dsn)
+            self.propagation.forget(dsn)
+        for alarm in result.alarms:
+            self.hass.bus.async_fire(EVENT_ALARM_TRANSITION, alarm.as_event_data())
+        for anomaly in result.anomalies:
+            self.hass.bus.async_fire(EVENT_ANOMALY, anomaly.as_event_data())
+        if self.alarm_history.dirty:
+            self.alarm_history.dirty = False
+            self._alarm_store.async_delay_save(
+                self.alarm_history.as_dict, ALARM_HISTORY_SAVE_DELAY
+            )
+        entry_id = self.config_entry.entry_id
+        if result.energy_sampled:
+            async_dispatcher_send(
+                self.hass, SIGNAL_ENERGY_ESTIMATES_UPDATED.format(entry_id)
+            )
+        if result.series_sampled:
+            async_dispatcher_send(self.hass, SIGNAL_SERIES_UPDATED.format(entry_id))
+        if result.inventory and not result.changed:
+            self.async_update_listeners()
 
-    async def async_set_property(self, device: Device, name: str, value: Any) -> None:
+    async def async_request(
+        self,
+        priority: RequestPriority,
+        dsn: str | None,
+        request: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Send one cloud request through the account-wide request budget."""
+        return await self.poller.async_request(priority, dsn, request)
+
+    async def async_set_property(
+        self, device: Device, name: str, value: Any, *, idempotent: bool = True
+    ) -> None:
         """Write a single property's datapoint to the Ayla cloud.
 
         The upstream ``bradford_white_connect_client`` only exposes
@@ -85,17 +237,200 @@ class BradfordWhiteConnectStatusCoordinator(DataUpdateCoordinator[dict[str, Devi
         Mobile-app codepath.
 
         Booleans are submitted as ``1`` / ``0``; everything else is
-        passed through unchanged. We deliberately do **not** optimistically
-        mutate ``device.properties[name].value`` after a successful write,
-        because the Ayla cloud is the source of truth: the next coordinator
-        refresh (shortened to ``FAST_INTERVAL`` for the next ~5 minutes
-        via ``last_api_set_datetime``) will reconcile state.
+        passed through unchanged. ``idempotent=False`` marks one-shot
+        actions (reboots) that must be sent even if the property already
+        holds the value, and are never queued for a later retry.
+        """
+        await self._async_command(
+            device, Command(device.dsn, name, value, name, idempotent)
+        )
+
+    async def async_set_heat_mode(self, device: Device, mode: int) -> None:
+        """Switch the heater to a vendor heat mode."""
+        await self._async_command(
+            device,
+            Command(device.dsn, _HEAT_MODE_COMMAND, mode, "current_heat_mode"),
+        )
+
+    async def async_set_setpoint(self, device: Device, temperature: float) -> None:
+        """Change the heater's target water temperature."""
+        await self._async_command(
+            device,
+            Command(device.dsn, _SETPOINT_COMMAND, temperature, "water_setpoint_out"),
+        )
+
+    def _sender(self, device: Device, command: Command) -> Callable[[], Awaitable[Any]]:
+        """Return the request that performs ``command``.
+
+        Commands are rebuilt from their name so that queued writes can be
+        replayed after a restart.
+        """
+        if command.name == _HEAT_MODE_COMMAND:
+            request = partial(self.client.set_device_heat_mode, device, command.value)
+        elif command.name == _SETPOINT_COMMAND:
+            request = partial(
+                self.client.update_device_set_point, device, command.value
+            )
+        else:
+            return partial(self._post_datapoint, device, command.name, command.value)
+        return partial(
+            self.async_request, RequestPriority.USER_WRITE, device.dsn, request
+        )
+
+    async def _async_command(self, device: Device, command: Command) -> None:
+        """Send a write in its device's lane, then verify it with fast polls.
+
+        Writes to one heater are sent strictly in order; a write the
+        heater already reflects is skipped. A write that fails for a
+        transient reason is parked in the outbox and retried after later
+        successful polls instead of failing the caller.
+        """
+        try:
+            sent = await self._async_send(device, command)
+        except _WRITE_ERRORS as err:
+            if not (command.idempotent and _is_transient(err)):
+                raise
+            self.outbox.add(command, str(err) or type(err).__name__)
+            self._outbox_changed()
+            _LOGGER.warning(
+                "Could not write %s=%r to device %s (%s); queued for retry",
+                command.name,
+                command.value,
+                command.dsn,
+                err,
+            )
+            return
+        if self.outbox.discard(command):
+            self._outbox_changed()
+        if sent:
+            await self.async_request_refresh()
+
+    async def _async_send(
+        self,
+        device: Device,
+        command: Command,
+        wanted: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Run ``command`` in its lane; return whether it was actually sent.
+
+        ``wanted`` is checked once the lane is free, right before sending
+        (see ``CommandLanes.run``).
+
+        We deliberately do **not** optimistically mutate the cached
+        property after a successful write, because the Ayla cloud is the
+        source of truth: refreshes run at ``FAST_INTERVAL`` (via
+        ``last_api_set_datetime``) until the write is reflected or the
+        measured propagation window passes, and reconcile state.
         """
-        await self._post_datapoint(device, name, value)
+        if not await self.commands.run(
+            command,
+            partial(self._cached_value, command.dsn, command.state_property),
+            self._sender(device, command),
+            wanted,
+        ):
+            _LOGGER.debug(
+                "Skipping %s=%r for device %s; already set",
+                command.name,
+                command.value,
+                command.dsn,
+            )
+            return False
+        if command.idempotent:
+            self.propagation.start(command.dsn, command.state_property, command.value)
+        self.refresh_plan.promote(
+            command.state_property, time.monotonic() + self._fast_window()
+        )
         self.shared_data["last_api_set_datetime"] = datetime.datetime.now(
             datetime.timezone.utc
         )
-        await self.async_request_refresh()
+        return True
+
+    async def async_load_outbox(self) -> None:
+        """Restore writes that were still queued when Home Assistant stopped."""
+        self.outbox = Outbox.from_dict(
+            await self._outbox_store.async_load(), OUTBOX_TTL.total_seconds()
+        )
+
+    def _outbox_changed(self) -> None:
+        """Persist the outbox and refresh its depth sensors."""
+        if self.outbox.dirty:
+            self.outbox.dirty = False
+            self._outbox_store.async_delay_save(self.outbox.as_dict, OUTBOX_SAVE_DELAY)
+        async_dispatcher_send(
+            self.hass, SIGNAL_OUTBOX_UPDATED.format(self.config_entry.entry_id)
+        )
+
+    def _schedule_outbox_flush(self) -> None:
+        """Retry queued writes in the background after a successful poll."""
+        for entry in self.outbox.expire():
+            _LOGGER.warning(
+                "Dropping queued write %s=%r for device %s; it expired after %s attempts",
+                entry.command.name,
+                entry.command.value,
+                entry.command.dsn,
+                entry.attempts,
+            )
+        if self.outbox.dirty:
+            self._outbox_changed()
+        if not self.outbox.due() or (
+            self._outbox_flush is not None and not self._outbox_flush.done()
+        ):
+            return
+        self._outbox_flush = self.config_entry.async_create_background_task(
+            self.hass, self._async_flush_outbox(), f"{DOMAIN} outbox flush"
+        )
+
+    async def _async_flush_outbox(self) -> None:
+        """Replay due writes, oldest first, through the command lanes.
+
+        While a replay waits for its lane, the user may write the same
+        property again; that write settles or replaces the queued entry.
+        Each entry is therefore only sent, and only removed, while the
+        outbox still holds that very entry, so an older value never
+        overwrites a newer one.
+        """
+        refresh = False
+        for entry in self.outbox.due():
+            command = entry.command
+            device = self.data.get(command.dsn) if self.data else None
+            if device is None or not self.outbox.holds(entry):
+                continue
+            try:
+                sent = await self._async_send(
+                    device, command, partial(self.outbox.holds, entry)
+                )
+            except _WRITE_ERRORS as err:
+                if not self.outbox.holds(entry):
+                    continue
+                if _is_transient(err):
+                    self.outbox.retry_later(entry, str(err) or type(err).__name__)
+                    continue
+                _LOGGER.error(
+                    "Dropping queued write %s=%r for device %s: %s",
+                    command.name,
+                    command.value,
+                    command.dsn,
+                    err,
+                )
+                self.outbox.remove(entry, delivered=False)
+                continue
+            refresh |= sent
+            if self.outbox.remove(entry, delivered=True):
+                _LOGGER.info(
+                    "Delivered queued write %s=%r to device %s",
+                    command.name,
+                    command.value,
+                    command.dsn,
+                )
+        self._outbox_changed()
+        if refresh:
+            await self.async_request_refresh()
+
+    def _cached_value(self, dsn: str, name: str) -> Any:
+        """Return a property's value from the latest snapshot, if any."""
+        device = self.data.get(dsn) if self.data else None
+        prop = (device.properties or {}).get(name) if device else None
+        return None if prop is None else prop.value
 
     async def _post_datapoint(self, device: Device, name: str, value: Any) -> None:
         """POST a single datapoint to the Ayla cloud via the upstream client.
@@ -114,81 +449,70 @@ class BradfordWhiteConnectStatusCoordinator(DataUpdateCoordinator[dict[str, Devi
         payload_value: Any = (1 if value else 0) if isinstance(value, bool) else value
         data = json.dumps({"datapoint": {"value": payload_value}})
         _LOGGER.info("Writing %s=%r to device %s", name, payload_value, device.dsn)
-        await self.client.http_post_request(url, headers=headers, data=data)
+        await self.async_request(
+            RequestPriority.USER_WRITE,
+            device.dsn,
+            lambda: self.client.http_post_request(url, headers=headers, data=data),
+        )
+
+    def _poll_priority(self) -> RequestPriority:
+        """Polls inside the post-write fast window verify a user's write."""
+        if self.update_interval == FAST_INTERVAL:
+            return RequestPriority.WRITE_VERIFY
+        return RequestPriority.STATUS
+
+    def _fast_window(self) -> float:
+        """Return how long to fast-poll after a write, from measured latencies."""
+        return self.propagation.fast_window(REGULAR_INTERVAL.total_seconds())
 
     def _refresh_update_interval(self) -> None:
-        """Shorten the polling interval after a recent write, otherwise relax it."""
+        """Shorten the polling interval after a recent write, otherwise relax it.
+
+        Polling stays fast while a write is still not reflected by the
+        cloud, for at most the window derived from recent propagation
+        latencies (``REGULAR_INTERVAL`` until enough writes are measured).
+        """
         last_set = self.shared_data.get("last_api_set_datetime")
         if last_set is None:
             self.update_interval = REGULAR_INTERVAL
             return
-        if (datetime.datetime.now(datetime.timezone.utc) - last_set) < REGULAR_INTERVAL:
+        elapsed = datetime.datetime.now(datetime.timezone.utc) - last_set
+        if self.propagation.pending() and elapsed.total_seconds() < self._fast_window():
             _LOGGER.debug("Setting fast update interval")
             self.update_interval = FAST_INTERVAL
         else:
             _LOGGER.debug("Setting regular update interval")
             self.update_interval = REGULAR_INTERVAL
 
-    @staticmethod
-    def _log_device_warnings(device: Device) -> None:
-        """Log suspicious telemetry without dropping the device from HA."""
-        for temp_property in _REQUIRED_TEMP_PROPERTIES:
-            device_property = device.properties.get(temp_property)
-            if device_property is None:
-                _LOGGER.warning(
-                    "Device %s missing expected property %s",
-                    device.dsn,
-                    temp_property,
-                )
-                continue
-            raw_value = device_property.value
-            value = _coerce_float(raw_value)
-            if value is None or value < 0 or value > 200:
-                _LOGGER.warning(
-                    "Device %s property %s out of range: %r",
-                    device.dsn,
-                    temp_property,
-                    raw_value,
-                )
-
-        heat_mode = device.properties.get("current_heat_mode")
-        if heat_mode is None:
-            _LOGGER.warning(
-                "Device %s missing expected property current_heat_mode",
-                device.dsn,
-            )
-            return
-        raw_mode = heat_mode.value
-        mode = _coerce_int(raw_mode)
-        if raw_mode is not None and mode is None:
-            _LOGGER.warning(
-                "Device %s reported non-integer current_heat_mode %r",
-                device.dsn,
-                raw_mode,
-            )
-        elif mode is not None and not BradfordWhiteConnectHeatingModes.is_valid(mode):
-            _LOGGER.warning(
-                "Device %s reported unknown current_heat_mode %r",
-                device.dsn,
-                raw_mode,
+    def _on_device_changed(self, device: Device) -> None:
+        """Reconcile writes against a device that differs from the last snapshot."""
+        self.commands.reconcile(device.dsn, device.properties)
+        for latency in self.propagation.observe(device.dsn, device.properties):
+            _LOGGER.debug(
+                "Write to device %s reflected after %.1f s", device.dsn, latency
             )
 
-    async def _async_update_data(self) -> dict[str, Device]:
+    async def _async_update_data(self) -> Snapshot:
         """Fetch latest data from the device status endpoint."""
         self._refresh_update_interval()
+        priority = self._poll_priority()
+        started = time.monotonic()
+        success = False
         try:
-            devices = await self.client.get_devices()
-            valid_devices: dict[str, Device] = {}
-            for device in devices:
-                properties = await self.client.get_device_properties(device)
-                device.properties = {p.property.name: p.property for p in properties}
-                self._log_device_warnings(device)
-                valid_devices[device.dsn] = device
-            return valid_devices
+            snapshot = await self.poller.async_poll(self.data, priority)
+            self._handle_poll(self.state.process(snapshot, self.poller.polled_at))
+            if self.outbox.depth():
+                self._schedule_outbox_flush()
+            success = True
+            return snapshot
         except BradfordWhiteConnectAuthenticationError as err:
             raise ConfigEntryAuthFailed from err
         except BradfordWhiteConnectUnknownException as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            self.refresh_metrics.record(time.monotonic() - started, success)
+            if self.exposition is not None:
+                self.exposition.invalidate()
 
 
 class BradfordWhiteConnectEnergyCoordinator(
@@ -200,41 +524,54 @@ class BradfordWhiteConnectEnergyCoordinator(
         self,
         hass: HomeAssistant,
         client: BradfordWhiteConnectClient,
+        entry: ConfigEntry,
+        scheduler: RequestScheduler,
+        state: FleetState,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator; totals anchor ``state``'s estimates."""
         super().__init__(
-            hass, _LOGGER, name=DOMAIN, update_interval=ENERGY_USAGE_INTERVAL
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=ENERGY_USAGE_INTERVAL,
         )
         self.client = client
+        self.scheduler = scheduler
+        self.state = state
+        self.statistics = EnergyStatisticsImporter(hass, client, scheduler)
+        self._statistics_import: asyncio.Task[None] | None = None
 
     async def _async_update_data(self) -> dict[str, dict[str, float]]:
         """Fetch latest data from the energy usage endpoint."""
-        energy_usage_by_dsn: dict[str, dict[str, float]] = {}
-
-        # always get the energy usage the current date with a lag of one hour
-        # this is to ensure we get the usage for the last hour of the day that
-        # can come in after midnight
-        usage_date = datetime.datetime.now() - datetime.timedelta(hours=1)
-
+        # The usage day and the anchoring are shared with the headless
+        # poller (see ``FleetState.energy_usage_date``).
         try:
-            devices = await self.client.get_devices()
-
-            for device in devices:
-                heatpump_energy = await self.client.get_total_energy_usage_for_day(
-                    device, "hp", usage_date
-                )
-                resistance_energy = await self.client.get_total_energy_usage_for_day(
-                    device, "re", usage_date
-                )
-
-                energy_usage_by_dsn[device.dsn] = {
-                    ENERGY_TYPE_HEAT_PUMP: heatpump_energy,
-                    ENERGY_TYPE_RESISTANCE: resistance_energy,
-                }
-
+            devices, energy_usage_by_dsn = await async_fetch_energy_totals(
+                self.client, self.scheduler, self.state
+            )
         except BradfordWhiteConnectAuthenticationError as err:
             raise ConfigEntryAuthFailed from err
         except BradfordWhiteConnectUnknownException as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_ENERGY_ESTIMATES_UPDATED.format(self.config_entry.entry_id),
+        )
+        self._schedule_statistics_import(devices)
         return energy_usage_by_dsn
+
+    def _schedule_statistics_import(self, devices: list[Device]) -> None:
+        """Import missing hourly history without holding up the refresh.
+
+        The first import backfills weeks of history per heater, far too
+        long for the refresh (and setup) to wait on.
+        """
+        if self._statistics_import is not None and not self._statistics_import.done():
+            return
+        self._statistics_import = self.config_entry.async_create_background_task(
+            self.hass,
+            self.statistics.async_import(devices),
+            f"{DOMAIN} energy statistics import",
+        )
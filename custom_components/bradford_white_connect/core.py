@@ -0,0 +1,341 @@
+"""Home Assistant independent core of the Bradford White Connect status poll.
+
+``FleetState.process`` takes the snapshot one poll produced, updates
+everything derived from it (inventory, alarms, energy estimates, series,
+forecasts, anomalies and account totals) and returns a ``PollResult``.
+The status coordinator and ``scripts/fleet_poller.py`` both build on it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import logging
+from typing import Any
+
+from bradford_white_connect_client.constants import BradfordWhiteConnectHeatingModes
+
+from .alarm_history import AlarmHistoryTracker, AlarmTransition
+from .anomaly import AnomalyTransition, FleetAnomalyDetector
+from .capabilities import CapabilityIndex
+from .const import ENERGY_TYPE_HEAT_PUMP, ENERGY_TYPE_RESISTANCE
+from .energy import POWER_PROPERTIES, EnergyEstimates
+from .fault_codes import decode_alarm, heat_mode_to_name
+from .fleet import FleetAggregates
+from .forecast import CapacityForecasts
+from .inventory import DeviceInventory, InventoryChange
+from .refresh_tiers import RefreshPlan, RefreshTier
+from .snapshot import Snapshot
+from .timeseries import PropertySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Properties worth warning about when the cloud returns obviously bad data.
+# These checks are diagnostic only. We still keep the device in the
+# snapshot so entities remain available and can surface whatever values
+# the cloud did return.
+REQUIRED_TEMP_PROPERTIES: tuple[str, ...] = (
+    "tank_temp",
+    "water_setpoint_out",
+    "water_setpoint_min",
+    "water_setpoint_max",
+)
+
+# Readings copied as-is into each heater's metrics record.
+METRIC_PROPERTIES: tuple[str, ...] = (
+    "tank_temp",
+    "tank_temp_lower",
+    "water_setpoint_out",
+    "ambient_temp",
+    "hp_power",
+    "re_power",
+    "mains_voltage",
+    "mains_current",
+    "available_thermal_capacity",
+    "daily_total_energy",
+)
+
+
+def coerce_float(value: Any) -> float | None:
+    """Parse telemetry that may arrive as number-like strings."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def coerce_int(value: Any) -> int | None:
+    """Parse integer-like telemetry values safely."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _value(device: Any, name: str) -> Any:
+    prop = (getattr(device, "properties", None) or {}).get(name)
+    return None if prop is None else prop.value
+
+
+def log_device_warnings(device: Any) -> None:
+    """Log suspicious telemetry without dropping the device."""
+    properties = device.properties or {}
+    for temp_property in REQUIRED_TEMP_PROPERTIES:
+        device_property = properties.get(temp_property)
+        if device_property is None:
+            _LOGGER.warning(
+                "Device %s missing expected property %s",
+                device.dsn,
+                temp_property,
+            )
+            continue
+        raw_value = device_property.value
+        value = coerce_float(raw_value)
+        if value is None or value < 0 or value > 200:
+            _LOGGER.warning(
+                "Device %s property %s out of range: %r",
+                device.dsn,
+                temp_property,
+                raw_value,
+            )
+
+    heat_mode = properties.get("current_heat_mode")
+    if heat_mode is None:
+        _LOGGER.warning(
+            "Device %s missing expected property current_heat_mode",
+            device.dsn,
+        )
+        return
+    raw_mode = heat_mode.value
+    mode = coerce_int(raw_mode)
+    if raw_mode is not None and mode is None:
+        _LOGGER.warning(
+            "Device %s reported non-integer current_heat_mode %r",
+            device.dsn,
+            raw_mode,
+        )
+    elif mode is not None and not BradfordWhiteConnectHeatingModes.is_valid(mode):
+        _LOGGER.warning(
+            "Device %s reported unknown current_heat_mode %r",
+            device.dsn,
+            raw_mode,
+        )
+
+
+# Cloud daily totals are fetched for the day an hour ago, so the last
+# hour of a day is still fetched after midnight.
+ENERGY_USAGE_LAG = timedelta(hours=1)
+
+
+def _local_now() -> datetime:
+    return datetime.now().astimezone()
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class PollResult:
+    """What processing one poll's snapshot changed."""
+
+    snapshot: Snapshot
+    # False when the poll returned the previous snapshot itself.
+    changed: bool
+    inventory: InventoryChange
+    alarms: list[AlarmTransition]
+    anomalies: list[AnomalyTransition]
+    # Whether any heater added a power sample / time series sample.
+    energy_sampled: bool
+    series_sampled: bool
+    capabilities_changed: bool
+
+
+class FleetState:
+    """Everything derived from an account's successive status snapshots."""
+
+    def __init__(
+        self,
+        local_now: Callable[[], datetime] = _local_now,
+        utc_now: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        """Initialize with nothing seen.
+
+        ``local_now`` returns the timezone-aware local time energy days are
+        counted in; Home Assistant passes its configured time zone's.
+        """
+        self._local_now = local_now
+        self._utc_now = utc_now
+        self.alarm_history = AlarmHistoryTracker()
+        self.capabilities = CapabilityIndex()
+        self.inventory = DeviceInventory()
+        self.energy_estimates = EnergyEstimates()
+        self.series = PropertySeries()
+        self.forecasts = CapacityForecasts()
+        self.anomalies = FleetAnomalyDetector()
+        self.fleet = FleetAggregates()
+        self.data: Snapshot | None = None
+
+    def register_refresh_tiers(self, refresh_plan: RefreshPlan) -> None:
+        """Poll the time series' properties on every poll.
+
+        Trends are only meaningful if every poll brings a fresh sample.
+        """
+        for name in self.series.names:
+            refresh_plan.register(name, RefreshTier.REALTIME)
+
+    def process(self, snapshot: Snapshot, now: float) -> PollResult:
+        """Feed one poll's snapshot, taken at monotonic time ``now``.
+
+        Per-heater checks, anomaly scoring and the account totals only
+        look at heaters that changed since the previous snapshot; power
+        and time series samples are taken on every poll, because a
+        heater holding steady is still drawing power.
+        """
+        changed = snapshot is not self.data
+        self.data = snapshot
+        anomalies: list[AnomalyTransition] = []
+        if changed:
+            for dsn in snapshot.changed:
+                log_device_warnings(snapshot[dsn])
+            anomalies = self._track_anomalies(snapshot)
+            self.fleet.update(snapshot, snapshot.changed | snapshot.removed)
+        inventory = self._track_inventory(snapshot)
+        alarms = self._track_alarms(snapshot)
+        energy_sampled = self._sample_power(snapshot)
+        series_sampled = self._sample_series(snapshot, now)
+        capabilities_changed = self.capabilities.rebuild(snapshot)
+        if capabilities_changed:
+            _LOGGER.debug(
+                "Capability index changed (version %s)", self.capabilities.version
+            )
+        return PollResult(
+            snapshot,
+            changed,
+            inventory,
+            alarms,
+            anomalies,
+            energy_sampled,
+            series_sampled,
+            capabilities_changed,
+        )
+
+    def energy_usage_date(self) -> datetime:
+        """Return the time whose day the cloud's energy totals are fetched for.
+
+        Local time, lagging by ``ENERGY_USAGE_LAG``; naive, as the client
+        expects.
+        """
+        return (self._local_now() - ENERGY_USAGE_LAG).replace(tzinfo=None)
+
+    def anchor_energy(
+        self, usage_by_dsn: Mapping[str, Mapping[str, float]], usage_date: datetime
+    ) -> None:
+        """Re-anchor the power-integrated estimates to fresh cloud totals.
+
+        The cloud only reports completed hours, so the totals are taken to
+        cover energy up to the start of the current hour; the estimates
+        integrate power from there on.
+        """
+        covered_until = self._local_now().replace(minute=0, second=0, microsecond=0)
+        self.energy_estimates.anchor_all(usage_by_dsn, usage_date.date(), covered_until)
+
+    def _track_inventory(self, devices: Mapping[str, Any]) -> InventoryChange:
+        """Detect heaters joining or leaving the account between polls."""
+        change = self.inventory.update(devices)
+        for dsn in change.added:
+            _LOGGER.info("Discovered device %s", dsn)
+        for dsn in change.retired:
+            _LOGGER.info("Device %s is no longer on the account; retiring it", dsn)
+            self.alarm_history.forget(dsn)
+            self.energy_estimates.forget(dsn)
+            self.series.forget(dsn)
+            self.forecasts.forget(dsn)
+        return change
+
+    def _track_alarms(self, devices: Mapping[str, Any]) -> list[AlarmTransition]:
+        """Diff each device's alarm bitmap against the previous poll's."""
+        now = self._utc_now()
+        transitions: list[AlarmTransition] = []
+        for dsn, device in devices.items():
+            alarm = (device.properties or {}).get("alarm")
+            if alarm is None:
+                continue
+            for transition in self.alarm_history.update(dsn, alarm.value, now):
+                _LOGGER.info(
+                    "Device %s alarm bit %s (tentative %s) %s",
+                    dsn,
+                    transition.bit,
+                    transition.tentative_code,
+                    "set" if transition.active else "cleared",
+                )
+                transitions.append(transition)
+        return transitions
+
+    def _track_anomalies(self, devices: Mapping[str, Any]) -> list[AnomalyTransition]:
+        """Compare the fleet's heat pump readings."""
+        transitions = self.anomalies.analyze(devices)
+        for transition in transitions:
+            _LOGGER.info(
+                "Device %s %s: %s stands out from the fleet (score %.1f)",
+                transition.dsn,
+                "anomaly detected" if transition.active else "anomaly cleared",
+                transition.property,
+                transition.score,
+            )
+        return transitions
+
+    def _sample_power(self, devices: Mapping[str, Any]) -> bool:
+        """Feed each device's instantaneous power into its energy estimates."""
+        now = self._local_now()
+        sampled = False
+        for dsn, device in devices.items():
+            properties = device.properties or {}
+            samples = {
+                energy_type: coerce_float(prop.value)
+                for energy_type, name in POWER_PROPERTIES.items()
+                if (prop := properties.get(name)) is not None
+            }
+            if samples:
+                self.energy_estimates.add_samples(dsn, now, samples)
+                sampled = True
+        return sampled
+
+    def _sample_series(self, devices: Mapping[str, Any], now: float) -> bool:
+        """Add this poll's readings to the time series and capacity forecasts."""
+        sampled = False
+        for dsn, device in devices.items():
+            sampled = self.series.add_samples(dsn, now, device.properties) or sampled
+            sampled = self.forecasts.update(dsn, now, device.properties) or sampled
+        return sampled
+
+    def device_metrics(self, dsn: str, device: Any) -> dict[str, Any]:
+        """Return one heater's metrics record, as the metrics stream writes it."""
+        record: dict[str, Any] = {
+            name: coerce_float(_value(device, name)) for name in METRIC_PROPERTIES
+        }
+        record["heat_mode"] = heat_mode_to_name(
+            coerce_int(_value(device, "current_heat_mode"))
+        )
+        alarm = decode_alarm(_value(device, "alarm"))
+        record["alarm_bits"] = list(alarm.active_bits)
+        record["global_error"] = coerce_int(_value(device, "global_error")) == 1
+        now = self._local_now()
+        for energy_type in (ENERGY_TYPE_HEAT_PUMP, ENERGY_TYPE_RESISTANCE):
+            record[f"{energy_type}_energy_today"] = self.energy_estimates.value(
+                dsn, energy_type, now
+            )
+        if (forecaster := self.forecasts.get(dsn)) is not None:
+            record["fill_fraction"] = forecaster.fraction
+            record["phase"] = forecaster.phase.value
+            record["time_until_full"] = forecaster.time_until_full()
+            record["time_until_depleted"] = forecaster.time_until_depleted()
+        if (anomaly := self.anomalies.get(dsn)) is not None and anomaly.scores:
+            record["anomaly_score"] = round(anomaly.score, 2)
+            record["anomalous"] = anomaly.anomalous
+        return record
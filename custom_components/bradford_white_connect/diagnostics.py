@@ -2,105 +2,146 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import BradfordWhiteConnectData
-from .const import DOMAIN
-
-# Fields containing PII or identifying information that should be redacted
-# from any diagnostic snapshot that may be attached to a public PR or issue.
-TO_REDACT = {
-    "dsn",
-    "mac",
-    "unique_hardware_id",
-    "lan_ip",
-    "lat",
-    "lng",
-    "locality",
-    "appliance_serial_number_out",
-    "username",
-    "email",
-    "password",
-}
-
-
-def _property_to_dict(prop: Any) -> dict[str, Any]:
-    """Convert a Property dataclass instance to a plain dict.
-
-    Falls back to a best-effort introspection if the object is not a dataclass.
-    """
-    if is_dataclass(prop):
-        return asdict(prop)
-    return {
-        attr: getattr(prop, attr)
-        for attr in dir(prop)
-        if not attr.startswith("_") and not callable(getattr(prop, attr, None))
-    }
-
-
-def _device_to_dict(device: Any) -> dict[str, Any]:
-    """Render a Device into a JSON-serializable dict with expanded properties."""
-    data: dict[str, Any] = {}
-    for attr in (
-        "product_name",
-        "model",
-        "dsn",
-        "oem_model",
-        "sw_version",
-        "template_id",
-        "mac",
-        "unique_hardware_id",
-        "lan_ip",
-        "connected_at",
-        "key",
-        "lan_enabled",
-        "connection_priority",
-        "has_properties",
-        "product_class",
-        "connection_status",
-        "lat",
-        "lng",
-        "locality",
-        "device_type",
-        "dealer",
-        "facility_uuid",
-    ):
-        if hasattr(device, attr):
-            data[attr] = getattr(device, attr)
-
-    properties: dict[str, Any] = {}
-    for name, prop in (device.properties or {}).items():
-        properties[name] = _property_to_dict(prop)
-    data["properties"] = properties
-    return data
+from .const import DOMAIN, REGULAR_INTERVAL
+from .redaction import (
+    TO_REDACT,
+    bound_estimates,
+    device_to_dict,
+    head,
+    pseudonymize,
+    pseudonyms,
+    tail,
+)
+
+# Entry-level downloads keep at most this many rows of each history buffer
+# (fault log, hourly energy buckets, per-entity recorder rows) so their size
+# stays bounded on large accounts. Device downloads are not truncated.
+_MAX_HISTORY_ROWS = 50
 
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
+    """Return diagnostics for a config entry, with bounded history buffers."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = data.status_coordinator
+    limit = _MAX_HISTORY_ROWS
 
-    devices = {
-        dsn: _device_to_dict(device)
-        for dsn, device in data.status_coordinator.data.items()
-    }
+    # Device payloads are redacted by plan while they are built; every
+    # other section is small and goes through the recursive redactor,
+    # with DSNs (keys and values alike) replaced by pseudonyms that match
+    # the device keys.
     energy = dict(data.energy_coordinator.data or {})
-
-    payload: dict[str, Any] = {
+    names = pseudonyms([*coordinator.data, *coordinator.inventory, *energy])
+    alarm_history = coordinator.alarm_history.as_dict()
+    sections = {
         "entry": {
             "title": entry.title,
             "version": entry.version,
             "data": entry.data,
             "options": entry.options,
         },
-        "devices": devices,
+        "snapshot": {
+            "version": coordinator.data.version,
+            "changed": sorted(coordinator.data.changed),
+        },
         "energy": energy,
+        "energy_estimates": {
+            dsn: bound_estimates(series, limit)
+            for dsn, series in coordinator.energy_estimates.as_dict().items()
+        },
+        "energy_statistics": data.energy_coordinator.statistics.as_dict(),
+        "series": coordinator.series.as_dict(),
+        "forecasts": coordinator.forecasts.as_dict(),
+        "anomalies": coordinator.anomalies.as_dict(),
+        "fleet": coordinator.fleet.as_dict(),
+        "alarm_history": {
+            "masks": alarm_history["masks"],
+            "log": tail(alarm_history["log"], limit),
+        },
+        "request_scheduler": data.scheduler.as_dict(),
+        "commands": coordinator.commands.as_dict(),
+        "outbox": coordinator.outbox.stats(),
+        "write_propagation": coordinator.propagation.as_dict(
+            REGULAR_INTERVAL.total_seconds()
+        ),
+        "refresh_plan": coordinator.refresh_plan.as_dict(),
+        "refreshes": coordinator.refresh_metrics.as_dict(),
+        "metrics": (
+            None if coordinator.exposition is None else coordinator.exposition.as_dict()
+        ),
+        "property_responses": coordinator.http_cache.metrics.as_dict(),
+        "recorder": {
+            "efficiency_mode": coordinator.recorder_efficiency,
+            "entities": head(coordinator.state_writes.report().items(), limit),
+        },
+        "capture": None if data.capture is None else data.capture.as_dict(),
+        "archive": (
+            None if coordinator.archive is None else coordinator.archive.as_dict()
+        ),
+    }
+    return {
+        "devices": {
+            names[dsn]: device_to_dict(device)
+            for dsn, device in coordinator.data.items()
+        },
+        **async_redact_data(pseudonymize(sections, names), TO_REDACT),
     }
 
-    return async_redact_data(payload, TO_REDACT)
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: DeviceEntry
+) -> dict[str, Any]:
+    """Return complete diagnostics for a single heater."""
+    data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = data.status_coordinator
+    dsn = next(
+        (
+            identifier[1]
+            for identifier in device_entry.identifiers
+            if identifier[0] == DOMAIN
+        ),
+        None,
+    )
+    device = None if dsn is None else coordinator.data.get(dsn)
+    if device is None:
+        return {"device": None}
+
+    capabilities = coordinator.capabilities.get(dsn)
+    sections = {
+        "capabilities": (
+            {
+                "appliance_model": capabilities.model.appliance_model,
+                "heating_modes": list(capabilities.model.heating_modes),
+                "property_count": len(capabilities.property_names),
+            }
+            if capabilities is not None
+            else None
+        ),
+        "energy": (data.energy_coordinator.data or {}).get(dsn),
+        "energy_estimates": coordinator.energy_estimates.as_dict().get(dsn, {}),
+        "series": coordinator.series.as_dict().get(dsn, {}),
+        "forecast": (
+            None
+            if (forecaster := coordinator.forecasts.get(dsn)) is None
+            else forecaster.as_dict()
+        ),
+        "anomaly": (
+            None
+            if (anomaly := coordinator.anomalies.get(dsn)) is None
+            else anomaly.as_dict()
+        ),
+        "alarm_log": [row.as_dict() for row in coordinator.alarm_history.log_for(dsn)],
+    }
+    return {
+        "device": device_to_dict(device),
+        **async_redact_data(sections, TO_REDACT),
+    }
@@ -0,0 +1,193 @@
+"""Low-latency energy estimates for Bradford White Connect.
+
+``EnergyEstimator`` integrates the ``hp_power`` / ``re_power`` samples of
+each status poll and re-anchors to the cloud's daily total whenever the
+energy coordinator fetches it. Gaps longer than ``max_gap`` are not
+bridged, and within a day the estimate never decreases.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from .const import ENERGY_TYPE_HEAT_PUMP, ENERGY_TYPE_RESISTANCE
+
+# Power property (kW) feeding each energy type.
+POWER_PROPERTIES: dict[str, str] = {
+    ENERGY_TYPE_HEAT_PUMP: "hp_power",
+    ENERGY_TYPE_RESISTANCE: "re_power",
+}
+
+# Longest interval between two power samples that is still integrated.
+# Regular polls are 5 minutes apart; this tolerates one missed poll.
+DEFAULT_MAX_GAP = timedelta(minutes=12)
+
+# Hour buckets kept per estimator (enough to cover any day plus the lag).
+_KEEP_HOURS = 48
+
+_HOUR = timedelta(hours=1)
+
+
+def _floor_hour(at: datetime) -> datetime:
+    return at.replace(minute=0, second=0, microsecond=0)
+
+
+def start_of_day(at: datetime) -> datetime:
+    """Return local midnight of ``at``'s day, in ``at``'s timezone."""
+    return datetime.combine(at.date(), time(), tzinfo=at.tzinfo)
+
+
+class EnergyEstimator:
+    """Integrate one power series and anchor it to the cloud daily total."""
+
+    def __init__(self, max_gap: timedelta = DEFAULT_MAX_GAP) -> None:
+        """Initialize an estimator with no samples."""
+        self._max_gap = max_gap
+        self._buckets: dict[datetime, float] = {}
+        self._last: tuple[datetime, float] | None = None
+        self._anchor: tuple[date, float, datetime] | None = None
+        self._reported: tuple[date, float] | None = None
+        self.samples = 0
+        self.gaps = 0
+
+    def add_sample(self, at: datetime, power_kw: float | None) -> None:
+        """Record the power reading at ``at``; None breaks the series."""
+        if power_kw is None or power_kw < 0:
+            self._last = None
+            return
+        self.samples += 1
+        last = self._last
+        self._last = (at, power_kw)
+        if last is None or at <= last[0]:
+            return
+        if at - last[0] > self._max_gap:
+            self.gaps += 1
+            return
+        self._integrate(last[0], last[1], at, power_kw)
+
+    def anchor(self, day: date, cloud_kwh: float, covered_until: datetime) -> None:
+        """Adopt the cloud total for ``day`` covering energy up to ``covered_until``."""
+        self._anchor = (day, cloud_kwh, covered_until)
+
+    def value(self, now: datetime) -> float | None:
+        """Return the estimated energy used so far on ``now``'s day, in kWh."""
+        day = now.date()
+        anchor = self._anchor
+        if anchor is not None and anchor[0] == day:
+            base, since = anchor[1], anchor[2]
+        elif anchor is None and self._last is None and not self._buckets:
+            return None
+        else:
+            base, since = 0.0, start_of_day(now)
+        since_hour = _floor_hour(since)
+        estimate = base + sum(
+            kwh
+            for hour, kwh in self._buckets.items()
+            if since_hour <= hour and hour.date() == day
+        )
+        reported = self._reported
+        if reported is not None and reported[0] == day:
+            estimate = max(estimate, reported[1])
+        self._reported = (day, estimate)
+        return estimate
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "samples": self.samples,
+            "gaps": self.gaps,
+            "anchor": (
+                None
+                if self._anchor is None
+                else {
+                    "day": self._anchor[0].isoformat(),
+                    "cloud_kwh": self._anchor[1],
+                    "covered_until": self._anchor[2].isoformat(),
+                }
+            ),
+            "hours": {
+                hour.isoformat(): round(kwh, 4)
+                for hour, kwh in sorted(self._buckets.items())
+            },
+        }
+
+    def _integrate(self, t0: datetime, p0: float, t1: datetime, p1: float) -> None:
+        """Add the trapezoid between two samples, split at hour boundaries."""
+        span = (t1 - t0).total_seconds()
+        slope = (p1 - p0) / span
+        start = t0
+        while start < t1:
+            hour = _floor_hour(start)
+            end = min(hour + _HOUR, t1)
+            power_start = p0 + slope * (start - t0).total_seconds()
+            power_end = p0 + slope * (end - t0).total_seconds()
+            kwh = (power_start + power_end) / 2 * (end - start).total_seconds() / 3600
+            self._buckets[hour] = self._buckets.get(hour, 0.0) + kwh
+            start = end
+        cutoff = _floor_hour(t1) - timedelta(hours=_KEEP_HOURS)
+        for hour in [hour for hour in self._buckets if hour < cutoff]:
+            del self._buckets[hour]
+
+
+class EnergyEstimates:
+    """``EnergyEstimator`` per ``(dsn, energy_type)`` for an account."""
+
+    def __init__(self, max_gap: timedelta = DEFAULT_MAX_GAP) -> None:
+        """Initialize an empty collection."""
+        self._max_gap = max_gap
+        self._estimators: dict[tuple[str, str], EnergyEstimator] = {}
+
+    def _estimator(self, dsn: str, energy_type: str) -> EnergyEstimator:
+        key = (dsn, energy_type)
+        estimator = self._estimators.get(key)
+        if estimator is None:
+            estimator = self._estimators[key] = EnergyEstimator(self._max_gap)
+        return estimator
+
+    def add_samples(
+        self, dsn: str, at: datetime, power_kw: Mapping[str, float | None]
+    ) -> None:
+        """Record one status poll's power readings, keyed by energy type."""
+        for energy_type, power in power_kw.items():
+            self._estimator(dsn, energy_type).add_sample(at, power)
+
+    def anchor(
+        self,
+        dsn: str,
+        energy_type: str,
+        day: date,
+        cloud_kwh: float,
+        covered_until: datetime,
+    ) -> None:
+        """Re-anchor one series to a cloud daily total."""
+        self._estimator(dsn, energy_type).anchor(day, cloud_kwh, covered_until)
+
+    def anchor_all(
+        self,
+        usage_by_dsn: Mapping[str, Mapping[str, float]],
+        day: date,
+        covered_until: datetime,
+    ) -> None:
+        """Re-anchor every series to a fetch of cloud daily totals."""
+        for dsn, usage in usage_by_dsn.items():
+            for energy_type, cloud_kwh in usage.items():
+                self.anchor(dsn, energy_type, day, cloud_kwh, covered_until)
+
+    def value(self, dsn: str, energy_type: str, now: datetime) -> float | None:
+        """Return the estimate for one series, or None if nothing is known."""
+        estimator = self._estimators.get((dsn, energy_type))
+        return None if estimator is None else estimator.value(now)
+
+    def forget(self, dsn: str) -> None:
+        """Drop every series for a device that left the account."""
+        for key in [key for key in self._estimators if key[0] == dsn]:
+            del self._estimators[key]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        data: dict[str, Any] = {}
+        for (dsn, energy_type), estimator in self._estimators.items():
+            data.setdefault(dsn, {})[energy_type] = estimator.as_dict()
+        return data
@@ -0,0 +1,195 @@
+"""Import hourly energy history into Home Assistant long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from bradford_white_connect_client import (
+    BradfordWhiteConnectAuthenticationError,
+    BradfordWhiteConnectClient,
+    BradfordWhiteConnectUnknownException,
+)
+from bradford_white_connect_client.types import Device
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from .const import DOMAIN, ENERGY_TYPE_HEAT_PUMP, ENERGY_TYPE_RESISTANCE
+from .energy_history import (
+    ENERGY_API_TYPES,
+    HourlySeries,
+    floor_hour,
+    hourly_buckets,
+    parse_datapoints,
+    statistic_id,
+)
+from .scheduler import RequestPriority
+
+if TYPE_CHECKING:
+    from .scheduler import RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+_DATAPOINTS_URL = "https://ads-field.aylanetworks.com/apiv1/dsns/{dsn}/properties/{prefix}_energy/datapoints"
+
+# How far back the first import for a series reaches.
+_BACKFILL = timedelta(days=30)
+
+# Datapoints per page when fetching history (one per hour).
+_PAGE_SIZE = 100
+
+# Failures that skip a series until the next energy refresh.
+_IMPORT_ERRORS = (
+    BradfordWhiteConnectAuthenticationError,
+    BradfordWhiteConnectUnknownException,
+    aiohttp.ClientError,
+    TimeoutError,
+)
+
+_ENERGY_NAMES = {
+    ENERGY_TYPE_HEAT_PUMP: "heat pump energy",
+    ENERGY_TYPE_RESISTANCE: "resistance energy",
+}
+
+
+class EnergyStatisticsImporter:
+    """Keep one external statistic per heater and energy type up to date."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: BradfordWhiteConnectClient,
+        scheduler: RequestScheduler,
+    ) -> None:
+        """Initialize the importer; series are resumed lazily from the recorder."""
+        self.hass = hass
+        self.client = client
+        self.scheduler = scheduler
+        self._series: dict[str, HourlySeries] = {}
+        self.rows_imported = 0
+
+    async def async_import(self, devices: list[Device]) -> None:
+        """Fetch the hours each series is missing and import them in bulk.
+
+        Runs as a background task after an energy refresh. Failures are
+        logged and retried after the next one.
+        """
+        now = dt_util.utcnow()
+        for device in devices:
+            for energy_type, prefix in ENERGY_API_TYPES.items():
+                try:
+                    await self._async_import_series(device, energy_type, prefix, now)
+                except _IMPORT_ERRORS as err:
+                    _LOGGER.warning(
+                        "Could not import %s history for %s: %s",
+                        energy_type,
+                        device.dsn,
+                        err,
+                    )
+
+    async def _async_import_series(
+        self, device: Device, energy_type: str, prefix: str, now: datetime
+    ) -> None:
+        stat_id = statistic_id(device.dsn, energy_type)
+        series = self._series.get(stat_id)
+        if series is None:
+            series = self._series[stat_id] = await self._async_resume(stat_id)
+
+        # Only completed hours are imported.
+        current_hour = floor_hour(now)
+        since = series.next_start(floor_hour(now - _BACKFILL))
+        if since >= current_hour:
+            return
+        points = await self._async_fetch_datapoints(device, prefix, since, current_hour)
+        rows = series.extend(hourly_buckets(points), before=current_hour)
+        if not rows:
+            return
+
+        metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=f"{device.product_name} {_ENERGY_NAMES[energy_type]}",
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_class=EnergyConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        async_add_external_statistics(
+            self.hass,
+            metadata,
+            [
+                StatisticData(start=row.start, state=row.state, sum=row.sum)
+                for row in rows
+            ],
+        )
+        self.rows_imported += len(rows)
+        _LOGGER.debug("Imported %s hourly rows into %s", len(rows), stat_id)
+
+    async def _async_resume(self, stat_id: str) -> HourlySeries:
+        """Continue from the newest row the recorder already has."""
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, stat_id, True, {"sum"}
+        )
+        if not (rows := last.get(stat_id)):
+            return HourlySeries()
+        row = rows[0]
+        return HourlySeries(
+            datetime.fromtimestamp(row["start"], tz=timezone.utc),
+            row.get("sum") or 0.0,
+        )
+
+    async def _async_fetch_datapoints(
+        self, device: Device, prefix: str, since: datetime, until: datetime
+    ) -> list[tuple[datetime, float]]:
+        """Page through a datapoint series, one scheduled request per page."""
+        headers = self.client.generate_headers({"accept": "application/json"})
+        params = {
+            "per_page": _PAGE_SIZE,
+            "is_forward_page": "true",
+            "paginated": "true",
+            "filter[created_at_since_date]": since.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "filter[created_at_end_date]": until.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        url: str | None = _DATAPOINTS_URL.format(dsn=device.dsn, prefix=prefix)
+        points: list[tuple[datetime, float]] = []
+        while url:
+            response = await self.scheduler.run(
+                RequestPriority.ENERGY,
+                device.dsn,
+                partial(self.client.http_get_request, url, headers, params),
+            )
+            points.extend(parse_datapoints(response.get("datapoints") or []))
+            url = response.get("next_page_url")
+        return points
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize import progress for diagnostics."""
+        return {
+            "rows_imported": self.rows_imported,
+            "series": {
+                stat_id: {
+                    "last_start": (
+                        None
+                        if series.last_start is None
+                        else series.last_start.isoformat()
+                    ),
+                    "last_sum": round(series.last_sum, 3),
+                }
+                for stat_id, series in self._series.items()
+            },
+        }
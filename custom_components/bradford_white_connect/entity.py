@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TypeVar
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, TypeVar
 
 from bradford_white_connect_client import BradfordWhiteConnectClient
 from bradford_white_connect_client.types import Device
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import EntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .capabilities import DeviceCapabilities
 from .const import DOMAIN
 from .coordinator import (
     BradfordWhiteConnectEnergyCoordinator,
@@ -20,6 +25,87 @@ _BradfordWhiteConnectCoordinatorT = TypeVar(
     "_BradfordWhiteConnectCoordinatorT", bound=BradfordWhiteConnectStatusCoordinator
 )
 
+EntityFactory = Callable[[str, Device, DeviceCapabilities], Iterable[Entity]]
+
+
+def described_entity_factory(
+    coordinator: BradfordWhiteConnectStatusCoordinator,
+    entity_cls: Callable[..., Entity],
+    descriptions: Sequence[Any],
+) -> EntityFactory:
+    """Build an ``EntityFactory`` for a platform's description tuple.
+
+    Every BW description carries a ``supported_fn(capabilities)``; this
+    creates one ``entity_cls(coordinator, dsn, device, description)`` per
+    description the device supports. The descriptions are also registered
+    with the coordinator's refresh plan so each property is polled at the
+    cadence its entity category calls for.
+    """
+    coordinator.refresh_plan.register_descriptions(descriptions)
+
+    def _factory(
+        dsn: str, device: Device, capabilities: DeviceCapabilities
+    ) -> list[Entity]:
+        return [
+            entity_cls(coordinator, dsn, device, description)
+            for description in descriptions
+            if description.supported_fn(capabilities)
+        ]
+
+    return _factory
+
+
+@callback
+def async_add_status_entities(
+    entry: ConfigEntry,
+    coordinator: BradfordWhiteConnectStatusCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: EntityFactory,
+) -> None:
+    """Add a platform's entities now and whenever the capability index grows.
+
+    ``entity_factory(dsn, device, capabilities)`` returns the entities a
+    device should have. It runs once per device at setup, and afterwards
+    only for devices whose ``DeviceCapabilities`` object changed (new
+    DSN, or a property that started being reported), which the
+    coordinator's ``CapabilityIndex.version`` tells us in O(1) on every
+    refresh. Entities whose ``unique_id`` was already added are skipped.
+
+    Removing entities is not handled here: when the coordinator retires a
+    DSN, ``__init__`` removes its device from the device registry, which
+    takes the entities with it. We only forget what we added for retired
+    DSNs so the heater gets fresh entities if it ever comes back.
+    """
+    added: dict[str, set[str | None]] = {}
+    seen: dict[str, DeviceCapabilities] = {}
+    seen_version: int | None = None
+
+    @callback
+    def _async_add_new_entities() -> None:
+        nonlocal seen_version
+        index = coordinator.capabilities
+        if index.version == seen_version:
+            return
+        seen_version = index.version
+        for dsn in [dsn for dsn in seen if dsn not in coordinator.inventory]:
+            del seen[dsn]
+            added.pop(dsn, None)
+        new_entities: list[Entity] = []
+        for dsn, capabilities in index.items():
+            if seen.get(dsn) is capabilities:
+                continue
+            seen[dsn] = capabilities
+            device_added = added.setdefault(dsn, set())
+            for entity in entity_factory(dsn, coordinator.data[dsn], capabilities):
+                if entity.unique_id not in device_added:
+                    device_added.add(entity.unique_id)
+                    new_entities.append(entity)
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_new_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
+
 
 class BradfordWhiteConnectEntity(CoordinatorEntity[_BradfordWhiteConnectCoordinatorT]):
     """Base entity for Bradford White Connect."""
@@ -36,6 +122,24 @@ class BradfordWhiteConnectEntity(CoordinatorEntity[_BradfordWhiteConnectCoordina
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, dsn)},
         )
+        self._update_attrs()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the entity's cached ``_attr_*`` state.
+
+        Runs once at construction (HA reads capability attributes such as
+        ``supported_features`` before the entity is added) and then on
+        every coordinator update, so the many property reads HA makes per
+        state write are plain attribute lookups. Subclasses that set
+        anything this reads must do so before calling ``__init__``.
+        """
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state, then write it."""
+        self._update_attrs()
+        self.async_write_ha_state()
 
     @property
     def client(self) -> BradfordWhiteConnectClient:
@@ -55,10 +159,57 @@ class BradfordWhiteConnectStatusEntity(
     devices that are reachable; it is exposed as a diagnostic sensor instead.
     """
 
+    # Smallest numeric change worth recording in recorder-efficiency mode.
+    _state_deadband: float | None = None
+
+    # Whether ``_update_attrs`` reads nothing but this entity's device. The
+    # coordinator reuses an unchanged device object across snapshots, so
+    # such entities skip recomputing when their device ``is`` the one they
+    # last rendered.
+    _attrs_from_device = True
+
+    @property
+    def available(self) -> bool:
+        """Return False while the device is missing from the latest refresh."""
+        return super().available and self._dsn in self.coordinator.data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless recorder-efficiency mode deems the change too small."""
+        device = self.coordinator.data.get(self._dsn)
+        if not self._attrs_from_device or (
+            device is not None and device is not self._device
+        ):
+            self._update_attrs()
+        coordinator = self.coordinator
+        if coordinator.state_writes.should_write(
+            self.entity_id,
+            self.state,
+            self.available,
+            self._state_deadband if coordinator.recorder_efficiency else None,
+        ):
+            self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop this entity's recorder accounting."""
+        await super().async_will_remove_from_hass()
+        self.coordinator.state_writes.forget(self.entity_id)
+
     @property
     def device(self) -> Device:
-        """Shortcut to get the device from the coordinator data."""
-        return self.coordinator.data[self._dsn]
+        """Shortcut to get the device from the coordinator's current snapshot.
+
+        Falls back to the last device object we saw while the DSN is
+        briefly missing from the account (see ``DeviceInventory``), so
+        capability attributes HA reads even for unavailable entities keep
+        working. Snapshot devices are never modified, so the fallback is
+        a consistent view of the last refresh that had it.
+        """
+        device = self.coordinator.data.get(self._dsn)
+        if device is None:
+            return self._device
+        self._device = device
+        return device
 
 
 class BradfordWhiteConnectDescribedStatusEntity(BradfordWhiteConnectStatusEntity):
@@ -82,17 +233,71 @@ class BradfordWhiteConnectDescribedStatusEntity(BradfordWhiteConnectStatusEntity
         description: EntityDescription,
     ) -> None:
         """Initialize the entity from a shared description."""
-        super().__init__(coordinator, dsn, device)
         self.entity_description = description
+        super().__init__(coordinator, dsn, device)
         self._attr_unique_id = f"{dsn}_{description.key}"
 
 
+class BradfordWhiteConnectFleetEntity(
+    CoordinatorEntity[BradfordWhiteConnectStatusCoordinator]
+):
+    """Account-level entity on the config entry's hub device.
+
+    Reads the coordinator's ``FleetAggregates`` instead of one heater, and
+    only recomputes and writes its state when the aggregates' ``version``
+    (or the coordinator's availability) moved.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: BradfordWhiteConnectStatusCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        entry = coordinator.config_entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="Bradford White",
+            model="Connect account",
+            name=entry.title,
+        )
+        self._rendered = (coordinator.fleet.version, coordinator.last_update_success)
+        self._update_attrs()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the entity's cached ``_attr_*`` state from the aggregates."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state and write it, if anything moved."""
+        coordinator = self.coordinator
+        rendered = (coordinator.fleet.version, coordinator.last_update_success)
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
+        self._update_attrs()
+        self.async_write_ha_state()
+
+
 class BradfordWhiteConnectEnergyEntity(
     BradfordWhiteConnectEntity[BradfordWhiteConnectEnergyCoordinator]
 ):
     """Base entity for entities that use data from the energy coordinator."""
 
     @property
-    def energy_usage(self) -> float:
+    def available(self) -> bool:
+        """Return False until the energy coordinator has data for this device.
+
+        Devices discovered after setup get their entities immediately, but
+        the energy endpoint only catches up on its next (slower) refresh.
+        """
+        return super().available and self._dsn in (self.coordinator.data or {})
+
+    _energy_type: str
+
+    @property
+    def energy_usage(self) -> float | None:
         """Shortcut to get the energy usage from the coordinator data."""
-        return self.coordinator.data[self._dsn][self._energy_type]
+        usage = (self.coordinator.data or {}).get(self._dsn)
+        return None if usage is None else usage[self._energy_type]
@@ -25,10 +25,16 @@ The convention used for the tentative F-code labels is
 This module also owns the small ``decode_alarm_bitmap_state`` /
 ``decode_alarm_bitmap_attributes`` adapters that the sensor platform
 uses, so the bitmap-rendering logic lives next to the bitmap itself.
+Both adapters share one memoized ``decode_alarm`` result: the bitmap
+changes rarely, but HA asks for the state and attributes on every state
+write, so we decode each distinct bitmap once and hand out the same
+immutable ``DecodedAlarm`` afterwards.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from bradford_white_connect_client.constants import BradfordWhiteConnectHeatingModes
@@ -76,6 +82,118 @@ DESCRIPTION_SOURCE: str = (
 )
 
 
+# Widest bitmap we precompute labels for. The cloud currently reports 40
+# slots; a little headroom keeps a firmware that grows the field on the
+# table-driven path instead of the fallback.
+_MAX_ALARM_BITS = 64
+
+# Per-bit tentative code / description, indexed by bit position.
+_BIT_CODES: tuple[str, ...] = tuple(f"F{index + 1}" for index in range(_MAX_ALARM_BITS))
+_BIT_DESCRIPTIONS: tuple[str, ...] = tuple(
+    FAULT_CODES.get(index + 1, f"Unknown fault (bit {index})")
+    for index in range(_MAX_ALARM_BITS)
+)
+_BIT_LABELS: tuple[str, ...] = tuple(
+    f"{code}: {description}"
+    for code, description in zip(_BIT_CODES, _BIT_DESCRIPTIONS, strict=True)
+)
+
+# Distinct bitmaps a heater cycles through are few; this comfortably
+# covers a multi-heater account without letting a misbehaving device
+# that reports garbage grow the cache without bound.
+_DECODE_CACHE_SIZE = 128
+
+
+def fault_code_for_bit(index: int) -> str:
+    """Return the tentative F-code label for a bit position."""
+    return _BIT_CODES[index] if index < _MAX_ALARM_BITS else f"F{index + 1}"
+
+
+def fault_description_for_bit(index: int) -> str:
+    """Return the tentative description for a bit position."""
+    if index < _MAX_ALARM_BITS:
+        return _BIT_DESCRIPTIONS[index]
+    return FAULT_CODES.get(index + 1, f"Unknown fault (bit {index})")
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedAlarm:
+    """Immutable decode of one ``alarm`` bitmap, shared by state and attributes."""
+
+    raw_bitmap: str | None
+    active_bits: tuple[int, ...]
+    tentative_codes: tuple[str, ...]
+    tentative_labels: tuple[str, ...]
+    state: str
+
+    @property
+    def is_clear(self) -> bool:
+        """Return True when no alarm bit is set."""
+        return not self.active_bits
+
+    def as_attributes(self) -> dict[str, Any]:
+        """Render the ``extra_state_attributes`` dict for the alarm sensor."""
+        return {
+            "raw_bitmap": self.raw_bitmap,
+            "active_bits": list(self.active_bits),
+            "tentative_codes": list(self.tentative_codes),
+            "tentative_descriptions": list(self.tentative_labels),
+            "description_source": DESCRIPTION_SOURCE,
+        }
+
+
+_NO_ALARM = DecodedAlarm(
+    raw_bitmap=None, active_bits=(), tentative_codes=(), tentative_labels=(), state="OK"
+)
+
+
+@lru_cache(maxsize=_DECODE_CACHE_SIZE)
+def _decode_alarm_cached(bitmap: str) -> DecodedAlarm:
+    if "1" not in bitmap:
+        # Fast path for the overwhelmingly common healthy heater.
+        return DecodedAlarm(
+            raw_bitmap=bitmap,
+            active_bits=(),
+            tentative_codes=(),
+            tentative_labels=(),
+            state="OK",
+        )
+    active_bits = tuple(index for index, char in enumerate(bitmap) if char == "1")
+    codes = tuple(fault_code_for_bit(index) for index in active_bits)
+    labels = tuple(
+        (
+            f"{code}: {fault_description_for_bit(index)}"
+            if index >= _MAX_ALARM_BITS
+            else _BIT_LABELS[index]
+        )
+        for index, code in zip(active_bits, codes, strict=True)
+    )
+    state = ", ".join(
+        f"bit {index} (tentative {code})"
+        for index, code in zip(active_bits, codes, strict=True)
+    )
+    return DecodedAlarm(
+        raw_bitmap=bitmap,
+        active_bits=active_bits,
+        tentative_codes=codes,
+        tentative_labels=labels,
+        state=state,
+    )
+
+
+def decode_alarm(bitmap: str | None) -> DecodedAlarm:
+    """Decode a bitmap into a cached, immutable ``DecodedAlarm``.
+
+    Empty/``None`` input returns a shared "no alarm" result; everything
+    else goes through a bounded LRU cache keyed by the raw string, so
+    the per-bit scan and string formatting only happen the first time a
+    given bitmap is seen.
+    """
+    if not bitmap:
+        return _NO_ALARM
+    return _decode_alarm_cached(bitmap)
+
+
 def decode_alarm_bitmap(bitmap: str | None) -> list[dict[str, str | int]]:
     """Decode a 40-char bitmap into a list of active fault bits.
 
@@ -85,22 +203,17 @@ def decode_alarm_bitmap(bitmap: str | None) -> list[dict[str, str | int]]:
     description are best-guess from the older RE2H50/80 manual. The
     list is empty if no bits are set or the input is empty/None.
     """
-    if not bitmap:
-        return []
-    active: list[dict[str, str | int]] = []
-    for index, char in enumerate(bitmap):
-        if char != "1":
-            continue
-        fault_number = index + 1
-        description = FAULT_CODES.get(fault_number, f"Unknown fault (bit {index})")
-        active.append(
-            {
-                "bit": index,
-                "tentative_code": f"F{fault_number}",
-                "tentative_description": description,
-            }
+    decoded = decode_alarm(bitmap)
+    return [
+        {
+            "bit": index,
+            "tentative_code": code,
+            "tentative_description": fault_description_for_bit(index),
+        }
+        for index, code in zip(
+            decoded.active_bits, decoded.tentative_codes, strict=True
         )
-    return active
+    ]
 
 
 def heat_mode_to_name(value: int | None) -> str | None:
@@ -120,23 +233,9 @@ def decode_alarm_bitmap_state(bitmap: str | None) -> str:
     surfaced as a tentative attribute instead via
     ``decode_alarm_bitmap_attributes``.
     """
-    active = decode_alarm_bitmap(bitmap)
-    if not active:
-        return "OK"
-    return ", ".join(
-        f"bit {a['bit']} (tentative {a['tentative_code']})" for a in active
-    )
+    return decode_alarm(bitmap).state
 
 
 def decode_alarm_bitmap_attributes(bitmap: str | None) -> dict[str, Any]:
     """Expose the raw bitmap, bit indices, and tentative descriptions."""
-    active = decode_alarm_bitmap(bitmap)
-    return {
-        "raw_bitmap": bitmap,
-        "active_bits": [a["bit"] for a in active],
-        "tentative_codes": [a["tentative_code"] for a in active],
-        "tentative_descriptions": [
-            f"{a['tentative_code']}: {a['tentative_description']}" for a in active
-        ],
-        "description_source": DESCRIPTION_SOURCE,
-    }
+    return decode_alarm(bitmap).as_attributes()
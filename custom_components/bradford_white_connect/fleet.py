@@ -0,0 +1,177 @@
+"""Account-level aggregates for Bradford White Connect.
+
+``FleetAggregates`` keeps a ``Contribution`` per heater and running
+totals of power, daily energy, heat modes and errors, updated only for
+the heaters that changed on a refresh. Power and energy are summed as
+integer millionths so the totals never drift.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from .fault_codes import HEAT_MODE_OPTIONS, heat_mode_to_name
+
+# Heaters on an account before the account-level sensors are created.
+MIN_HEATERS = 2
+
+# Fixed-point scale of the power and energy sums.
+_SCALE = 1_000_000
+
+
+def _scaled(properties: Mapping[str, Any], name: str) -> int | None:
+    prop = properties.get(name)
+    try:
+        value = float(prop.value)  # type: ignore[union-attr]
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return round(value * _SCALE) if math.isfinite(value) else None
+
+
+def _truthy(properties: Mapping[str, Any], name: str) -> bool:
+    value = getattr(properties.get(name), "value", None)
+    if value is None:
+        return False
+    try:
+        return int(value) == 1
+    except (TypeError, ValueError):
+        return bool(value)
+
+
+def _heat_mode(properties: Mapping[str, Any]) -> str | None:
+    try:
+        return heat_mode_to_name(
+            getattr(properties.get("current_heat_mode"), "value", None)
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Contribution:
+    """What one heater adds to the account totals."""
+
+    hp_power: int | None
+    re_power: int | None
+    daily_energy: int | None
+    heat_mode: str | None
+    error: bool
+
+    @classmethod
+    def from_device(cls, device: Any) -> Contribution:
+        """Read a heater's contribution from its properties."""
+        properties = getattr(device, "properties", None) or {}
+        return cls(
+            _scaled(properties, "hp_power"),
+            _scaled(properties, "re_power"),
+            _scaled(properties, "daily_total_energy"),
+            _heat_mode(properties),
+            _truthy(properties, "global_error"),
+        )
+
+
+class FleetAggregates:
+    """Running account totals, updated from per-heater diffs."""
+
+    def __init__(self) -> None:
+        """Initialize with no heaters."""
+        self._contributions: dict[str, Contribution] = {}
+        self._hp_power = 0
+        self._re_power = 0
+        self._energy = 0
+        # Heaters reporting power / energy; a total over none is unknown.
+        self._power_reporting = 0
+        self._energy_reporting = 0
+        self._modes: Counter[str] = Counter()
+        self._errors = 0
+        # Increases whenever any total changes.
+        self.version = 0
+
+    def _apply(self, contribution: Contribution, sign: int) -> None:
+        if contribution.hp_power is not None or contribution.re_power is not None:
+            self._power_reporting += sign
+        self._hp_power += sign * (contribution.hp_power or 0)
+        self._re_power += sign * (contribution.re_power or 0)
+        if contribution.daily_energy is not None:
+            self._energy_reporting += sign
+            self._energy += sign * contribution.daily_energy
+        if contribution.heat_mode is not None:
+            self._modes[contribution.heat_mode] += sign
+        self._errors += sign * contribution.error
+
+    def update(self, devices: Mapping[str, Any], dsns: Iterable[str]) -> bool:
+        """Re-read the heaters in ``dsns`` from ``{dsn: Device}``.
+
+        Heaters missing from ``devices`` are dropped. Returns True if any
+        total changed.
+        """
+        changed = False
+        for dsn in dsns:
+            old = self._contributions.pop(dsn, None)
+            device = devices.get(dsn)
+            new = None if device is None else Contribution.from_device(device)
+            if new is not None:
+                self._contributions[dsn] = new
+            if new == old:
+                continue
+            if old is not None:
+                self._apply(old, -1)
+            if new is not None:
+                self._apply(new, 1)
+            changed = True
+        if changed:
+            self.version += 1
+        return changed
+
+    @property
+    def heaters(self) -> int:
+        """Return the number of heaters on the account."""
+        return len(self._contributions)
+
+    @property
+    def hp_power(self) -> float | None:
+        """Return the heat pumps' combined power (kW)."""
+        return self._hp_power / _SCALE if self._power_reporting else None
+
+    @property
+    def re_power(self) -> float | None:
+        """Return the resistance elements' combined power (kW)."""
+        return self._re_power / _SCALE if self._power_reporting else None
+
+    @property
+    def power(self) -> float | None:
+        """Return the account's total instantaneous power (kW)."""
+        if not self._power_reporting:
+            return None
+        return (self._hp_power + self._re_power) / _SCALE
+
+    @property
+    def daily_energy(self) -> float | None:
+        """Return the energy all heaters reported using today (kWh)."""
+        return self._energy / _SCALE if self._energy_reporting else None
+
+    @property
+    def errors(self) -> int:
+        """Return the number of heaters with ``global_error`` set."""
+        return self._errors
+
+    def mode_count(self, mode: str) -> int:
+        """Return the number of heaters currently in ``mode``."""
+        return self._modes[mode]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "version": self.version,
+            "heaters": self.heaters,
+            "power_kw": self.power,
+            "hp_power_kw": self.hp_power,
+            "re_power_kw": self.re_power,
+            "daily_energy_kwh": self.daily_energy,
+            "modes": {mode: self._modes[mode] for mode in HEAT_MODE_OPTIONS},
+            "errors": self.errors,
+        }
@@ -0,0 +1,205 @@
+"""Hot-water availability forecasts for Bradford White Connect.
+
+``CapacityForecaster`` tracks the tank's fill fraction, decides whether
+it is recovering, drawing or idle from its recent slope, and learns
+separate recovery and draw rates to estimate the time until the tank is
+full or depleted. Times are seconds.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from enum import StrEnum
+import math
+from typing import Any
+
+from .timeseries import SampleBuffer
+
+# Window of fill-fraction samples the phase is read from.
+PHASE_WINDOW = 15 * 60.0
+
+# Fill-fraction slope (per hour) below which the tank counts as idle. Well
+# above standby losses, which whole-percent readings make look jumpy.
+IDLE_RATE = 0.1
+
+# Time constant of the learned recovery / draw rates.
+RATE_TIME_CONSTANT = 1800.0
+
+# Longest step between two samples that still teaches a rate.
+DEFAULT_MAX_GAP = 12 * 60.0
+
+# Fill fractions treated as full / empty.
+FULL = 0.99
+EMPTY = 0.01
+
+# Forecasts further out than this are reported as unknown.
+MAX_HORIZON = 24 * 3600.0
+
+
+class Phase(StrEnum):
+    """What the tank is doing right now."""
+
+    RECOVERING = "recovering"
+    DRAWING = "drawing"
+    IDLE = "idle"
+
+
+def fill_fraction(properties: Mapping[str, Any] | None) -> float | None:
+    """Return how full of hot water the tank is, from 0 to 1.
+
+    Prefers ``available_thermal_capacity`` (a percentage) and falls back
+    to ``stored_thermal_capacity / max_thermal_capacity``.
+    """
+    properties = properties or {}
+
+    def _value(name: str) -> float | None:
+        prop = properties.get(name)
+        try:
+            value = float(prop.value)  # type: ignore[union-attr]
+        except (AttributeError, TypeError, ValueError):
+            return None
+        return value if math.isfinite(value) else None
+
+    if (available := _value("available_thermal_capacity")) is not None:
+        return min(max(available / 100, 0.0), 1.0)
+    stored = _value("stored_thermal_capacity")
+    maximum = _value("max_thermal_capacity")
+    if stored is None or not maximum or maximum <= 0:
+        return None
+    return min(max(stored / maximum, 0.0), 1.0)
+
+
+class CapacityForecaster:
+    """Learn one heater's recovery and draw rates and forecast from them."""
+
+    def __init__(self, max_gap: float = DEFAULT_MAX_GAP) -> None:
+        """Initialize with nothing learned."""
+        self._max_gap = max_gap
+        self._window = SampleBuffer(max_age=PHASE_WINDOW, min_spacing=0.0)
+        self._last: tuple[float, float] | None = None
+        # Learned rates, in fraction per second (both positive).
+        self.recovery_rate: float | None = None
+        self.draw_rate: float | None = None
+        self.samples = 0
+
+    @staticmethod
+    def _blend(rate: float | None, observed: float, dt: float) -> float:
+        if rate is None:
+            return observed
+        alpha = 1 - math.exp(-dt / RATE_TIME_CONSTANT)
+        return rate + alpha * (observed - rate)
+
+    def update(self, at: float, fraction: float | None) -> None:
+        """Record the fill fraction at ``at``; None breaks the series."""
+        if fraction is None:
+            self._last = None
+            return
+        last = self._last
+        self._last = (at, fraction)
+        self.samples += 1
+        self._window.append(at, fraction)
+        if last is None:
+            return
+        dt = at - last[0]
+        if dt <= 0 or dt > self._max_gap:
+            return
+        step = (fraction - last[1]) / dt
+        if step * 3600 > IDLE_RATE:
+            self.recovery_rate = self._blend(self.recovery_rate, step, dt)
+        elif step * 3600 < -IDLE_RATE:
+            self.draw_rate = self._blend(self.draw_rate, -step, dt)
+
+    @property
+    def fraction(self) -> float | None:
+        """Return the latest fill fraction."""
+        return None if self._last is None else self._last[1]
+
+    @property
+    def phase(self) -> Phase:
+        """Return whether the tank is recovering, being drawn from or idle."""
+        slope = self._window.slope()
+        if slope is None or abs(slope * 3600) <= IDLE_RATE:
+            return Phase.IDLE
+        return Phase.RECOVERING if slope > 0 else Phase.DRAWING
+
+    @staticmethod
+    def _horizon(amount: float, rate: float | None) -> float | None:
+        if rate is None or rate <= 0:
+            return None
+        seconds = amount / rate
+        return None if seconds > MAX_HORIZON else seconds
+
+    def time_until_full(self) -> float | None:
+        """Return seconds until the tank is full, while it is recovering."""
+        fraction = self.fraction
+        if fraction is None:
+            return None
+        if fraction >= FULL:
+            return 0.0
+        if self.phase is not Phase.RECOVERING:
+            return None
+        return self._horizon(FULL - fraction, self.recovery_rate)
+
+    def time_until_depleted(self) -> float | None:
+        """Return seconds until hot water runs out, while it is being drawn."""
+        fraction = self.fraction
+        if fraction is None:
+            return None
+        if fraction <= EMPTY:
+            return 0.0
+        if self.phase is not Phase.DRAWING:
+            return None
+        return self._horizon(fraction - EMPTY, self.draw_rate)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize for diagnostics."""
+
+        def _per_hour(rate: float | None) -> float | None:
+            return None if rate is None else round(rate * 3600, 4)
+
+        def _rounded(seconds: float | None) -> float | None:
+            return None if seconds is None else round(seconds, 1)
+
+        return {
+            "samples": self.samples,
+            "fraction": self.fraction,
+            "phase": self.phase.value,
+            "recovery_per_h": _per_hour(self.recovery_rate),
+            "draw_per_h": _per_hour(self.draw_rate),
+            "until_full_s": _rounded(self.time_until_full()),
+            "until_depleted_s": _rounded(self.time_until_depleted()),
+        }
+
+
+class CapacityForecasts:
+    """``CapacityForecaster`` per heater for an account."""
+
+    def __init__(self, max_gap: float = DEFAULT_MAX_GAP) -> None:
+        """Initialize an empty collection."""
+        self._max_gap = max_gap
+        self._forecasters: dict[str, CapacityForecaster] = {}
+
+    def update(self, dsn: str, at: float, properties: Mapping[str, Any] | None) -> bool:
+        """Feed one poll's ``{name: Property}``; return True if it had a reading."""
+        fraction = fill_fraction(properties)
+        forecaster = self._forecasters.get(dsn)
+        if forecaster is None:
+            if fraction is None:
+                return False
+            forecaster = self._forecasters[dsn] = CapacityForecaster(self._max_gap)
+        forecaster.update(at, fraction)
+        return fraction is not None
+
+    def get(self, dsn: str) -> CapacityForecaster | None:
+        """Return the forecaster for a heater, if it has reported a capacity."""
+        return self._forecasters.get(dsn)
+
+    def forget(self, dsn: str) -> None:
+        """Drop the forecaster for a device that left the account."""
+        self._forecasters.pop(dsn, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            dsn: forecaster.as_dict() for dsn, forecaster in self._forecasters.items()
+        }
@@ -7,11 +7,14 @@ how we read from / introspect ``Device.properties`` in one place.
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from bradford_white_connect_client.types import Device
 
+if TYPE_CHECKING:
+    from .capabilities import DeviceCapabilities
+
 
 def get_device_property_value(device: Device, property_name: str) -> Any:
     """Return ``device.properties[property_name].value`` if present, else ``None``.
@@ -29,14 +32,26 @@ def get_device_property_value(device: Device, property_name: str) -> Any:
     return getattr(prop, "value", None)
 
 
-def has_property(name: str) -> Callable[[Device], bool]:
-    """Build a ``supported_fn(device) -> bool`` that checks a property's presence.
+@dataclass(frozen=True, slots=True)
+class PropertyCheck:
+    """``supported_fn(capabilities) -> bool`` for one property's presence.
 
-    Returns ``False`` (rather than raising) when ``device.properties`` is
-    ``None`` so platform setup can call it unconditionally.
+    Keeping the name on the check (rather than in a closure) lets the
+    refresh planner tell which property a description reads.
     """
 
-    def _check(device: Device) -> bool:
-        return name in (getattr(device, "properties", None) or {})
+    property_name: str
+
+    def __call__(self, capabilities: DeviceCapabilities) -> bool:
+        """Return True if the device reports the property."""
+        return self.property_name in capabilities.property_names
+
 
-    return _check
+def has_property(name: str) -> PropertyCheck:
+    """Build a ``supported_fn(capabilities) -> bool`` that checks a property's presence.
+
+    The check runs against the coordinator's precomputed
+    ``DeviceCapabilities.property_names`` set rather than the device's
+    property dict, so platform setup is a set lookup per description.
+    """
+    return PropertyCheck(name)
@@ -0,0 +1,139 @@
+"""Conditional-request cache for Bradford White Connect property polling.
+
+``ConditionalCache`` replays ``ETag`` / ``Last-Modified`` validators and
+remembers a digest of each response body, so an unchanged property list
+returns the previously parsed payload object instead of being decoded
+again. ``ResponseMetrics`` counts the bytes and parse time involved.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import hashlib
+import time
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+# Requests are keyed per device and per property subset, so a handful of
+# entries per heater is plenty.
+DEFAULT_MAX_ENTRIES = 64
+
+
+@dataclass(slots=True)
+class ResponseMetrics:
+    """Counters for conditional property requests."""
+
+    requests: int = 0
+    not_modified: int = 0
+    unchanged_body: int = 0
+    parsed: int = 0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    parse_cpu_s: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "unchanged_body": self.unchanged_body,
+            "parsed": self.parsed,
+            "wire_bytes": self.wire_bytes,
+            "body_bytes": self.body_bytes,
+            "parse_cpu_s": round(self.parse_cpu_s, 4),
+        }
+
+
+@dataclass(slots=True)
+class _Entry:
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    payload: Any
+
+
+def _digest(body: bytes) -> bytes:
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class ConditionalCache:
+    """Validators, body digests and parsed payloads per request key."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self.metrics = ResponseMetrics()
+
+    def request_headers(self, key: Hashable) -> dict[str, str]:
+        """Return the conditional headers to send for ``key``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, key: Hashable) -> Any:
+        """Handle a ``304`` for ``key`` and return the cached payload.
+
+        Raises ``KeyError`` if nothing is cached for ``key``, which only
+        happens if the server answers 304 to an unconditional request.
+        """
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        self.metrics.requests += 1
+        self.metrics.not_modified += 1
+        return entry.payload
+
+    def resolve(
+        self,
+        key: Hashable,
+        body: bytes,
+        parse: Callable[[bytes], _T],
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        wire_bytes: int | None = None,
+    ) -> tuple[_T, bool]:
+        """Return ``(payload, changed)`` for a ``200`` response body.
+
+        ``wire_bytes`` is the (possibly compressed) ``Content-Length``;
+        it defaults to the decoded body size when the server streamed
+        the response without one.
+        """
+        metrics = self.metrics
+        metrics.requests += 1
+        metrics.body_bytes += len(body)
+        metrics.wire_bytes += len(body) if wire_bytes is None else wire_bytes
+
+        digest = _digest(body)
+        entry = self._entries.get(key)
+        if entry is not None and entry.digest == digest:
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+            self._entries.move_to_end(key)
+            metrics.unchanged_body += 1
+            return entry.payload, False
+
+        started = time.thread_time()
+        payload = parse(body)
+        metrics.parse_cpu_s += time.thread_time() - started
+        metrics.parsed += 1
+
+        self._entries[key] = _Entry(etag, last_modified, digest, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return payload, True
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the entries whose key matches ``predicate``."""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
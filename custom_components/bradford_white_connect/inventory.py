@@ -0,0 +1,74 @@
+"""Account device inventory tracking for Bradford White Connect.
+
+``DeviceInventory`` turns successive device listings into the DSNs that
+joined and the ones to retire. A heater missing from a response is only
+retired after ``stale_after`` consecutive successful refreshes without
+it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+# Consecutive refreshes a DSN may be absent before it is retired.
+DEFAULT_STALE_AFTER = 3
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryChange:
+    """DSNs that joined or were retired in one refresh."""
+
+    added: frozenset[str] = field(default_factory=frozenset)
+    retired: frozenset[str] = field(default_factory=frozenset)
+
+    def __bool__(self) -> bool:
+        """Return True if the inventory changed."""
+        return bool(self.added or self.retired)
+
+
+class DeviceInventory:
+    """Track which DSNs are on the account across refreshes."""
+
+    def __init__(self, stale_after: int = DEFAULT_STALE_AFTER) -> None:
+        """Initialize an empty inventory."""
+        self._stale_after = stale_after
+        self._known: set[str] = set()
+        self._missing: dict[str, int] = {}
+        self.version = 0
+        self.last_change = InventoryChange()
+
+    def __contains__(self, dsn: object) -> bool:
+        """Return True if ``dsn`` is known (present, or missing but not retired)."""
+        return dsn in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the known DSNs."""
+        return iter(self._known)
+
+    def __len__(self) -> int:
+        """Return the number of known DSNs."""
+        return len(self._known)
+
+    def update(self, present: Iterable[str]) -> InventoryChange:
+        """Record the DSNs in the latest response and return what changed."""
+        present_set = set(present)
+        added = present_set - self._known
+        for dsn in present_set:
+            self._missing.pop(dsn, None)
+
+        retired: set[str] = set()
+        for dsn in self._known - present_set:
+            misses = self._missing.get(dsn, 0) + 1
+            if misses >= self._stale_after:
+                retired.add(dsn)
+                self._missing.pop(dsn, None)
+            else:
+                self._missing[dsn] = misses
+
+        self._known = (self._known | added) - retired
+        change = InventoryChange(frozenset(added), frozenset(retired))
+        if change:
+            self.version += 1
+        self.last_change = change
+        return change
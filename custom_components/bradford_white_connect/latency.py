@@ -0,0 +1,153 @@
+"""Write propagation latency for Bradford White Connect.
+
+``PropagationTracker`` times each write from when it is sent until a
+poll shows the written value, and keeps recent latencies per property,
+per device and overall. The coordinator sizes its post-write fast-poll
+window from them.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Mapping
+import math
+import time
+from typing import Any
+
+from .commands import same_value
+
+# Recent latencies kept per property / device / overall.
+DEFAULT_MAX_SAMPLES = 50
+
+# Samples needed before the measured distribution replaces the default.
+MIN_SAMPLES = 5
+
+# The window is the p90 latency times this margin...
+WINDOW_MARGIN = 1.5
+
+# ...but never shorter than this many seconds.
+MIN_WINDOW = 30.0
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of unsorted ``values``."""
+    ordered = sorted(values)
+    rank = min(max(math.ceil(fraction * len(ordered)), 1), len(ordered))
+    return ordered[rank - 1]
+
+
+class LatencySamples:
+    """A bounded window of latencies plus a timeout counter."""
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """Initialize an empty window."""
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+        self.timeouts = 0
+
+    def add(self, latency: float) -> None:
+        """Record one confirmed write."""
+        self.samples.append(latency)
+        self.count += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize the distribution for diagnostics."""
+        values = list(self.samples)
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "p50_s": round(percentile(values, 0.5), 1) if values else None,
+            "p90_s": round(percentile(values, 0.9), 1) if values else None,
+            "max_s": round(max(values), 1) if values else None,
+        }
+
+
+class PropagationTracker:
+    """Time writes until the cloud reports them applied."""
+
+    def __init__(
+        self,
+        timeout: float,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Give up on a write that is not reflected within ``timeout`` seconds."""
+        self._timeout = timeout
+        self._max_samples = max_samples
+        self._clock = clock
+        # (dsn, property) -> (value written, when)
+        self._pending: dict[tuple[str, str], tuple[Any, float]] = {}
+        self.overall = LatencySamples(max_samples)
+        self._by_property: dict[str, LatencySamples] = {}
+        self._by_device: dict[str, LatencySamples] = {}
+
+    def _samples(self, table: dict[str, LatencySamples], key: str) -> LatencySamples:
+        if (samples := table.get(key)) is None:
+            samples = table[key] = LatencySamples(self._max_samples)
+        return samples
+
+    def start(self, dsn: str, prop: str, value: Any) -> None:
+        """Start timing a write; a newer write to the same property restarts it."""
+        self._pending[(dsn, prop)] = (value, self._clock())
+
+    def _expire(self, now: float) -> None:
+        for key, (_, started) in list(self._pending.items()):
+            if now - started > self._timeout:
+                del self._pending[key]
+                self.overall.timeouts += 1
+                self._samples(self._by_property, key[1]).timeouts += 1
+                self._samples(self._by_device, key[0]).timeouts += 1
+
+    def observe(self, dsn: str, properties: Mapping[str, Any]) -> list[float]:
+        """Check a fresh ``{name: Property}`` snapshot; return new latencies."""
+        now = self._clock()
+        self._expire(now)
+        latencies: list[float] = []
+        for key in [key for key in self._pending if key[0] == dsn]:
+            value, started = self._pending[key]
+            prop = properties.get(key[1])
+            if prop is None or not same_value(prop.value, value):
+                continue
+            del self._pending[key]
+            latency = now - started
+            self.overall.add(latency)
+            self._samples(self._by_property, key[1]).add(latency)
+            self._samples(self._by_device, dsn).add(latency)
+            latencies.append(latency)
+        return latencies
+
+    def pending(self, dsn: str | None = None) -> int:
+        """Return how many writes are still waiting to be reflected."""
+        self._expire(self._clock())
+        if dsn is None:
+            return len(self._pending)
+        return sum(1 for key in self._pending if key[0] == dsn)
+
+    def fast_window(self, default: float) -> float:
+        """Return how long, in seconds, to fast-poll after a write."""
+        values = list(self.overall.samples)
+        if len(values) < MIN_SAMPLES:
+            return default
+        return min(
+            max(percentile(values, 0.9) * WINDOW_MARGIN, MIN_WINDOW), self._timeout
+        )
+
+    def forget(self, dsn: str) -> None:
+        """Drop pending writes and samples for a device that left the account."""
+        for key in [key for key in self._pending if key[0] == dsn]:
+            del self._pending[key]
+        self._by_device.pop(dsn, None)
+
+    def as_dict(self, default_window: float) -> dict[str, Any]:
+        """Serialize the distributions and current window for diagnostics."""
+        return {
+            "fast_window_s": round(self.fast_window(default_window), 1),
+            "pending": len(self._pending),
+            "overall": self.overall.as_dict(),
+            "by_property": {
+                name: samples.as_dict() for name, samples in self._by_property.items()
+            },
+            "by_device": {
+                dsn: samples.as_dict() for dsn, samples in self._by_device.items()
+            },
+        }
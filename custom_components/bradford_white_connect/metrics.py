@@ -0,0 +1,269 @@
+"""OpenMetrics exposition of Bradford White Connect telemetry.
+
+``OpenMetricsExposition`` renders device telemetry and integration
+health once per refresh and serves the cached body to every scrape
+until the coordinator invalidates it. Each heater's lines are cached
+against its device object, so only replaced devices are re-rendered.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from .commands import CommandLanes
+from .const import DOMAIN
+from .http_cache import ResponseMetrics
+from .outbox import Outbox
+from .scheduler import RequestScheduler
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Ayla base types whose values are exported as numbers.
+_NUMERIC_BASE_TYPES = frozenset({"integer", "decimal", "boolean"})
+
+_PROPERTY_FAMILY = f"{DOMAIN}_property"
+
+
+@dataclass(slots=True)
+class RefreshMetrics:
+    """Counters and timings for status refreshes."""
+
+    refreshes: int = 0
+    failures: int = 0
+    last_success: bool = False
+    last_duration: float = 0.0
+    total_duration: float = 0.0
+
+    def record(self, duration: float, success: bool) -> None:
+        """Count one refresh that took ``duration`` seconds."""
+        self.refreshes += 1
+        self.failures += not success
+        self.last_success = success
+        self.last_duration = duration
+        self.total_duration += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_success": self.last_success,
+            "last_duration_s": round(self.last_duration, 3),
+            "mean_duration_s": (
+                round(self.total_duration / self.refreshes, 3)
+                if self.refreshes
+                else 0.0
+            ),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class MetricFamily:
+    """One metric family: its metadata and ``(labels, value)`` samples."""
+
+    name: str
+    type: str
+    help: str
+    samples: Sequence[tuple[Mapping[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _header(name: str, metric_type: str, help_text: str) -> str:
+    return f"# TYPE {name} {metric_type}\n# HELP {name} {_escape(help_text)}\n"
+
+
+def numeric_value(prop: Any) -> float | None:
+    """Return a property's value as a number, or None if it is not numeric.
+
+    Strings are only parsed when Ayla declares the property numeric, so
+    bitmaps and version strings that happen to look like numbers are
+    left out.
+    """
+    value = prop.value
+    if isinstance(value, bool | int | float):
+        return float(value)
+    if getattr(prop, "base_type", None) in _NUMERIC_BASE_TYPES:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def render_device(dsn: str, device: Any) -> str:
+    """Render one heater's numeric properties as property family samples."""
+    lines: list[str] = []
+    for name, prop in sorted((device.properties or {}).items()):
+        if (value := numeric_value(prop)) is not None:
+            labels = _labels({"dsn": dsn, "property": name})
+            lines.append(f"{_PROPERTY_FAMILY}{labels} {_number(value)}\n")
+    return "".join(lines)
+
+
+def render_family(family: MetricFamily) -> str:
+    """Render one metric family, counters with their ``_total`` suffix."""
+    sample_name = f"{family.name}_total" if family.type == "counter" else family.name
+    return _header(family.name, family.type, family.help) + "".join(
+        f"{sample_name}{_labels(labels)} {_number(value)}\n"
+        for labels, value in family.samples
+    )
+
+
+def integration_families(
+    refresh: RefreshMetrics,
+    scheduler: RequestScheduler,
+    responses: ResponseMetrics,
+    commands: CommandLanes,
+    outbox: Outbox,
+) -> list[MetricFamily]:
+    """Collect the integration's own health metrics."""
+    return [
+        MetricFamily(
+            f"{DOMAIN}_refreshes",
+            "counter",
+            "Status refreshes attempted.",
+            [({}, refresh.refreshes)],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_refresh_failures",
+            "counter",
+            "Status refreshes that failed.",
+            [({}, refresh.failures)],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_refresh_success",
+            "gauge",
+            "Whether the latest status refresh succeeded.",
+            [({}, refresh.last_success)],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_refresh_duration_seconds",
+            "gauge",
+            "Duration of the latest status refresh.",
+            [({}, refresh.last_duration)],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_requests",
+            "counter",
+            "Cloud requests sent, by priority.",
+            [
+                ({"priority": priority.name.lower()}, metrics.granted)
+                for priority, metrics in scheduler.metrics.items()
+            ],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_request_queue_depth",
+            "gauge",
+            "Cloud requests waiting for the account's request budget.",
+            [({}, scheduler.queue_depth)],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_property_responses",
+            "counter",
+            "Property list responses, by how they were answered.",
+            [
+                ({"result": "not_modified"}, responses.not_modified),
+                ({"result": "unchanged_body"}, responses.unchanged_body),
+                ({"result": "parsed"}, responses.parsed),
+            ],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_write_failures",
+            "counter",
+            "Writes to a heater that failed, by command.",
+            [
+                ({"command": name}, stats["failed"])
+                for name, stats in commands.as_dict()["commands"].items()
+            ],
+        ),
+        MetricFamily(
+            f"{DOMAIN}_outbox_depth",
+            "gauge",
+            "Failed writes queued for a retry.",
+            [({}, outbox.depth())],
+        ),
+    ]
+
+
+class OpenMetricsExposition:
+    """A pre-rendered OpenMetrics body, regenerated only after a change."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing rendered yet."""
+        self._body: bytes | None = None
+        # DSN -> (device object the samples were rendered from, samples).
+        self._devices: dict[str, tuple[Any, str]] = {}
+        self.renders = 0
+        self.device_renders = 0
+
+    def invalidate(self) -> None:
+        """Render the body afresh on the next scrape."""
+        self._body = None
+
+    def body(
+        self,
+        devices: Mapping[str, Any] | None,
+        families: Callable[[], Iterable[MetricFamily]],
+    ) -> bytes:
+        """Return the exposition, rendering it first if it was invalidated.
+
+        ``families`` is only called when the body has to be rendered.
+        """
+        if self._body is None:
+            self._body = self._render(devices or {}, families())
+        return self._body
+
+    def _render(
+        self, devices: Mapping[str, Any], families: Iterable[MetricFamily]
+    ) -> bytes:
+        cached = self._devices
+        self._devices = {}
+        parts = [
+            _header(_PROPERTY_FAMILY, "gauge", "Numeric property reported by a heater.")
+        ]
+        for dsn, device in devices.items():
+            entry = cached.get(dsn)
+            if entry is None or entry[0] is not device:
+                entry = (device, render_device(dsn, device))
+                self.device_renders += 1
+            self._devices[dsn] = entry
+            parts.append(entry[1])
+        parts.extend(render_family(family) for family in families)
+        parts.append("# EOF\n")
+        self.renders += 1
+        return "".join(parts).encode()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize render counters for diagnostics."""
+        return {
+            "renders": self.renders,
+            "device_renders": self.device_renders,
+            "cached": self._body is not None,
+            "bytes": 0 if self._body is None else len(self._body),
+        }
@@ -11,7 +11,6 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from bradford_white_connect_client.types import Device
 from homeassistant.components.number import (
     NumberEntity,
     NumberEntityDescription,
@@ -19,12 +18,17 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BradfordWhiteConnectData
+from .capabilities import DeviceCapabilities
 from .const import DOMAIN
-from .entity import BradfordWhiteConnectDescribedStatusEntity
+from .entity import (
+    BradfordWhiteConnectDescribedStatusEntity,
+    async_add_status_entities,
+    described_entity_factory,
+)
 from .helper import get_device_property_value, has_property
 
 
@@ -33,7 +37,7 @@ class BWNumberDescription(NumberEntityDescription):
     """Describes a writable numeric input."""
 
     property_name: str
-    supported_fn: Callable[[Device], bool] = lambda device: True
+    supported_fn: Callable[[DeviceCapabilities], bool] = lambda capabilities: True
 
 
 NUMBERS: tuple[BWNumberDescription, ...] = (
@@ -95,11 +99,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bradford White Connect number platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        BradfordWhiteConnectNumber(data.status_coordinator, dsn, device, desc)
-        for dsn, device in data.status_coordinator.data.items()
-        for desc in NUMBERS
-        if desc.supported_fn(device)
+    async_add_status_entities(
+        entry,
+        data.status_coordinator,
+        async_add_entities,
+        described_entity_factory(
+            data.status_coordinator, BradfordWhiteConnectNumber, NUMBERS
+        ),
     )
 
 
@@ -110,18 +116,16 @@ class BradfordWhiteConnectNumber(
 
     entity_description: BWNumberDescription
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value from the device, or None if missing."""
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the current value from the device, or None if missing."""
         value = get_device_property_value(
             self.device, self.entity_description.property_name
         )
-        if value is None:
-            return None
         try:
-            return float(value)
+            self._attr_native_value = None if value is None else float(value)
         except (TypeError, ValueError):
-            return None
+            self._attr_native_value = None
 
     async def async_set_native_value(self, value: float) -> None:
         """Write the new value as an integer datapoint."""
@@ -0,0 +1,212 @@
+"""Durable outbox for Bradford White Connect writes.
+
+Writes that failed while the cloud was unreachable wait here for a
+retry, at most one per ``(dsn, state_property)``. Entries expire after a
+TTL, back off exponentially between attempts and round-trip through
+``as_dict`` / ``from_dict`` so they survive a restart.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from .commands import Command
+
+DEFAULT_BASE_BACKOFF = 30.0
+DEFAULT_MAX_BACKOFF = 900.0
+
+
+@dataclass(slots=True)
+class OutboxEntry:
+    """A queued write and its retry schedule."""
+
+    command: Command
+    queued_at: float
+    expires_at: float
+    attempts: int = 0
+    next_attempt: float = 0.0
+    last_error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for storage/diagnostics."""
+        command = self.command
+        return {
+            "dsn": command.dsn,
+            "name": command.name,
+            "value": command.value,
+            "state_property": command.state_property,
+            "queued_at": self.queued_at,
+            "expires_at": self.expires_at,
+            "attempts": self.attempts,
+            "next_attempt": self.next_attempt,
+            "last_error": self.last_error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OutboxEntry:
+        """Rebuild an entry from ``as_dict`` output."""
+        return cls(
+            command=Command(
+                data["dsn"], data["name"], data["value"], data["state_property"]
+            ),
+            queued_at=float(data["queued_at"]),
+            expires_at=float(data["expires_at"]),
+            attempts=int(data.get("attempts", 0)),
+            next_attempt=float(data.get("next_attempt", 0.0)),
+            last_error=data.get("last_error"),
+        )
+
+
+class Outbox:
+    """Pending writes keyed by device and property."""
+
+    def __init__(
+        self,
+        ttl: float,
+        base_backoff: float = DEFAULT_BASE_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty outbox."""
+        self._ttl = ttl
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._entries: dict[tuple[str, str], OutboxEntry] = {}
+        self.delivered = 0
+        self.superseded = 0
+        self.expired = 0
+        self.dirty = False
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self._base_backoff * 2 ** max(attempts - 1, 0), self._max_backoff)
+
+    def add(self, command: Command, error: str) -> OutboxEntry:
+        """Queue a write that just failed once, superseding any older one."""
+        now = self._clock()
+        key = (command.dsn, command.state_property)
+        if key in self._entries:
+            self.superseded += 1
+        entry = self._entries[key] = OutboxEntry(
+            command=command,
+            queued_at=now,
+            expires_at=now + self._ttl,
+            attempts=1,
+            next_attempt=now + self._backoff(1),
+            last_error=error,
+        )
+        self.dirty = True
+        return entry
+
+    def discard(self, command: Command) -> bool:
+        """Cancel the queued write a newer one to the same property replaces."""
+        key = (command.dsn, command.state_property)
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        del self._entries[key]
+        if entry.command == command:
+            self.delivered += 1
+        else:
+            self.superseded += 1
+        self.dirty = True
+        return True
+
+    def holds(self, entry: OutboxEntry) -> bool:
+        """Return whether ``entry`` is still queued, not replaced or settled."""
+        key = (entry.command.dsn, entry.command.state_property)
+        return self._entries.get(key) is entry
+
+    def remove(self, entry: OutboxEntry, delivered: bool) -> bool:
+        """Drop a replayed entry, unless a newer write has replaced it."""
+        if not self.holds(entry):
+            return False
+        del self._entries[(entry.command.dsn, entry.command.state_property)]
+        self.delivered += delivered
+        self.dirty = True
+        return True
+
+    def expire(self) -> list[OutboxEntry]:
+        """Drop and return the entries whose TTL has passed."""
+        now = self._clock()
+        expired = [entry for entry in self._entries.values() if entry.expires_at <= now]
+        for entry in expired:
+            del self._entries[(entry.command.dsn, entry.command.state_property)]
+        if expired:
+            self.expired += len(expired)
+            self.dirty = True
+        return expired
+
+    def due(self) -> list[OutboxEntry]:
+        """Return the live entries ready for another attempt, oldest first."""
+        now = self._clock()
+        return sorted(
+            (
+                entry
+                for entry in self._entries.values()
+                if entry.next_attempt <= now < entry.expires_at
+            ),
+            key=lambda entry: entry.queued_at,
+        )
+
+    def retry_later(self, entry: OutboxEntry, error: str) -> None:
+        """Record another failed attempt and back off before the next."""
+        entry.attempts += 1
+        entry.next_attempt = self._clock() + self._backoff(entry.attempts)
+        entry.last_error = error
+        self.dirty = True
+
+    def depth(self, dsn: str | None = None) -> int:
+        """Return how many writes are queued, for one device or overall."""
+        if dsn is None:
+            return len(self._entries)
+        return sum(1 for key in self._entries if key[0] == dsn)
+
+    def pending_for(self, dsn: str) -> list[str]:
+        """Return the names of the writes queued for a device."""
+        return [
+            entry.command.name
+            for (entry_dsn, _), entry in self._entries.items()
+            if entry_dsn == dsn
+        ]
+
+    def forget(self, dsn: str) -> None:
+        """Drop queued writes for a device that left the account."""
+        for key in [key for key in self._entries if key[0] == dsn]:
+            del self._entries[key]
+            self.dirty = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize the queued writes for storage."""
+        return {"entries": [entry.as_dict() for entry in self._entries.values()]}
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters and queued writes for diagnostics."""
+        return {
+            "depth": len(self._entries),
+            "delivered": self.delivered,
+            "superseded": self.superseded,
+            "expired": self.expired,
+            **self.as_dict(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any] | None,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ) -> Outbox:
+        """Rebuild an outbox from ``as_dict`` output; tolerate missing data."""
+        outbox = cls(ttl, clock=clock)
+        for raw in (data or {}).get("entries") or []:
+            try:
+                entry = OutboxEntry.from_dict(raw)
+            except (KeyError, TypeError, ValueError):
+                continue
+            key = (entry.command.dsn, entry.command.state_property)
+            outbox._entries[key] = entry
+        return outbox
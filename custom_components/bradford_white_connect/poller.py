@@ -0,0 +1,238 @@
+"""Home Assistant independent status polling for Bradford White Connect.
+
+``StatusPoller`` turns one poll of the Ayla cloud into the next
+``Snapshot``: it lists the account's devices, fetches each device's due
+properties (only the tiers the ``RefreshPlan`` says are due, as
+conditional GETs answered from the ``ConditionalCache`` on a 304) and
+merges them into the previous snapshot. Every request goes through the
+account's ``RequestScheduler``.
+
+Devices are fetched ``concurrency`` at a time. The integration keeps
+the default of one, which is plenty for a household; the headless
+poller raises it to poll hundreds of heaters within one interval, with
+the scheduler's token bucket still bounding the request rate.
+
+The status coordinator and ``scripts/fleet_poller.py`` both poll
+through this class and hand the snapshot to ``core.FleetState``. The
+module needs the upstream client and aiohttp, but not Home Assistant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from functools import partial
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, TypeVar
+
+import aiohttp
+from bradford_white_connect_client import (
+    BradfordWhiteConnectClient,
+    BradfordWhiteConnectUnknownException,
+)
+from bradford_white_connect_client.types import Device, Property, dataclass_from_api
+
+from .const import ENERGY_TYPE_HEAT_PUMP, ENERGY_TYPE_RESISTANCE
+from .http_cache import ConditionalCache
+from .refresh_tiers import RefreshPlan, RefreshTier
+from .scheduler import RequestPriority, RequestScheduler
+from .snapshot import Snapshot, build_snapshot
+
+if TYPE_CHECKING:
+    from .core import FleetState
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Ayla property list endpoint; ``names[]`` narrows the response to a subset.
+_PROPERTIES_URL = "https://ads-field.aylanetworks.com/apiv1/dsns/{dsn}/properties.json"
+
+# Energy usage endpoint series for each energy type.
+_ENERGY_SERIES: dict[str, str] = {
+    ENERGY_TYPE_HEAT_PUMP: "hp",
+    ENERGY_TYPE_RESISTANCE: "re",
+}
+
+
+def _parse_properties(body: bytes) -> list[Property]:
+    """Decode an Ayla ``properties.json`` body into ``Property`` objects."""
+    return [dataclass_from_api(Property, item["property"]) for item in json.loads(body)]
+
+
+class StatusPoller:
+    """Fetch successive status snapshots for one account."""
+
+    def __init__(
+        self,
+        client: BradfordWhiteConnectClient,
+        scheduler: RequestScheduler,
+        concurrency: int = 1,
+    ) -> None:
+        """Initialize with no property fetched yet."""
+        self.client = client
+        self.scheduler = scheduler
+        self.refresh_plan = RefreshPlan()
+        self.http_cache = ConditionalCache()
+        self._concurrency = max(concurrency, 1)
+        # Monotonic time the latest poll listed the devices at.
+        self.polled_at = 0.0
+
+    async def async_request(
+        self,
+        priority: RequestPriority,
+        dsn: str | None,
+        request: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Send one cloud request through the account-wide request budget."""
+        return await self.scheduler.run(priority, dsn, request)
+
+    async def async_poll(
+        self, previous: Snapshot | None, priority: RequestPriority
+    ) -> Snapshot:
+        """Fetch the next snapshot; returns ``previous`` if nothing changed."""
+        devices = await self.async_request(priority, None, self.client.get_devices)
+        now = self.polled_at = time.monotonic()
+        due = self.refresh_plan.due_tiers(now)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _fetch(device: Device) -> tuple[Device, dict[str, Property]]:
+            async with semaphore:
+                return device, await self._async_fetch_properties(
+                    previous, device, priority, due, now
+                )
+
+        fetched = await asyncio.gather(*(_fetch(device) for device in devices))
+        snapshot = build_snapshot(previous, fetched)
+        self.refresh_plan.mark_fetched(due, now)
+        return snapshot
+
+    def forget(self, dsn: str) -> None:
+        """Drop the cached responses of a device that left the account."""
+        self.http_cache.forget(lambda key: key[0] == dsn)
+
+    async def _async_fetch_properties(
+        self,
+        previous: Snapshot | None,
+        device: Device,
+        priority: RequestPriority,
+        due: frozenset[RefreshTier],
+        now: float,
+    ) -> dict[str, Property]:
+        """Fetch the device's due properties and merge them into the last snapshot.
+
+        Devices we have no snapshot for, and polls where the ``STATIC``
+        tier is due, fetch everything (which also drops properties the
+        device stopped reporting); other polls only ask Ayla for the
+        names in the due tiers and keep the previous value of the rest.
+        """
+        prior = previous.get(device.dsn) if previous else None
+        previous_properties = (prior.properties or {}) if prior else None
+        names = self.refresh_plan.names_to_fetch(due, previous_properties, now)
+        if names is not None and not names:
+            self.refresh_plan.record_fetch(names, 0)
+            return dict(previous_properties or {})
+
+        params = [("names[]", name) for name in sorted(names or ())]
+        fetched, _ = await self.async_request(
+            priority,
+            device.dsn,
+            partial(
+                self._async_conditional_get,
+                (device.dsn, tuple(params)),
+                _PROPERTIES_URL.format(dsn=device.dsn),
+                params,
+            ),
+        )
+        self.refresh_plan.record_fetch(names, len(fetched))
+
+        properties = {} if names is None else dict(previous_properties or {})
+        properties.update((prop.name, prop) for prop in fetched)
+        return properties
+
+    async def _async_conditional_get(
+        self,
+        key: tuple[str, tuple[tuple[str, str], ...]],
+        url: str,
+        params: list[tuple[str, str]],
+    ) -> tuple[list[Property], bool]:
+        """GET a property list, short-circuiting unchanged responses.
+
+        The upstream client's ``http_get_request`` only hands back decoded
+        JSON, so this issues the request on the client's own session to
+        see the status, validators and raw body. It keeps the client's
+        retry-once-after-re-authenticating behaviour on a 401 and asks
+        for a gzip-compressed body explicitly.
+        """
+        for retrying_after_login in (False, True):
+            headers = self.client.generate_headers(
+                {"accept-encoding": "gzip", **self.http_cache.request_headers(key)}
+            )
+            try:
+                async with self.client.session.get(
+                    url, headers=headers, params=params
+                ) as response:
+                    if response.status == 401 and not retrying_after_login:
+                        _LOGGER.debug("Token may be expired - retrying login")
+                        await self.client.authenticate()
+                        continue
+                    if response.status == 304:
+                        return self.http_cache.not_modified(key), False
+                    response.raise_for_status()
+                    body = await response.read()
+                    return self.http_cache.resolve(
+                        key,
+                        body,
+                        _parse_properties,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        wire_bytes=response.content_length,
+                    )
+            except aiohttp.ClientError as err:
+                raise BradfordWhiteConnectUnknownException(
+                    f"Property request failed: {err}"
+                ) from err
+        raise BradfordWhiteConnectUnknownException(
+            "Received status code 401 after logging in"
+        )
+
+
+async def async_fetch_energy_usage(
+    client: BradfordWhiteConnectClient,
+    scheduler: RequestScheduler,
+    devices: Iterable[Device],
+    usage_date: datetime,
+) -> dict[str, dict[str, float]]:
+    """Fetch each device's cloud energy totals for ``usage_date``'s day."""
+    energy_usage_by_dsn: dict[str, dict[str, float]] = {}
+    for device in devices:
+        usage: dict[str, float] = {}
+        for energy_type, series in _ENERGY_SERIES.items():
+            usage[energy_type] = await scheduler.run(
+                RequestPriority.ENERGY,
+                device.dsn,
+                partial(
+                    client.get_total_energy_usage_for_day, device, series, usage_date
+                ),
+            )
+        energy_usage_by_dsn[device.dsn] = usage
+    return energy_usage_by_dsn
+
+
+async def async_fetch_energy_totals(
+    client: BradfordWhiteConnectClient,
+    scheduler: RequestScheduler,
+    state: FleetState,
+) -> tuple[list[Device], dict[str, dict[str, float]]]:
+    """Fetch the cloud's daily energy totals and anchor ``state`` to them.
+
+    Returns the device listing along with the totals by DSN.
+    """
+    usage_date = state.energy_usage_date()
+    devices = await scheduler.run(RequestPriority.ENERGY, None, client.get_devices)
+    usage = await async_fetch_energy_usage(client, scheduler, devices, usage_date)
+    state.anchor_energy(usage, usage_date)
+    return devices, usage
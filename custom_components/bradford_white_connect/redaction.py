@@ -0,0 +1,167 @@
+"""Redaction and size bounds for Bradford White Connect diagnostics.
+
+Device payloads are redacted by a per-field plan decided once, DSNs in
+every other section are swapped for per-download pseudonyms (``dsn-1``,
+``dsn-2``, ...), and history buffers are trimmed so entry downloads stay
+small on large accounts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+import re
+from typing import Any
+
+# Same marker as ``homeassistant.components.diagnostics.REDACTED``.
+REDACTED = "**REDACTED**"
+
+# Fields containing PII or identifying information that should be redacted
+# from any diagnostic snapshot that may be attached to a public PR or issue.
+TO_REDACT = {
+    "dsn",
+    "mac",
+    "unique_hardware_id",
+    "lan_ip",
+    "lat",
+    "lng",
+    "locality",
+    "appliance_serial_number_out",
+    "username",
+    "email",
+    "password",
+}
+
+_DEVICE_FIELDS: tuple[str, ...] = (
+    "product_name",
+    "model",
+    "dsn",
+    "oem_model",
+    "sw_version",
+    "template_id",
+    "mac",
+    "unique_hardware_id",
+    "lan_ip",
+    "connected_at",
+    "key",
+    "lan_enabled",
+    "connection_priority",
+    "has_properties",
+    "product_class",
+    "connection_status",
+    "lat",
+    "lng",
+    "locality",
+    "device_type",
+    "dealer",
+    "facility_uuid",
+)
+
+# Redaction plan for the device payload, decided once per field instead of
+# recursively scanning every (mostly property) value on each download.
+_DEVICE_FIELD_PLAN: tuple[tuple[str, bool], ...] = tuple(
+    (attr, attr in TO_REDACT) for attr in _DEVICE_FIELDS
+)
+
+
+@lru_cache(maxsize=8)
+def field_plan(cls: type) -> tuple[tuple[str, bool], ...]:
+    """Return ``(field, redact)`` for a dataclass type, computed once."""
+    return tuple((field.name, field.name in TO_REDACT) for field in fields(cls))
+
+
+def property_to_dict(prop: Any) -> dict[str, Any]:
+    """Convert a Property dataclass instance to a plain dict.
+
+    Falls back to a best-effort introspection if the object is not a dataclass.
+    """
+    if is_dataclass(prop):
+        return {
+            name: REDACTED if redact else getattr(prop, name)
+            for name, redact in field_plan(type(prop))
+        }
+    return {
+        attr: getattr(prop, attr)
+        for attr in dir(prop)
+        if not attr.startswith("_") and not callable(getattr(prop, attr, None))
+    }
+
+
+def device_to_dict(device: Any) -> dict[str, Any]:
+    """Render a Device into a redacted, JSON-serializable dict."""
+    data: dict[str, Any] = {
+        attr: REDACTED if redact else getattr(device, attr)
+        for attr, redact in _DEVICE_FIELD_PLAN
+        if hasattr(device, attr)
+    }
+    data["properties"] = {
+        name: REDACTED if name in TO_REDACT else property_to_dict(prop)
+        for name, prop in (device.properties or {}).items()
+    }
+    return data
+
+
+def pseudonyms(dsns: Iterable[str]) -> dict[str, str]:
+    """Assign each DSN a pseudonym, in sorted order, for one download."""
+    return {dsn: f"dsn-{index}" for index, dsn in enumerate(sorted(set(dsns)), 1)}
+
+
+def pseudonymize(value: Any, names: Mapping[str, str]) -> Any:
+    """Replace DSNs with their pseudonyms in keys and strings, recursively.
+
+    Matching ignores case, so statistic ids built from a lowercased DSN
+    are covered too.
+    """
+    if not names:
+        return value
+    lookup = {dsn.lower(): name for dsn, name in names.items()}
+    pattern = re.compile(
+        "|".join(re.escape(dsn) for dsn in sorted(lookup, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+
+    def _sub(text: str) -> str:
+        return pattern.sub(lambda match: lookup[match.group(0).lower()], text)
+
+    def _walk(item: Any) -> Any:
+        if isinstance(item, str):
+            return _sub(item)
+        if isinstance(item, Mapping):
+            return {
+                _sub(key) if isinstance(key, str) else key: _walk(child)
+                for key, child in item.items()
+            }
+        if isinstance(item, list | tuple | set | frozenset):
+            return [_walk(child) for child in item]
+        return item
+
+    return _walk(value)
+
+
+def tail(rows: list[Any], limit: int) -> dict[str, Any]:
+    """Keep the newest ``limit`` rows and report how many were dropped."""
+    return {"rows": rows[-limit:], "truncated": max(len(rows) - limit, 0)}
+
+
+def head(items: Iterable[tuple[str, Any]], limit: int) -> dict[str, Any]:
+    """Keep the first ``limit`` items of an already-ordered mapping."""
+    kept: dict[str, Any] = {}
+    dropped = 0
+    for key, value in items:
+        if len(kept) < limit:
+            kept[key] = value
+        else:
+            dropped += 1
+    return {"rows": kept, "truncated": dropped}
+
+
+def bound_estimates(estimates: Mapping[str, Any], limit: int) -> dict[str, Any]:
+    """Trim each estimator's hourly buckets to the newest ``limit`` hours."""
+    return {
+        energy_type: {
+            **estimate,
+            "hours": dict(list(estimate["hours"].items())[-limit:]),
+        }
+        for energy_type, estimate in estimates.items()
+    }
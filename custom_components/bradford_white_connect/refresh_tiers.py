@@ -0,0 +1,186 @@
+"""Tiered property refresh planning for Bradford White Connect.
+
+``RefreshPlan`` assigns each property a ``RefreshTier``, derived from the
+platforms' entity descriptions, and tells the status coordinator which
+names are due on a given poll. Realtime properties are fetched every
+poll, slow-moving diagnostics less often, and a due static tier triggers
+a full fetch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from enum import IntEnum
+from typing import Any
+
+
+class RefreshTier(IntEnum):
+    """Refresh tiers, most frequent first."""
+
+    REALTIME = 0
+    NORMAL = 1
+    SLOW = 2
+    STATIC = 3
+
+
+# Minimum seconds between fetches of each tier. ``REALTIME`` rides every poll.
+DEFAULT_TIER_INTERVALS: dict[RefreshTier, float] = {
+    RefreshTier.REALTIME: 0.0,
+    RefreshTier.NORMAL: 15 * 60.0,
+    RefreshTier.SLOW: 60 * 60.0,
+    RefreshTier.STATIC: 24 * 60 * 60.0,
+}
+
+# Polls never land exactly on a tier boundary; treat a tier as due if it
+# would become due within this many seconds.
+_DUE_SLACK = 5.0
+
+# Properties read outside the entity descriptions (water heater entity,
+# alarm tracking, device registry) or whose tier the description cannot
+# express.
+_PINNED_TIERS: dict[str, RefreshTier] = {
+    "tank_temp": RefreshTier.REALTIME,
+    "current_heat_mode": RefreshTier.REALTIME,
+    "water_setpoint_out": RefreshTier.REALTIME,
+    "alarm": RefreshTier.REALTIME,
+    "water_setpoint_min": RefreshTier.SLOW,
+    "water_setpoint_max": RefreshTier.SLOW,
+    "appliance_model_out": RefreshTier.STATIC,
+    "appliance_serial_number_out": RefreshTier.STATIC,
+    "controller_sw": RefreshTier.STATIC,
+    "product_name": RefreshTier.STATIC,
+    "tank_size_out": RefreshTier.STATIC,
+    "type_out": RefreshTier.STATIC,
+}
+
+# Diagnostic device classes whose value tracks the heater's operation.
+_LIVE_DIAGNOSTIC_CLASSES = frozenset(
+    {"current", "power", "problem", "running", "signal_strength", "temperature"}
+)
+
+# Tier for properties no description or pin claims.
+_UNCLAIMED_TIER = RefreshTier.SLOW
+
+
+def tier_for(entity_category: Any, device_class: Any) -> RefreshTier:
+    """Derive a tier from a description's ``entity_category`` and ``device_class``."""
+    category = None if entity_category is None else str(entity_category)
+    if category is None:
+        return RefreshTier.REALTIME
+    if category == "config":
+        return RefreshTier.NORMAL
+    if device_class is not None and str(device_class) in _LIVE_DIAGNOSTIC_CLASSES:
+        return RefreshTier.NORMAL
+    return RefreshTier.SLOW
+
+
+class RefreshPlan:
+    """Decide which properties each poll should fetch."""
+
+    def __init__(self, intervals: dict[RefreshTier, float] | None = None) -> None:
+        """Initialize with no tier fetched yet (the first poll is a full fetch)."""
+        self._intervals = dict(intervals or DEFAULT_TIER_INTERVALS)
+        self._tiers: dict[str, RefreshTier] = dict(_PINNED_TIERS)
+        self._promoted: dict[str, float] = {}
+        self._last_fetch: dict[RefreshTier, float] = {}
+        self.full_fetches = 0
+        self.partial_fetches = 0
+        self.properties_fetched = 0
+
+    def register(self, name: str, tier: RefreshTier) -> None:
+        """Claim ``name`` for ``tier``; the most frequent claim wins."""
+        current = self._tiers.get(name)
+        if current is None or tier < current:
+            self._tiers[name] = tier
+
+    def register_descriptions(self, descriptions: Iterable[Any]) -> None:
+        """Register the property behind each entity description.
+
+        The property name comes from the description's ``supported_fn``
+        when it was built by ``helper.has_property``; other descriptions
+        do not map to a single property and are skipped.
+        """
+        for description in descriptions:
+            name = getattr(description.supported_fn, "property_name", None)
+            if name is None or name in _PINNED_TIERS:
+                continue
+            self.register(
+                name,
+                tier_for(
+                    getattr(description, "entity_category", None),
+                    getattr(description, "device_class", None),
+                ),
+            )
+
+    def tier(self, name: str, now: float | None = None) -> RefreshTier:
+        """Return the tier ``name`` is currently fetched at."""
+        if now is not None and self._promoted.get(name, 0.0) > now:
+            return RefreshTier.REALTIME
+        return self._tiers.get(name, _UNCLAIMED_TIER)
+
+    def promote(self, name: str, until: float) -> None:
+        """Fetch ``name`` on every poll until ``until`` (e.g. after a write)."""
+        self._promoted[name] = max(until, self._promoted.get(name, 0.0))
+
+    def due_tiers(self, now: float) -> frozenset[RefreshTier]:
+        """Return the tiers whose interval has elapsed at ``now``."""
+        self._promoted = {
+            name: until for name, until in self._promoted.items() if until > now
+        }
+        return frozenset(
+            tier
+            for tier, interval in self._intervals.items()
+            if tier not in self._last_fetch
+            or now - self._last_fetch[tier] + _DUE_SLACK >= interval
+        )
+
+    def names_to_fetch(
+        self,
+        due: frozenset[RefreshTier],
+        known_names: Iterable[str] | None,
+        now: float,
+    ) -> frozenset[str] | None:
+        """Return the property names one device should fetch, or None for all.
+
+        ``known_names`` are the properties the device reported on its last
+        full fetch; None (a device we have not fetched yet) or a due
+        ``STATIC`` tier means a full fetch.
+        """
+        if known_names is None or RefreshTier.STATIC in due:
+            return None
+        return frozenset(name for name in known_names if self.tier(name, now) in due)
+
+    def mark_fetched(self, due: frozenset[RefreshTier], now: float) -> None:
+        """Record a successful poll of the ``due`` tiers.
+
+        A full fetch refreshes every tier, so a due ``STATIC`` tier marks
+        them all.
+        """
+        tiers = self._intervals if RefreshTier.STATIC in due else due
+        for tier in tiers:
+            self._last_fetch[tier] = now
+
+    def record_fetch(self, names: frozenset[str] | None, fetched: int) -> None:
+        """Count one device fetch (``names`` None for a full fetch)."""
+        if names is None:
+            self.full_fetches += 1
+        else:
+            self.partial_fetches += 1
+        self.properties_fetched += fetched
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize tier assignments and fetch counters for diagnostics."""
+        by_tier: dict[str, list[str]] = {tier.name.lower(): [] for tier in RefreshTier}
+        for name, tier in sorted(self._tiers.items()):
+            by_tier[tier.name.lower()].append(name)
+        return {
+            "intervals_s": {
+                tier.name.lower(): interval
+                for tier, interval in self._intervals.items()
+            },
+            "tiers": by_tier,
+            "promoted": sorted(self._promoted),
+            "full_fetches": self.full_fetches,
+            "partial_fetches": self.partial_fetches,
+            "properties_fetched": self.properties_fetched,
+        }
@@ -0,0 +1,137 @@
+"""Serve a capture back in place of the Bradford White Connect cloud.
+
+``ReplayClient`` is a ``BradfordWhiteConnectClient`` whose HTTP session
+answers from a capture file (see ``capture``) instead of the network, so
+the coordinators, benchmarks and regression tests run against the exact
+responses a real install saw. Each response is delayed by its recorded
+latency divided by ``speed``; ``speed=0`` replays as fast as possible.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+import json
+from typing import Any
+
+import aiohttp
+from bradford_white_connect_client import BradfordWhiteConnectClient
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .capture import ReplayIndex
+
+# Answer for requests the capture never saw.
+_NOT_CAPTURED: Mapping[str, Any] = {
+    "status": 404,
+    "headers": {},
+    "body": {"error": "not captured"},
+    "ms": 0.0,
+}
+
+
+class ReplayResponse:
+    """The subset of ``aiohttp.ClientResponse`` the client and coordinators use."""
+
+    def __init__(self, method: str, url: str, record: Mapping[str, Any]) -> None:
+        """Build a response from one capture record."""
+        self.method = method
+        self.url = URL(url)
+        self.status: int = record["status"]
+        self.headers = CIMultiDictProxy(CIMultiDict(record.get("headers") or {}))
+        body = record.get("body")
+        self._raw = (
+            b""
+            if body is None
+            else body.encode() if isinstance(body, str) else json.dumps(body).encode()
+        )
+        self.content_length = len(self._raw)
+
+    async def read(self) -> bytes:
+        """Return the recorded body."""
+        return self._raw
+
+    async def json(self, **kwargs: Any) -> Any:
+        """Decode the recorded body."""
+        return json.loads(self._raw) if self._raw else None
+
+    def raise_for_status(self) -> None:
+        """Raise like aiohttp does for a recorded error status."""
+        if self.status < 400:
+            return
+        raise aiohttp.ClientResponseError(
+            aiohttp.RequestInfo(self.url, self.method, self.headers, self.url),
+            (),
+            status=self.status,
+            message="replayed error",
+            headers=self.headers,
+        )
+
+
+class _ReplayRequest:
+    def __init__(
+        self,
+        response: ReplayResponse,
+        sleep: Callable[[float], Awaitable[None]],
+        delay: float,
+    ) -> None:
+        self._response = response
+        self._sleep = sleep
+        self._delay = delay
+
+    async def __aenter__(self) -> ReplayResponse:
+        if self._delay:
+            await self._sleep(self._delay)
+        return self._response
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class ReplaySession:
+    """An HTTP session answering ``get``/``post`` from a capture."""
+
+    def __init__(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        speed: float = 1.0,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Serve ``records`` at ``speed`` times their recorded latency."""
+        self.index = ReplayIndex(records)
+        self.speed = speed
+        self._sleep = sleep
+        self.closed = False
+
+    def _request(self, method: str, url: str, params: Any) -> _ReplayRequest:
+        record = self.index.next(method, url, params) or _NOT_CAPTURED
+        delay = record["ms"] / 1000 / self.speed if self.speed > 0 else 0.0
+        return _ReplayRequest(ReplayResponse(method, url, record), self._sleep, delay)
+
+    def get(self, url: str, *, params: Any = None, **kwargs: Any) -> _ReplayRequest:
+        """Replay a GET request."""
+        return self._request("GET", url, params)
+
+    def post(self, url: str, *, params: Any = None, **kwargs: Any) -> _ReplayRequest:
+        """Replay a POST request."""
+        return self._request("POST", url, params)
+
+    async def close(self) -> None:
+        """Nothing to release; present for session compatibility."""
+        self.closed = True
+
+
+class ReplayClient(BradfordWhiteConnectClient):
+    """A drop-in client that never touches the network."""
+
+    def __init__(
+        self, records: Iterable[Mapping[str, Any]], speed: float = 1.0
+    ) -> None:
+        """Replay ``records`` (from ``capture.load_capture``) at ``speed``."""
+        super().__init__(
+            "replay@example.invalid", "replay", ReplaySession(records, speed)
+        )
+
+    async def authenticate(self) -> None:
+        """Skip the sign-in; captured tokens are redacted anyway."""
+        self.token = "replay"
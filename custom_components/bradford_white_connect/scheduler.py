@@ -0,0 +1,187 @@
+"""Account-wide request scheduling for Bradford White Connect.
+
+Every call to the Ayla cloud shares one account, so ``RequestScheduler``
+puts all of them behind a single token bucket. Waiting requests are
+granted by ``RequestPriority`` (user writes first) and round-robin per
+DSN within a priority, so one busy heater cannot starve the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+import time
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class RequestPriority(IntEnum):
+    """Priority classes, most urgent first."""
+
+    USER_WRITE = 0
+    WRITE_VERIFY = 1
+    STATUS = 2
+    ENERGY = 3
+    DIAGNOSTICS = 4
+
+
+@dataclass(slots=True)
+class PriorityMetrics:
+    """Counters for one priority class."""
+
+    granted: int = 0
+    waited: int = 0
+    queued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for diagnostics."""
+        return {
+            "granted": self.granted,
+            "waited": self.waited,
+            "queue_depth": self.queued,
+            "mean_wait_s": (
+                round(self.total_wait / self.waited, 3) if self.waited else 0.0
+            ),
+            "max_wait_s": round(self.max_wait, 3),
+        }
+
+
+@dataclass(slots=True)
+class _Waiter:
+    future: asyncio.Future[None]
+    enqueued_at: float
+
+
+class RequestScheduler:
+    """Token-bucket rate limiter with priority classes and per-DSN fairness."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket refilling at ``rate`` tokens per second."""
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._queues: dict[RequestPriority, OrderedDict[str | None, deque[_Waiter]]] = {
+            priority: OrderedDict() for priority in RequestPriority
+        }
+        self._depth = 0
+        self._dispatcher: asyncio.Task[None] | None = None
+        self.metrics: dict[RequestPriority, PriorityMetrics] = {
+            priority: PriorityMetrics() for priority in RequestPriority
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests currently waiting for a token."""
+        return self._depth
+
+    async def run(
+        self,
+        priority: RequestPriority,
+        dsn: str | None,
+        request: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Wait for a token, then await ``request()`` and return its result."""
+        await self.acquire(priority, dsn)
+        return await request()
+
+    async def acquire(self, priority: RequestPriority, dsn: str | None) -> None:
+        """Wait until a request of ``priority`` for ``dsn`` may be sent."""
+        metrics = self.metrics[priority]
+        self._refill()
+        if self._depth == 0 and self._tokens >= 1:
+            # Fast path: nothing queued ahead of us and a token is available.
+            self._tokens -= 1
+            metrics.granted += 1
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), self._clock())
+        self._queues[priority].setdefault(dsn, deque()).append(waiter)
+        self._depth += 1
+        metrics.queued += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+        await waiter.future
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize bucket state and per-priority metrics for diagnostics."""
+        self._refill()
+        return {
+            "rate_per_s": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self._depth,
+            "priorities": {
+                priority.name.lower(): metrics.as_dict()
+                for priority, metrics in self.metrics.items()
+            },
+        }
+
+    async def async_shutdown(self) -> None:
+        """Stop dispatching and fail any request still waiting."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for priority, queue in self._queues.items():
+            for waiters in queue.values():
+                for waiter in waiters:
+                    if not waiter.future.done():
+                        waiter.future.cancel()
+            queue.clear()
+            self.metrics[priority].queued = 0
+        self._depth = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _pop_next(self) -> tuple[RequestPriority, _Waiter] | None:
+        """Pop the next live waiter: highest priority, round-robin per DSN."""
+        for priority, queue in self._queues.items():
+            while queue:
+                dsn, waiters = next(iter(queue.items()))
+                waiter = waiters.popleft()
+                if waiters:
+                    queue.move_to_end(dsn)
+                else:
+                    del queue[dsn]
+                self._depth -= 1
+                self.metrics[priority].queued -= 1
+                if not waiter.future.done():
+                    return priority, waiter
+        return None
+
+    async def _dispatch(self) -> None:
+        while self._depth:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                continue
+            popped = self._pop_next()
+            if popped is None:
+                break
+            priority, waiter = popped
+            self._tokens -= 1
+            wait = self._clock() - waiter.enqueued_at
+            metrics = self.metrics[priority]
+            metrics.granted += 1
+            metrics.waited += 1
+            metrics.total_wait += wait
+            metrics.max_wait = max(metrics.max_wait, wait)
+            waiter.future.set_result(None)
@@ -26,23 +26,44 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from . import BradfordWhiteConnectData
-from .const import DOMAIN, ENERGY_TYPE_HEAT_PUMP, ENERGY_TYPE_RESISTANCE
-from .coordinator import BradfordWhiteConnectEnergyCoordinator
+from .anomaly import ANOMALY_PROPERTIES
+from .capabilities import DeviceCapabilities
+from .const import (
+    DOMAIN,
+    ENERGY_TYPE_HEAT_PUMP,
+    ENERGY_TYPE_RESISTANCE,
+    SIGNAL_ENERGY_ESTIMATES_UPDATED,
+    SIGNAL_OUTBOX_UPDATED,
+    SIGNAL_SERIES_UPDATED,
+)
+from .coordinator import (
+    BradfordWhiteConnectEnergyCoordinator,
+    BradfordWhiteConnectStatusCoordinator,
+)
+from .energy import POWER_PROPERTIES, start_of_day
 from .entity import (
     BradfordWhiteConnectDescribedStatusEntity,
     BradfordWhiteConnectEnergyEntity,
+    BradfordWhiteConnectFleetEntity,
+    BradfordWhiteConnectStatusEntity,
+    async_add_status_entities,
+    described_entity_factory,
 )
 from .fault_codes import (
     HEAT_MODE_OPTIONS,
-    decode_alarm_bitmap_attributes,
-    decode_alarm_bitmap_state,
+    decode_alarm,
     heat_mode_to_name,
 )
+from .fleet import MIN_HEATERS, FleetAggregates
+from .forecast import CapacityForecaster
 from .helper import get_device_property_value, has_property
+from .timeseries import SampleBuffer, minutes_to_target, rate_per_hour
 
 
 def _stripped(value: Any) -> Any:
@@ -56,15 +77,19 @@ class BWSensorDescription(SensorEntityDescription):
 
     Follows the aosmith / vicare HA core pattern:
     - ``value_fn`` extracts the value from a Device on each update
-    - ``supported_fn`` decides whether the sensor is created for a device
+    - ``supported_fn`` decides whether the sensor is created for a device,
+      from the coordinator's precomputed ``DeviceCapabilities``
     - ``extra_state_attributes_fn`` (optional) returns a dict to expose
       as the entity's ``extra_state_attributes`` (used by the alarm
       sensor to attach the raw bitmap and decoded fault list)
+    - ``deadband`` (optional, diagnostic sensors only) is the smallest
+      change written while recorder-efficiency mode is enabled
     """
 
     value_fn: Callable[[Device], Any]
-    supported_fn: Callable[[Device], bool] = lambda device: True
+    supported_fn: Callable[[DeviceCapabilities], bool] = lambda capabilities: True
     extra_state_attributes_fn: Callable[[Device], dict[str, Any]] | None = None
+    deadband: float | None = None
 
 
 PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
@@ -109,6 +134,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=1,
+        deadband=1.0,
         value_fn=lambda device: get_device_property_value(device, "evap_inlet_temp"),
         supported_fn=has_property("evap_inlet_temp"),
     ),
@@ -120,6 +146,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=1,
+        deadband=1.0,
         value_fn=lambda device: get_device_property_value(device, "evap_outlet_temp"),
         supported_fn=has_property("evap_outlet_temp"),
     ),
@@ -131,6 +158,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=1,
+        deadband=1.0,
         value_fn=lambda device: get_device_property_value(
             device, "comp_discharge_temp"
         ),
@@ -144,6 +172,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=2,
+        deadband=1.0,
         value_fn=lambda device: get_device_property_value(device, "superheat_evap"),
         supported_fn=has_property("superheat_evap"),
     ),
@@ -209,6 +238,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=0,
+        deadband=2.0,
         value_fn=lambda device: get_device_property_value(device, "mains_voltage"),
         supported_fn=has_property("mains_voltage"),
     ),
@@ -220,6 +250,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=2,
+        deadband=0.2,
         value_fn=lambda device: get_device_property_value(device, "mains_current"),
         supported_fn=has_property("mains_current"),
     ),
@@ -231,6 +262,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=2,
+        deadband=0.2,
         value_fn=lambda device: get_device_property_value(device, "hp_current"),
         supported_fn=has_property("hp_current"),
     ),
@@ -242,6 +274,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=2,
+        deadband=0.2,
         value_fn=lambda device: get_device_property_value(device, "ue_current"),
         supported_fn=has_property("ue_current"),
     ),
@@ -253,6 +286,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=2,
+        deadband=0.2,
         value_fn=lambda device: get_device_property_value(device, "le_current"),
         supported_fn=has_property("le_current"),
     ),
@@ -264,6 +298,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=3.0,
         value_fn=lambda device: get_device_property_value(
             device, "wifi_signal_strength"
         ),
@@ -315,6 +350,7 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         translation_key="eev_position",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=5.0,
         value_fn=lambda device: get_device_property_value(device, "eev_pos"),
         supported_fn=has_property("eev_pos"),
     ),
@@ -401,12 +437,13 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         key="alarm",
         translation_key="alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda device: decode_alarm_bitmap_state(
+        # Both callbacks share the memoized decode of the same bitmap.
+        value_fn=lambda device: decode_alarm(
             get_device_property_value(device, "alarm")
-        ),
-        extra_state_attributes_fn=lambda device: decode_alarm_bitmap_attributes(
+        ).state,
+        extra_state_attributes_fn=lambda device: decode_alarm(
             get_device_property_value(device, "alarm")
-        ),
+        ).as_attributes(),
         supported_fn=has_property("alarm"),
     ),
     BWSensorDescription(
@@ -432,12 +469,213 @@ PROPERTY_SENSORS: tuple[BWSensorDescription, ...] = (
         translation_key="connection_status",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: getattr(device, "connection_status", None),
-        supported_fn=lambda device: getattr(device, "connection_status", None)
-        is not None,
+        supported_fn=lambda capabilities: capabilities.has_connection_status,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BWTrendSensorDescription(SensorEntityDescription):
+    """Describes a sensor derived from one property's recent samples.
+
+    - ``property_name`` is the sampled property (see ``timeseries``)
+    - ``value_fn`` computes the state from its ``SampleBuffer`` and the
+      device, once per status poll
+    """
+
+    property_name: str
+    value_fn: Callable[[SampleBuffer, Device], Any]
+    supported_fn: Callable[[DeviceCapabilities], bool]
+
+
+def _minutes_to_setpoint(buffer: SampleBuffer, device: Device) -> float | None:
+    """Estimate minutes until the tank reaches ``water_setpoint_out``."""
+    try:
+        setpoint = float(get_device_property_value(device, "water_setpoint_out"))
+    except (TypeError, ValueError):
+        return None
+    return minutes_to_target(buffer, setpoint)
+
+
+TREND_SENSORS: tuple[BWTrendSensorDescription, ...] = (
+    BWTrendSensorDescription(
+        key="tank_temp_rate",
+        translation_key="tank_temp_rate",
+        native_unit_of_measurement=f"{UnitOfTemperature.FAHRENHEIT}/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        property_name="tank_temp",
+        value_fn=lambda buffer, device: rate_per_hour(buffer),
+        supported_fn=has_property("tank_temp"),
+    ),
+    BWTrendSensorDescription(
+        key="tank_temp_mean",
+        translation_key="tank_temp_mean",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        property_name="tank_temp",
+        value_fn=lambda buffer, device: buffer.mean(),
+        supported_fn=has_property("tank_temp"),
+    ),
+    BWTrendSensorDescription(
+        key="time_to_setpoint",
+        translation_key="time_to_setpoint",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        property_name="tank_temp",
+        value_fn=_minutes_to_setpoint,
+        supported_fn=has_property("tank_temp"),
+    ),
+    BWTrendSensorDescription(
+        key="hp_power_mean",
+        translation_key="hp_power_mean",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        property_name="hp_power",
+        value_fn=lambda buffer, device: buffer.mean(),
+        supported_fn=has_property("hp_power"),
+    ),
+    BWTrendSensorDescription(
+        key="re_power_mean",
+        translation_key="re_power_mean",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        property_name="re_power",
+        value_fn=lambda buffer, device: buffer.mean(),
+        supported_fn=has_property("re_power"),
+    ),
+    BWTrendSensorDescription(
+        key="mains_current_mean",
+        translation_key="mains_current_mean",
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=2,
+        property_name="mains_current",
+        value_fn=lambda buffer, device: buffer.mean(),
+        supported_fn=has_property("mains_current"),
     ),
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class BWForecastSensorDescription(SensorEntityDescription):
+    """Describes a hot water forecast sensor.
+
+    - ``value_fn`` reads the heater's ``CapacityForecaster`` once per
+      status poll
+    """
+
+    value_fn: Callable[[CapacityForecaster], Any]
+
+
+def _has_capacity(capabilities: DeviceCapabilities) -> bool:
+    """Return True if the heater reports enough to compute its fill level."""
+    names = capabilities.property_names
+    return "available_thermal_capacity" in names or (
+        "stored_thermal_capacity" in names and "max_thermal_capacity" in names
+    )
+
+
+def _minutes(seconds: float | None) -> float | None:
+    return None if seconds is None else seconds / 60
+
+
+FORECAST_SENSORS: tuple[BWForecastSensorDescription, ...] = (
+    BWForecastSensorDescription(
+        key="time_until_full",
+        translation_key="time_until_full",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda forecaster: _minutes(forecaster.time_until_full()),
+    ),
+    BWForecastSensorDescription(
+        key="time_until_depleted",
+        translation_key="time_until_depleted",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda forecaster: _minutes(forecaster.time_until_depleted()),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BWFleetSensorDescription(SensorEntityDescription):
+    """Describes an account-level sensor on the hub device.
+
+    - ``value_fn`` reads the coordinator's ``FleetAggregates``
+    - ``extra_state_attributes_fn`` (optional) adds attributes from them
+    - ``daily_total`` marks a total that restarts at local midnight and
+      must not go down within the day
+    """
+
+    value_fn: Callable[[FleetAggregates], Any]
+    extra_state_attributes_fn: Callable[[FleetAggregates], dict[str, Any]] | None = None
+    daily_total: bool = False
+
+
+def _mode_count_sensor(mode: str) -> BWFleetSensorDescription:
+    return BWFleetSensorDescription(
+        key=f"fleet_mode_{mode}",
+        translation_key=f"fleet_mode_{mode}",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.mode_count(mode),
+    )
+
+
+FLEET_SENSORS: tuple[BWFleetSensorDescription, ...] = (
+    BWFleetSensorDescription(
+        key="fleet_heaters",
+        translation_key="fleet_heaters",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.heaters,
+    ),
+    BWFleetSensorDescription(
+        key="fleet_power",
+        translation_key="fleet_power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda fleet: fleet.power,
+        extra_state_attributes_fn=lambda fleet: {
+            "heat_pump_power": fleet.hp_power,
+            "resistance_power": fleet.re_power,
+        },
+    ),
+    BWFleetSensorDescription(
+        key="fleet_daily_energy",
+        translation_key="fleet_daily_energy",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        value_fn=lambda fleet: fleet.daily_energy,
+        daily_total=True,
+    ),
+    BWFleetSensorDescription(
+        key="fleet_errors",
+        translation_key="fleet_errors",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.errors,
+    ),
+    *(_mode_count_sensor(mode) for mode in HEAT_MODE_OPTIONS),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -445,23 +683,81 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bradford White Connect sensor platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
+    property_factory = described_entity_factory(
+        data.status_coordinator, BradfordWhiteConnectPropertySensor, PROPERTY_SENSORS
+    )
+    trend_factory = described_entity_factory(
+        data.status_coordinator, BradfordWhiteConnectTrendSensor, TREND_SENSORS
+    )
 
-    energy_entities = [
-        BradfordWhiteConnectEnergySensorEntity(
-            data.energy_coordinator, dsn, device, energy_type
-        )
-        for dsn, device in data.status_coordinator.data.items()
-        for energy_type in (ENERGY_TYPE_RESISTANCE, ENERGY_TYPE_HEAT_PUMP)
-    ]
+    def _entity_factory(
+        dsn: str, device: Device, capabilities: DeviceCapabilities
+    ) -> list[SensorEntity]:
+        return [
+            *(
+                BradfordWhiteConnectEnergySensorEntity(
+                    data.energy_coordinator, dsn, device, energy_type
+                )
+                for energy_type in (ENERGY_TYPE_RESISTANCE, ENERGY_TYPE_HEAT_PUMP)
+            ),
+            *(
+                BradfordWhiteConnectEnergyEstimateSensorEntity(
+                    data.status_coordinator, dsn, device, energy_type
+                )
+                for energy_type, power_property in POWER_PROPERTIES.items()
+                if power_property in capabilities.property_names
+            ),
+            BradfordWhiteConnectOutboxSensorEntity(
+                data.status_coordinator, dsn, device
+            ),
+            *(
+                [
+                    BradfordWhiteConnectAnomalySensorEntity(
+                        data.status_coordinator, dsn, device
+                    )
+                ]
+                if ANOMALY_PROPERTIES.keys() & capabilities.property_names
+                else []
+            ),
+            *property_factory(dsn, device, capabilities),
+            *trend_factory(dsn, device, capabilities),
+            *(
+                BradfordWhiteConnectForecastSensor(
+                    data.status_coordinator, dsn, device, description
+                )
+                for description in FORECAST_SENSORS
+                if _has_capacity(capabilities)
+            ),
+        ]
 
-    property_entities = [
-        BradfordWhiteConnectPropertySensor(data.status_coordinator, dsn, device, desc)
-        for dsn, device in data.status_coordinator.data.items()
-        for desc in PROPERTY_SENSORS
-        if desc.supported_fn(device)
-    ]
+    async_add_status_entities(
+        entry, data.status_coordinator, async_add_entities, _entity_factory
+    )
+    _async_add_fleet_sensors(entry, data.status_coordinator, async_add_entities)
 
-    async_add_entities([*energy_entities, *property_entities])
+
+@callback
+def _async_add_fleet_sensors(
+    entry: ConfigEntry,
+    coordinator: BradfordWhiteConnectStatusCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add the account-level sensors once the account has several heaters."""
+    added = False
+
+    @callback
+    def _async_add() -> None:
+        nonlocal added
+        if added or len(coordinator.inventory) < MIN_HEATERS:
+            return
+        added = True
+        async_add_entities(
+            BradfordWhiteConnectFleetSensor(coordinator, description)
+            for description in FLEET_SENSORS
+        )
+
+    _async_add()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add))
 
 
 class BradfordWhiteConnectEnergySensorEntity(
@@ -482,17 +778,162 @@ class BradfordWhiteConnectEnergySensorEntity(
         energy_type: str,
     ) -> None:
         """Initialize the entity."""
+        self._energy_type = energy_type
         super().__init__(coordinator, dsn, device)
         self._attr_translation_key = f"{energy_type}_energy_usage"
         self._attr_unique_id = f"{energy_type}_{dsn}"
-        self._device = device
-        self._dsn = dsn
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the daily energy usage."""
+        self._attr_native_value = self.energy_usage
+
+
+class BradfordWhiteConnectEnergyEstimateSensorEntity(
+    BradfordWhiteConnectStatusEntity, SensorEntity
+):
+    """Today's energy use, integrated from power samples between cloud totals.
+
+    Updates on every status poll (via a dispatcher signal, since unchanged
+    polls do not notify coordinator listeners) instead of waiting up to an
+    hour and a half for the energy endpoint.
+    """
+
+    _attrs_from_device = False
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinator: BradfordWhiteConnectStatusCoordinator,
+        dsn: str,
+        device: Device,
+        energy_type: str,
+    ) -> None:
+        """Initialize the entity."""
         self._energy_type = energy_type
+        super().__init__(coordinator, dsn, device)
+        self._attr_translation_key = f"{energy_type}_energy_estimate"
+        self._attr_unique_id = f"{energy_type}_estimate_{dsn}"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the daily energy usage."""
-        return self.energy_usage
+    async def async_added_to_hass(self) -> None:
+        """Also refresh whenever the estimates move."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ENERGY_ESTIMATES_UPDATED.format(
+                    self.coordinator.config_entry.entry_id
+                ),
+                self._handle_signal,
+            )
+        )
+
+    @callback
+    def _handle_signal(self) -> None:
+        """Recompute and write the estimate."""
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache today's estimate; the estimate restarts at local midnight."""
+        now = dt_util.now()
+        self._attr_native_value = self.coordinator.energy_estimates.value(
+            self._dsn, self._energy_type, now
+        )
+        self._attr_last_reset = start_of_day(now)
+
+
+class BradfordWhiteConnectOutboxSensorEntity(
+    BradfordWhiteConnectStatusEntity, SensorEntity
+):
+    """Writes to this heater waiting in the outbox for the cloud to recover."""
+
+    _attrs_from_device = False
+    _attr_translation_key = "outbox_depth"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"pending"})
+
+    def __init__(
+        self,
+        coordinator: BradfordWhiteConnectStatusCoordinator,
+        dsn: str,
+        device: Device,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, dsn, device)
+        self._attr_unique_id = f"outbox_{dsn}"
+
+    async def async_added_to_hass(self) -> None:
+        """Also refresh whenever the outbox changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OUTBOX_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._handle_signal,
+            )
+        )
+
+    @callback
+    def _handle_signal(self) -> None:
+        """Recompute and write the outbox depth."""
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache how many writes are queued for this heater, and their names."""
+        outbox = self.coordinator.outbox
+        self._attr_native_value = outbox.depth(self._dsn)
+        self._attr_extra_state_attributes = {"pending": outbox.pending_for(self._dsn)}
+
+
+class BradfordWhiteConnectAnomalySensorEntity(
+    BradfordWhiteConnectStatusEntity, SensorEntity
+):
+    """How far this heat pump's readings stand out from the rest of the fleet.
+
+    The score is the largest robust z-score over the compared properties;
+    it depends on every heater's readings, so it is recomputed on every
+    coordinator update rather than only when this heater changes.
+    """
+
+    _attrs_from_device = False
+    _attr_translation_key = "fleet_anomaly"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _unrecorded_attributes = frozenset({"scores"})
+
+    def __init__(
+        self,
+        coordinator: BradfordWhiteConnectStatusCoordinator,
+        dsn: str,
+        device: Device,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, dsn, device)
+        self._attr_unique_id = f"fleet_anomaly_{dsn}"
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the score, the property behind it and whether it is flagged."""
+        result = self.coordinator.anomalies.get(self._dsn)
+        if result is None or not result.scores:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+        self._attr_native_value = round(result.score, 2)
+        self._attr_extra_state_attributes = {
+            "anomalous": result.anomalous,
+            "property": result.property,
+            "scores": {name: round(z, 2) for name, z in result.scores.items()},
+        }
 
 
 class BradfordWhiteConnectPropertySensor(
@@ -502,21 +943,145 @@ class BradfordWhiteConnectPropertySensor(
 
     entity_description: BWSensorDescription
 
-    @property
-    def native_value(self) -> Any:
-        """Return the current value extracted via the description's value_fn."""
-        try:
-            return self.entity_description.value_fn(self.device)
-        except (AttributeError, KeyError, TypeError, ValueError):
-            return None
+    # Only the alarm sensor has attributes, and they repeat its state in
+    # long form; keep them visible in the UI but out of the recorder.
+    _unrecorded_attributes = frozenset(
+        {
+            "raw_bitmap",
+            "active_bits",
+            "tentative_codes",
+            "tentative_descriptions",
+            "description_source",
+        }
+    )
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return optional extra attributes (e.g. raw bitmap on the alarm sensor)."""
-        attrs_fn = self.entity_description.extra_state_attributes_fn
-        if attrs_fn is None:
+    def _state_deadband(self) -> float | None:
+        """Use the description's deadband in recorder-efficiency mode.
+
+        Held-back changes do not reach the UI or automations either, so
+        only diagnostic sensors get one.
+        """
+        description = self.entity_description
+        if description.entity_category is not EntityCategory.DIAGNOSTIC:
             return None
+        return description.deadband
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the value (and optional extra attributes) from the description."""
+        description = self.entity_description
+        device = self.device
         try:
-            return attrs_fn(self.device)
+            self._attr_native_value = description.value_fn(device)
         except (AttributeError, KeyError, TypeError, ValueError):
-            return None
+            self._attr_native_value = None
+        if (attrs_fn := description.extra_state_attributes_fn) is None:
+            return
+        try:
+            self._attr_extra_state_attributes = attrs_fn(device)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self._attr_extra_state_attributes = None
+
+
+class BradfordWhiteConnectSeriesSensor(
+    BradfordWhiteConnectDescribedStatusEntity, SensorEntity
+):
+    """Base for sensors derived from the coordinator's recent samples.
+
+    Updates on every status poll that adds a sample (via a dispatcher
+    signal, since unchanged polls do not notify coordinator listeners):
+    a steady reading still moves a mean or a forecast.
+    """
+
+    _attrs_from_device = False
+
+    async def async_added_to_hass(self) -> None:
+        """Also refresh whenever new samples arrive."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_SERIES_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._handle_coordinator_update,
+            )
+        )
+
+
+class BradfordWhiteConnectTrendSensor(BradfordWhiteConnectSeriesSensor):
+    """Sensor derived from the recent samples of one property."""
+
+    entity_description: BWTrendSensorDescription
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the value derived from the property's sample buffer."""
+        description = self.entity_description
+        buffer = self.coordinator.series.get(self._dsn, description.property_name)
+        self._attr_native_value = (
+            None if buffer is None else description.value_fn(buffer, self.device)
+        )
+
+
+class BradfordWhiteConnectForecastSensor(BradfordWhiteConnectSeriesSensor):
+    """Time until the tank is full or out of hot water, from its fill level."""
+
+    entity_description: BWForecastSensorDescription
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the forecast, and the phase it is based on."""
+        forecaster = self.coordinator.forecasts.get(self._dsn)
+        if forecaster is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+        self._attr_native_value = self.entity_description.value_fn(forecaster)
+        self._attr_extra_state_attributes = {"phase": forecaster.phase.value}
+
+
+class BradfordWhiteConnectFleetSensor(BradfordWhiteConnectFleetEntity, SensorEntity):
+    """Account-level total or count, maintained incrementally by the coordinator."""
+
+    entity_description: BWFleetSensorDescription
+
+    def __init__(
+        self,
+        coordinator: BradfordWhiteConnectStatusCoordinator,
+        description: BWFleetSensorDescription,
+    ) -> None:
+        """Initialize the entity from its description."""
+        self.entity_description = description
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the aggregate, and any attributes derived from it."""
+        fleet = self.coordinator.fleet
+        value = self.entity_description.value_fn(fleet)
+        if self.entity_description.daily_total:
+            value = self._daily_high_water(value)
+        self._attr_native_value = value
+        if (attributes_fn := self.entity_description.extra_state_attributes_fn) is None:
+            return
+        self._attr_extra_state_attributes = attributes_fn(fleet)
+
+    @callback
+    def _daily_high_water(self, value: float | None) -> float | None:
+        """Hold today's highest total; a new day starts from the sum again.
+
+        A heater dropping out of the listing takes its share out of the
+        sum, which the statistics would otherwise count as consumption
+        going backwards.
+        """
+        today = start_of_day(dt_util.now())
+        previous = self._attr_native_value
+        if (
+            self._attr_last_reset == today
+            and previous is not None
+            and (value is None or value < previous)
+        ):
+            value = previous
+        self._attr_last_reset = today
+        return value
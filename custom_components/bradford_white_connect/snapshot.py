@@ -0,0 +1,140 @@
+"""Immutable, structurally shared status snapshots.
+
+Each status refresh produces a read-only ``Snapshot`` of ``{dsn: Device}``.
+Unchanged devices and properties are the same objects as in the previous
+snapshot, so change detection is an identity check, and a refresh that
+changed nothing returns the previous snapshot itself.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+import dataclasses
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def _metadata_fields(cls: type) -> tuple[str, ...]:
+    """Return the dataclass fields of ``cls`` other than ``properties``."""
+    return tuple(
+        field.name for field in dataclasses.fields(cls) if field.name != "properties"
+    )
+
+
+def _same_metadata(old: Any, new: Any) -> bool:
+    return type(old) is type(new) and all(
+        getattr(old, name) == getattr(new, name) for name in _metadata_fields(type(new))
+    )
+
+
+def share_properties(
+    previous: Mapping[str, Any] | None, properties: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """Return a read-only ``{name: Property}`` that reuses ``previous`` objects.
+
+    Equal properties are replaced by the previous object, and if every
+    property (and the set of names) is unchanged, ``previous`` itself is
+    returned.
+    """
+    if previous is None:
+        return MappingProxyType(dict(properties))
+    shared: dict[str, Any] = {}
+    reused = 0
+    for name, prop in properties.items():
+        old = previous.get(name)
+        if old is not None and (old is prop or old == prop):
+            prop = old
+            reused += 1
+        shared[name] = prop
+    if reused == len(shared) == len(previous):
+        return previous
+    return MappingProxyType(shared)
+
+
+class Snapshot(Mapping[str, Any]):
+    """One refresh's ``{dsn: Device}``; never modified after it is built.
+
+    ``version`` increases with every snapshot that differs from its
+    predecessor; ``changed`` and ``removed`` are the DSNs that differ from
+    that predecessor.
+    """
+
+    __slots__ = ("_devices", "version", "changed", "removed")
+
+    def __init__(
+        self,
+        devices: Mapping[str, Any] | None = None,
+        version: int = 0,
+        changed: frozenset[str] = frozenset(),
+        removed: frozenset[str] = frozenset(),
+    ) -> None:
+        """Wrap ``devices``; the caller must not keep a mutable reference."""
+        self._devices: Mapping[str, Any] = MappingProxyType(dict(devices or {}))
+        self.version = version
+        self.changed = changed
+        self.removed = removed
+
+    def __getitem__(self, dsn: str) -> Any:
+        """Return the device for ``dsn``."""
+        return self._devices[dsn]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the DSNs in the snapshot."""
+        return iter(self._devices)
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self._devices)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by device identity, which structural sharing makes exact."""
+        if self is other:
+            return True
+        if not isinstance(other, Snapshot):
+            return NotImplemented
+        return self._devices.keys() == other._devices.keys() and all(
+            device is other._devices[dsn] for dsn, device in self._devices.items()
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Summarize without dumping every property."""
+        return f"Snapshot(version={self.version}, devices={sorted(self._devices)})"
+
+
+def build_snapshot(
+    previous: Snapshot | None,
+    devices: Iterable[tuple[Any, Mapping[str, Any]]],
+) -> Snapshot:
+    """Build the next snapshot, sharing everything that did not change.
+
+    ``devices`` yields each listed device (a dataclass with a
+    ``properties`` field) with its merged ``{name: Property}``. Returns
+    ``previous`` itself when nothing changed.
+    """
+    old: Mapping[str, Any] = previous or {}
+    built: dict[str, Any] = {}
+    changed: set[str] = set()
+    for device, properties in devices:
+        dsn = device.dsn
+        prior = old.get(dsn)
+        shared = share_properties(
+            None if prior is None else prior.properties, properties
+        )
+        if (
+            prior is not None
+            and shared is prior.properties
+            and _same_metadata(prior, device)
+        ):
+            built[dsn] = prior
+            continue
+        built[dsn] = dataclasses.replace(device, properties=shared)
+        changed.add(dsn)
+    removed = frozenset(old.keys() - built.keys())
+    if previous is not None and not changed and not removed:
+        return previous
+    version = 1 if previous is None else previous.version + 1
+    return Snapshot(built, version, frozenset(changed), removed)
@@ -0,0 +1,102 @@
+"""Recorder footprint accounting for Bradford White Connect entities.
+
+``StateWriteTracker`` counts the state changes each status entity sends
+to the recorder and, in recorder-efficiency mode, suppresses numeric
+changes smaller than the entity's deadband. Availability changes and
+non-numeric values always get through.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+# Never extrapolate rows/day from less than this much uptime.
+_MIN_ELAPSED_S = 3600.0
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class _EntityWrites:
+    last_value: Any = _UNSET
+    last_available: bool | None = None
+    rows: int = 0
+    suppressed: int = 0
+
+
+def _as_number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def within_deadband(previous: Any, value: Any, deadband: float) -> bool:
+    """Return True if ``value`` differs from ``previous`` by less than ``deadband``."""
+    old, new = _as_number(previous), _as_number(value)
+    if old is None or new is None:
+        return False
+    return abs(new - old) < deadband
+
+
+class StateWriteTracker:
+    """Count recorder rows per entity and apply optional deadbands."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize an empty tracker."""
+        self._clock = clock
+        self._started = clock()
+        self._entities: dict[str, _EntityWrites] = {}
+
+    def should_write(
+        self,
+        key: str,
+        value: Any,
+        available: bool,
+        deadband: float | None = None,
+    ) -> bool:
+        """Return whether the entity should write its new state.
+
+        Unchanged states are always allowed through; Home Assistant does
+        not record them anyway, so they are not counted as rows.
+        """
+        entry = self._entities.get(key)
+        if entry is None:
+            entry = self._entities[key] = _EntityWrites()
+        if value == entry.last_value and available == entry.last_available:
+            return True
+        if (
+            deadband
+            and available == entry.last_available
+            and within_deadband(entry.last_value, value, deadband)
+        ):
+            entry.suppressed += 1
+            return False
+        entry.rows += 1
+        entry.last_value = value
+        entry.last_available = available
+        return True
+
+    def forget(self, key: str) -> None:
+        """Stop tracking an entity that was removed."""
+        self._entities.pop(key, None)
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Return rows and suppressed writes per day per entity, busiest first."""
+        days = max(self._clock() - self._started, _MIN_ELAPSED_S) / 86400
+        return {
+            key: {
+                "rows": entry.rows,
+                "suppressed": entry.suppressed,
+                "rows_per_day": round(entry.rows / days, 1),
+                "suppressed_per_day": round(entry.suppressed / days, 1),
+            }
+            for key, entry in sorted(
+                self._entities.items(), key=lambda item: -item[1].rows
+            )
+        }
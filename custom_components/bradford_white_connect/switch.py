@@ -17,16 +17,20 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from bradford_white_connect_client.types import Device
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BradfordWhiteConnectData
+from .capabilities import DeviceCapabilities
 from .const import DOMAIN
-from .entity import BradfordWhiteConnectDescribedStatusEntity
+from .entity import (
+    BradfordWhiteConnectDescribedStatusEntity,
+    async_add_status_entities,
+    described_entity_factory,
+)
 from .helper import get_device_property_value, has_property
 
 
@@ -46,7 +50,7 @@ class BWSwitchDescription(SwitchEntityDescription):
     """Describes a writable boolean input switch."""
 
     property_name: str
-    supported_fn: Callable[[Device], bool] = lambda device: True
+    supported_fn: Callable[[DeviceCapabilities], bool] = lambda capabilities: True
 
 
 SWITCHES: tuple[BWSwitchDescription, ...] = (
@@ -74,11 +78,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bradford White Connect switch platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        BradfordWhiteConnectSwitch(data.status_coordinator, dsn, device, desc)
-        for dsn, device in data.status_coordinator.data.items()
-        for desc in SWITCHES
-        if desc.supported_fn(device)
+    async_add_status_entities(
+        entry,
+        data.status_coordinator,
+        async_add_entities,
+        described_entity_factory(
+            data.status_coordinator, BradfordWhiteConnectSwitch, SWITCHES
+        ),
     )
 
 
@@ -89,15 +95,13 @@ class BradfordWhiteConnectSwitch(
 
     entity_description: BWSwitchDescription
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return the current boolean state, or None if the property is missing."""
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the boolean state, or None if the property is missing."""
         value = get_device_property_value(
             self.device, self.entity_description.property_name
         )
-        if value is None:
-            return None
-        return _is_truthy(value)
+        self._attr_is_on = None if value is None else _is_truthy(value)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Send ``true`` to the underlying property."""
@@ -9,16 +9,20 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from bradford_white_connect_client.types import Device
 from homeassistant.components.text import TextEntity, TextEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BradfordWhiteConnectData
+from .capabilities import DeviceCapabilities
 from .const import DOMAIN
-from .entity import BradfordWhiteConnectDescribedStatusEntity
+from .entity import (
+    BradfordWhiteConnectDescribedStatusEntity,
+    async_add_status_entities,
+    described_entity_factory,
+)
 from .helper import get_device_property_value, has_property
 
 
@@ -27,7 +31,7 @@ class BWTextDescription(TextEntityDescription):
     """Describes a writable text input."""
 
     property_name: str
-    supported_fn: Callable[[Device], bool] = lambda device: True
+    supported_fn: Callable[[DeviceCapabilities], bool] = lambda capabilities: True
 
 
 TEXTS: tuple[BWTextDescription, ...] = (
@@ -49,11 +53,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bradford White Connect text platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        BradfordWhiteConnectText(data.status_coordinator, dsn, device, desc)
-        for dsn, device in data.status_coordinator.data.items()
-        for desc in TEXTS
-        if desc.supported_fn(device)
+    async_add_status_entities(
+        entry,
+        data.status_coordinator,
+        async_add_entities,
+        described_entity_factory(
+            data.status_coordinator, BradfordWhiteConnectText, TEXTS
+        ),
     )
 
 
@@ -62,15 +68,13 @@ class BradfordWhiteConnectText(BradfordWhiteConnectDescribedStatusEntity, TextEn
 
     entity_description: BWTextDescription
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the current string value, or None if unset."""
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the current string value, or None if unset."""
         value = get_device_property_value(
             self.device, self.entity_description.property_name
         )
-        if value is None:
-            return None
-        return str(value)
+        self._attr_native_value = None if value is None else str(value)
 
     async def async_set_value(self, value: str) -> None:
         """Send the new string to the underlying property."""
@@ -0,0 +1,248 @@
+"""Recent-sample ring buffers for Bradford White Connect properties.
+
+``SampleBuffer`` keeps the last hour or so of one numeric property in
+``array('d')`` rings with running sums, so appending a sample and
+reading the mean or least-squares slope are O(1). Times are monotonic
+seconds.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping
+import math
+from typing import Any
+
+# Properties sampled on every status poll.
+TRACKED_PROPERTIES: tuple[str, ...] = (
+    "tank_temp",
+    "tank_temp_lower",
+    "hp_power",
+    "re_power",
+    "mains_current",
+)
+
+# Samples kept per property: an hour at the 30 s minimum spacing.
+DEFAULT_CAPACITY = 128
+DEFAULT_MAX_AGE = 3600.0
+DEFAULT_MIN_SPACING = 30.0
+
+# Shortest span of samples a rate is derived from.
+MIN_RATE_SPAN = 240.0
+
+# Estimates further out than this are reported as unknown.
+MAX_TIME_TO_TARGET = 24 * 3600.0
+
+
+class SampleBuffer:
+    """A bounded window of samples with O(1) mean and slope."""
+
+    __slots__ = (
+        "_capacity",
+        "_max_age",
+        "_min_spacing",
+        "_times",
+        "_values",
+        "_start",
+        "_count",
+        "_origin",
+        "_sum_t",
+        "_sum_v",
+        "_sum_tt",
+        "_sum_tv",
+        "_evictions",
+    )
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        max_age: float = DEFAULT_MAX_AGE,
+        min_spacing: float = DEFAULT_MIN_SPACING,
+    ) -> None:
+        """Allocate an empty buffer."""
+        self._capacity = capacity
+        self._max_age = max_age
+        self._min_spacing = min_spacing
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._count = 0
+        self._reset(0.0)
+
+    def _reset(self, origin: float) -> None:
+        self._origin = origin
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        self._evictions = 0
+
+    def _accumulate(self, at: float, value: float, sign: float) -> None:
+        t = at - self._origin
+        self._sum_t += sign * t
+        self._sum_v += sign * value
+        self._sum_tt += sign * t * t
+        self._sum_tv += sign * t * value
+
+    def _evict_oldest(self) -> None:
+        start = self._start
+        self._accumulate(self._times[start], self._values[start], -1.0)
+        self._start = (start + 1) % self._capacity
+        self._count -= 1
+        self._evictions += 1
+
+    def _rebase(self) -> None:
+        """Recompute the sums exactly, relative to the oldest sample."""
+        samples = list(self)
+        self._reset(samples[0][0] if samples else 0.0)
+        for at, value in samples:
+            self._accumulate(at, value, 1.0)
+
+    def append(self, at: float, value: float) -> bool:
+        """Add a sample; return False if it was too close to the previous one."""
+        if not math.isfinite(value):
+            return False
+        if self._count and at - self.latest()[0] < self._min_spacing:
+            return False
+        while self._count and (
+            self._count == self._capacity
+            or at - self._times[self._start] > self._max_age
+        ):
+            self._evict_oldest()
+        if not self._count:
+            self._reset(at)
+        index = (self._start + self._count) % self._capacity
+        self._times[index] = at
+        self._values[index] = value
+        self._count += 1
+        self._accumulate(at, value, 1.0)
+        if self._evictions >= self._capacity:
+            self._rebase()
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Iterate over ``(time, value)``, oldest first."""
+        for offset in range(self._count):
+            index = (self._start + offset) % self._capacity
+            yield self._times[index], self._values[index]
+
+    def latest(self) -> tuple[float, float]:
+        """Return the newest ``(time, value)``; the buffer must not be empty."""
+        index = (self._start + self._count - 1) % self._capacity
+        return self._times[index], self._values[index]
+
+    def span(self) -> float:
+        """Return the seconds between the oldest and newest sample."""
+        if self._count < 2:
+            return 0.0
+        return self.latest()[0] - self._times[self._start]
+
+    def mean(self) -> float | None:
+        """Return the mean of the held samples."""
+        return self._sum_v / self._count if self._count else None
+
+    def slope(self) -> float | None:
+        """Return the least-squares rate of change, in units per second."""
+        n = self._count
+        if n < 2:
+            return None
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        return (n * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize for diagnostics."""
+        rate = rate_per_hour(self)
+        return {
+            "samples": self._count,
+            "span_s": round(self.span(), 1),
+            "latest": self.latest()[1] if self._count else None,
+            "mean": None if (mean := self.mean()) is None else round(mean, 3),
+            "rate_per_h": None if rate is None else round(rate, 3),
+        }
+
+
+def rate_per_hour(buffer: SampleBuffer) -> float | None:
+    """Return the trend in units per hour, once enough time is covered."""
+    if buffer.span() < MIN_RATE_SPAN:
+        return None
+    slope = buffer.slope()
+    return None if slope is None else slope * 3600
+
+
+def minutes_to_target(buffer: SampleBuffer, target: float | None) -> float | None:
+    """Estimate minutes until a rising series reaches ``target``.
+
+    Zero once the latest sample is at or above the target; unknown while
+    the series is not rising or the estimate is more than a day out.
+    """
+    if target is None or not len(buffer):
+        return None
+    remaining = target - buffer.latest()[1]
+    if remaining <= 0:
+        return 0.0
+    rate = rate_per_hour(buffer)
+    if rate is None or rate <= 0:
+        return None
+    seconds = remaining / rate * 3600
+    return None if seconds > MAX_TIME_TO_TARGET else seconds / 60
+
+
+def _sample_value(prop: Any) -> float | None:
+    try:
+        return float(prop.value)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class PropertySeries:
+    """``SampleBuffer`` per ``(dsn, property)`` for an account."""
+
+    def __init__(
+        self,
+        names: tuple[str, ...] = TRACKED_PROPERTIES,
+        capacity: int = DEFAULT_CAPACITY,
+        max_age: float = DEFAULT_MAX_AGE,
+        min_spacing: float = DEFAULT_MIN_SPACING,
+    ) -> None:
+        """Initialize with no buffers; they are created on first sample."""
+        self.names = names
+        self._capacity = capacity
+        self._max_age = max_age
+        self._min_spacing = min_spacing
+        self._buffers: dict[tuple[str, str], SampleBuffer] = {}
+
+    def add_samples(
+        self, dsn: str, at: float, properties: Mapping[str, Any] | None
+    ) -> bool:
+        """Sample the tracked ``{name: Property}`` values; return True if any was kept."""
+        kept = False
+        for name in self.names:
+            prop = (properties or {}).get(name)
+            if prop is None or (value := _sample_value(prop)) is None:
+                continue
+            buffer = self._buffers.get((dsn, name))
+            if buffer is None:
+                buffer = self._buffers[(dsn, name)] = SampleBuffer(
+                    self._capacity, self._max_age, self._min_spacing
+                )
+            kept = buffer.append(at, value) or kept
+        return kept
+
+    def get(self, dsn: str, name: str) -> SampleBuffer | None:
+        """Return the buffer for one property, if it has been sampled."""
+        return self._buffers.get((dsn, name))
+
+    def forget(self, dsn: str) -> None:
+        """Drop every buffer for a device that left the account."""
+        for key in [key for key in self._buffers if key[0] == dsn]:
+            del self._buffers[key]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize summaries for diagnostics."""
+        data: dict[str, Any] = {}
+        for (dsn, name), buffer in self._buffers.items():
+            data.setdefault(dsn, {})[name] = buffer.as_dict()
+        return data
@@ -0,0 +1,52 @@
+"""OpenMetrics HTTP endpoint for the Bradford White Connect integration."""
+
+from __future__ import annotations
+
+from functools import partial
+from http import HTTPStatus
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, METRICS_URL
+from .metrics import CONTENT_TYPE, integration_families
+
+_DATA_VIEW_REGISTERED = f"{DOMAIN}_metrics_view"
+
+
+class BradfordWhiteConnectMetricsView(HomeAssistantView):
+    """Serve one config entry's pre-rendered OpenMetrics exposition."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the exposition, rendering it only if data changed."""
+        hass = request.app[KEY_HASS]
+        data = hass.data.get(DOMAIN, {}).get(entry_id)
+        coordinator = None if data is None else data.status_coordinator
+        if coordinator is None or coordinator.exposition is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        body = coordinator.exposition.body(
+            coordinator.data,
+            partial(
+                integration_families,
+                coordinator.refresh_metrics,
+                data.scheduler,
+                coordinator.http_cache.metrics,
+                coordinator.commands,
+                coordinator.outbox,
+            ),
+        )
+        return web.Response(body=body, headers={"Content-Type": CONTENT_TYPE})
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the endpoint once; entries without metrics answer 404."""
+    if hass.data.get(_DATA_VIEW_REGISTERED):
+        return
+    hass.data[_DATA_VIEW_REGISTERED] = True
+    hass.http.register_view(BradfordWhiteConnectMetricsView())
@@ -1,11 +1,10 @@
 """The water heater platform for the Bradford White Connect integration."""
 
-from datetime import datetime, timezone
+from functools import lru_cache
 import logging
 from typing import Any
 
 from bradford_white_connect_client.constants import BradfordWhiteConnectHeatingModes
-from bradford_white_connect_client.helper import BradfordWhiteConnectHelper
 from bradford_white_connect_client.types import Device
 from homeassistant.components.water_heater import (
     STATE_ECO,
@@ -18,14 +17,15 @@ from homeassistant.components.water_heater import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BradfordWhiteConnectData
+from .capabilities import ModelCapabilities
 from .const import DOMAIN
 from .coordinator import BradfordWhiteConnectStatusCoordinator
-from .entity import BradfordWhiteConnectStatusEntity
+from .entity import BradfordWhiteConnectStatusEntity, async_add_status_entities
 
 MODE_HA_TO_BRADFORDWHITE = {
     STATE_ECO: BradfordWhiteConnectHeatingModes.HYBRID,
@@ -59,16 +59,77 @@ DEFAULT_OPERATION_MODE_PRIORITY = [
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _operation_list_for(capabilities: ModelCapabilities) -> tuple[str, ...]:
+    """Map a model's vendor heat modes to HA operation modes (once per model)."""
+    ha_modes = tuple(
+        MODE_BRADFORDWHITE_TO_HA[mode]
+        for mode in capabilities.heating_modes
+        if mode in MODE_BRADFORDWHITE_TO_HA
+    )
+    return ha_modes or tuple(DEFAULT_OPERATION_LIST)
+
+
+@lru_cache(maxsize=16)
+def _supported_features_for(
+    capabilities: ModelCapabilities,
+) -> WaterHeaterEntityFeature:
+    """Return the feature flags a model supports (once per model)."""
+    support_flags = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE | WaterHeaterEntityFeature.AWAY_MODE
+    )
+    # Operation mode only supported if there is more than one mode
+    if len(_operation_list_for(capabilities)) > 1:
+        support_flags |= WaterHeaterEntityFeature.OPERATION_MODE
+    return support_flags
+
+
+@lru_cache(maxsize=16)
+def _away_exit_mode_for(capabilities: ModelCapabilities) -> int | None:
+    """Pick the mode to switch to when leaving away mode (once per model).
+
+    Picks the first entry from ``DEFAULT_OPERATION_MODE_PRIORITY`` that
+    the appliance actually supports. If none of the preferred modes are
+    in the supported list (or the list is empty because the model is
+    unknown), falls back to the first non-vacation mode the appliance
+    reports.
+    """
+    supported_modes = [
+        mode
+        for mode in capabilities.heating_modes
+        if mode != BradfordWhiteConnectHeatingModes.VACATION
+    ]
+    if not supported_modes:
+        supported_modes = [
+            MODE_HA_TO_BRADFORDWHITE[mode]
+            for mode in DEFAULT_OPERATION_LIST
+            if mode != STATE_OFF
+        ]
+
+    target_mode: int | None = next(
+        (mode for mode in DEFAULT_OPERATION_MODE_PRIORITY if mode in supported_modes),
+        None,
+    )
+    if target_mode is None:
+        target_mode = supported_modes[0] if supported_modes else None
+    return target_mode
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Bradford White Connect water heater platform."""
     data: BradfordWhiteConnectData = hass.data[DOMAIN][entry.entry_id]
 
-    # Add water heater entities for each device
-    async_add_entities(
-        BradfordWhiteConnectWaterHeaterEntity(data.status_coordinator, dsn, device)
-        for dsn, device in data.status_coordinator.data.items()
+    # Add a water heater entity for each device, including ones that join
+    # the account after setup.
+    async_add_status_entities(
+        entry,
+        data.status_coordinator,
+        async_add_entities,
+        lambda dsn, device, capabilities: [
+            BradfordWhiteConnectWaterHeaterEntity(data.status_coordinator, dsn, device)
+        ],
     )
 
 
@@ -79,6 +140,8 @@ class BradfordWhiteConnectWaterHeaterEntity(
 
     _attr_name = None
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    # Model capabilities the operation list and features were derived from.
+    _model_capabilities: ModelCapabilities | None = None
 
     def __init__(
         self,
@@ -105,157 +168,68 @@ class BradfordWhiteConnectWaterHeaterEntity(
             )
             return None
 
-    def _supported_vendor_modes(self) -> list[int]:
-        """Return the vendor heating-mode list for this appliance, or [] if unknown."""
-        model_prop = self.device.properties.get("appliance_model_out")
-        if model_prop is None or not getattr(model_prop, "value", None):
-            return []
-        appliance_model = model_prop.value.strip()
-        if not appliance_model:
-            return []
-        return list(
-            BradfordWhiteConnectHelper.get_appliance_model_heating_modes(
-                appliance_model
-            )
-        )
-
-    @property
-    def operation_list(self) -> list[str]:
-        """Return the list of supported operation modes."""
-        ha_modes = [
-            MODE_BRADFORDWHITE_TO_HA.get(mode)
-            for mode in self._supported_vendor_modes()
-            if MODE_BRADFORDWHITE_TO_HA.get(mode)
-        ]
-        return ha_modes or DEFAULT_OPERATION_LIST
-
-    @property
-    def supported_features(self) -> WaterHeaterEntityFeature:
-        """Return the list of supported features."""
-        support_flags = WaterHeaterEntityFeature.TARGET_TEMPERATURE
-
-        # Operation mode only supported if there is more than one mode
-        if len(self.operation_list) > 1:
-            support_flags |= WaterHeaterEntityFeature.OPERATION_MODE
-
-        support_flags |= WaterHeaterEntityFeature.AWAY_MODE
-
-        return support_flags
-
     @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        tank_temp = self.device.properties.get("tank_temp")
-        return tank_temp.value if tank_temp else None
+    def capabilities(self) -> ModelCapabilities:
+        """Return the cached model capabilities for this heater."""
+        return self.coordinator.capabilities.model(self._dsn)
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache temperatures, limits, mode and model-derived features."""
+        properties = self.device.properties
+
+        def _value(name: str) -> Any:
+            prop = properties.get(name)
+            return prop.value if prop else None
+
+        self._attr_current_temperature = _value("tank_temp")
+        self._attr_target_temperature = _value("water_setpoint_out")
+        self._attr_min_temp = _value("water_setpoint_min")
+        self._attr_max_temp = _value("water_setpoint_max")
+
+        capabilities = self.capabilities
+        if capabilities is not self._model_capabilities:
+            self._model_capabilities = capabilities
+            self._attr_operation_list = list(_operation_list_for(capabilities))
+            self._attr_supported_features = _supported_features_for(capabilities)
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        water_setpoint_out = self.device.properties.get("water_setpoint_out")
-        return water_setpoint_out.value if water_setpoint_out else None
-
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        water_setpoint_min = self.device.properties.get("water_setpoint_min")
-        return water_setpoint_min.value if water_setpoint_min else None
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        water_setpoint_max = self.device.properties.get("water_setpoint_max")
-        return water_setpoint_max.value if water_setpoint_max else None
-
-    @property
-    def current_operation(self) -> str:
-        """Return the current operation mode."""
-        mode = self._current_heat_mode_int()
-        if mode is None:
-            return STATE_OFF
-        return MODE_BRADFORDWHITE_TO_HA.get(mode, STATE_OFF)
-
-    @property
-    def is_away_mode_on(self):
-        """Return True if away mode is on."""
         mode = self._current_heat_mode_int()
-        return mode == BradfordWhiteConnectHeatingModes.VACATION
+        self._attr_current_operation = (
+            STATE_OFF if mode is None else MODE_BRADFORDWHITE_TO_HA.get(mode, STATE_OFF)
+        )
+        self._attr_is_away_mode_on = mode == BradfordWhiteConnectHeatingModes.VACATION
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
-        if operation_mode not in self.operation_list:
+        if operation_mode not in _operation_list_for(self.capabilities):
             raise HomeAssistantError("Operation mode not supported")
 
         vendor_mode = MODE_HA_TO_BRADFORDWHITE.get(operation_mode)
         if vendor_mode is not None:
             _LOGGER.info("Setting operation mode to %s", operation_mode)
-            await self.client.set_device_heat_mode(self.device, vendor_mode)
-            self.coordinator.shared_data["last_api_set_datetime"] = datetime.now(
-                timezone.utc
-            )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_heat_mode(self.device, vendor_mode)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get("temperature")
         if temperature is not None:
             _LOGGER.info("Setting temperature to %s", temperature)
-            await self.client.update_device_set_point(self.device, temperature)
-            self.coordinator.shared_data["last_api_set_datetime"] = datetime.now(
-                timezone.utc
-            )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_setpoint(self.device, temperature)
 
     async def async_turn_away_mode_on(self) -> None:
         """Turn away mode on."""
         _LOGGER.info("Setting away mode on")
-        await self.client.set_device_heat_mode(
+        await self.coordinator.async_set_heat_mode(
             self.device, BradfordWhiteConnectHeatingModes.VACATION
         )
-        self.coordinator.shared_data["last_api_set_datetime"] = datetime.now(
-            timezone.utc
-        )
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_away_mode_off(self) -> None:
-        """Turn away mode off by switching back to the best supported mode.
-
-        Picks the first entry from ``DEFAULT_OPERATION_MODE_PRIORITY`` that
-        the appliance actually supports. If none of the preferred modes are
-        in the supported list (or the list is empty because the model is
-        unknown), falls back to the first non-vacation mode the appliance
-        reports.
-        """
-        supported_modes = [
-            mode
-            for mode in self._supported_vendor_modes()
-            if mode != BradfordWhiteConnectHeatingModes.VACATION
-        ]
-        if not supported_modes:
-            supported_modes = [
-                MODE_HA_TO_BRADFORDWHITE[mode]
-                for mode in DEFAULT_OPERATION_LIST
-                if mode != STATE_OFF
-            ]
-
-        target_mode: int | None = next(
-            (
-                mode
-                for mode in DEFAULT_OPERATION_MODE_PRIORITY
-                if mode in supported_modes
-            ),
-            None,
-        )
-        if target_mode is None:
-            target_mode = supported_modes[0] if supported_modes else None
-
+        """Turn away mode off by switching back to the best supported mode."""
+        target_mode = _away_exit_mode_for(self.capabilities)
         if target_mode is None:
             raise HomeAssistantError(
                 "No supported non-vacation heating modes available to exit away mode"
             )
 
         _LOGGER.info("Setting away mode off, switching to mode: %s", target_mode)
-        await self.client.set_device_heat_mode(self.device, target_mode)
-        self.coordinator.shared_data["last_api_set_datetime"] = datetime.now(
-            timezone.utc
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_heat_mode(self.device, target_mode)
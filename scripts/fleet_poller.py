@@ -0,0 +1,233 @@
+"""Poll a Bradford White Connect account without Home Assistant.
+
+Runs the integration's own polling and analysis code - ``poller.StatusPoller``
+for the cloud requests and ``core.FleetState`` for everything derived
+from them (fault decoding, energy estimates, forecasts, fleet anomalies
+and account totals) - and writes a metrics stream of JSON lines:
+
+* ``{"type": "device", "t": ..., "dsn": ..., ...}`` per heater per poll,
+  built by ``FleetState.device_metrics``;
+* ``{"type": "fleet", "t": ..., ...}`` per poll, with the account totals;
+* ``{"type": "alarm" | "anomaly", "t": ..., ...}`` per transition, with
+  the same payload the integration fires as a Home Assistant event.
+
+Heaters are fetched ``--concurrency`` at a time, with every request still
+going through one account-wide token bucket (``--rate`` / ``--burst``).
+Cloud energy totals are fetched every ``--energy-interval`` seconds to
+anchor the power-integrated estimates, as the integration does.
+
+Needs the upstream client and aiohttp (``pip install
+bradford-white-connect-client``). Credentials come from ``--email`` /
+``--password`` or the ``BWC_EMAIL`` / ``BWC_PASSWORD`` environment
+variables. Run from the repository root::
+
+    python scripts/fleet_poller.py --concurrency 16 --output metrics.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import time
+from types import ModuleType
+from typing import IO, Any
+
+_INTEGRATION_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "bradford_white_connect"
+)
+
+# Import the integration's modules by their dotted name without running the
+# package __init__ (which needs Home Assistant).
+_package = ModuleType("custom_components.bradford_white_connect")
+_package.__path__ = [str(_INTEGRATION_DIR)]
+sys.modules.setdefault(_package.__name__, _package)
+sys.path.insert(0, str(_INTEGRATION_DIR.parent.parent))
+
+# pylint: disable=wrong-import-position
+import aiohttp  # noqa: E402
+from bradford_white_connect_client import (  # noqa: E402
+    BradfordWhiteConnectAuthenticationError,
+    BradfordWhiteConnectClient,
+    BradfordWhiteConnectUnknownException,
+)
+
+from custom_components.bradford_white_connect.const import (  # noqa: E402
+    ENERGY_USAGE_INTERVAL,
+    REGULAR_INTERVAL,
+    REQUEST_BURST,
+    REQUEST_RATE,
+)
+from custom_components.bradford_white_connect.core import (  # noqa: E402
+    FleetState,
+    PollResult,
+)
+from custom_components.bradford_white_connect.poller import (  # noqa: E402
+    StatusPoller,
+    async_fetch_energy_totals,
+)
+from custom_components.bradford_white_connect.scheduler import (  # noqa: E402
+    RequestPriority,
+    RequestScheduler,
+)
+
+_LOGGER = logging.getLogger("fleet_poller")
+
+# Failures that skip one poll instead of stopping the poller.
+_POLL_ERRORS = (BradfordWhiteConnectUnknownException, aiohttp.ClientError, TimeoutError)
+
+
+def _write(stream: IO[str], record: dict[str, Any]) -> None:
+    stream.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+
+
+def write_poll(stream: IO[str], state: FleetState, result: PollResult) -> None:
+    """Write one poll's metrics and transitions as JSON lines."""
+    at = datetime.now().astimezone().isoformat()
+    for dsn, device in result.snapshot.items():
+        _write(
+            stream,
+            {
+                "type": "device",
+                "t": at,
+                "dsn": dsn,
+                **state.device_metrics(dsn, device),
+            },
+        )
+    _write(stream, {"type": "fleet", "t": at, **state.fleet.as_dict()})
+    for alarm in result.alarms:
+        _write(stream, {"type": "alarm", "t": at, **alarm.as_event_data()})
+    for anomaly in result.anomalies:
+        _write(stream, {"type": "anomaly", "t": at, **anomaly.as_event_data()})
+    stream.flush()
+
+
+async def async_run(args: argparse.Namespace, stream: IO[str]) -> None:
+    """Poll until interrupted (or once, with ``--once``)."""
+    scheduler = RequestScheduler(args.rate, args.burst)
+    async with aiohttp.ClientSession() as session:
+        client = BradfordWhiteConnectClient(args.email, args.password, session)
+        await client.authenticate()
+        poller = StatusPoller(client, scheduler, args.concurrency)
+        state = FleetState()
+        state.register_refresh_tiers(poller.refresh_plan)
+        next_energy = 0.0
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    async with asyncio.timeout(args.interval):
+                        snapshot = await poller.async_poll(
+                            state.data, RequestPriority.STATUS
+                        )
+                except _POLL_ERRORS as err:
+                    _LOGGER.warning("Poll failed: %s", err or type(err).__name__)
+                else:
+                    result = state.process(snapshot, poller.polled_at)
+                    for dsn in result.inventory.retired:
+                        poller.forget(dsn)
+                    write_poll(stream, state, result)
+                    _LOGGER.debug(
+                        "Polled %d heaters in %.1f s",
+                        len(snapshot),
+                        time.monotonic() - started,
+                    )
+                if started >= next_energy:
+                    try:
+                        async with asyncio.timeout(args.interval):
+                            await async_fetch_energy_totals(client, scheduler, state)
+                    except _POLL_ERRORS as err:
+                        _LOGGER.warning(
+                            "Energy total fetch failed: %s", err or type(err).__name__
+                        )
+                    else:
+                        next_energy = started + args.energy_interval
+                if args.once:
+                    return
+                await asyncio.sleep(
+                    max(args.interval - (time.monotonic() - started), 0.0)
+                )
+        finally:
+            await scheduler.async_shutdown()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the command line; credentials default to the environment."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", default=os.environ.get("BWC_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("BWC_PASSWORD"))
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=REGULAR_INTERVAL.total_seconds(),
+        help="seconds between polls (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--energy-interval",
+        type=float,
+        default=ENERGY_USAGE_INTERVAL.total_seconds(),
+        help="seconds between cloud energy total fetches (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="heaters fetched at once (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=REQUEST_RATE,
+        help="sustained requests per second (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=REQUEST_BURST,
+        help="request burst allowance (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output", default="-", help="metrics file, or - for stdout (default)"
+    )
+    parser.add_argument("--once", action="store_true", help="poll once and exit")
+    parser.add_argument("--verbose", "-v", action="store_true")
+    args = parser.parse_args(argv)
+    if not args.email or not args.password:
+        parser.error("--email/--password (or BWC_EMAIL/BWC_PASSWORD) are required")
+    return args
+
+
+def main(argv: list[str]) -> int:
+    """Run the poller; returns the process exit status."""
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+    if args.output == "-":
+        stream = sys.stdout
+    else:
+        stream = open(args.output, "a", encoding="utf-8")  # noqa: SIM115
+    try:
+        asyncio.run(async_run(args, stream))
+    except BradfordWhiteConnectAuthenticationError as err:
+        _LOGGER.error("Authentication failed: %s", err)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
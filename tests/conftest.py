@@ -9,18 +9,34 @@ as flat modules. We also install a minimal stub for the
 ``bradford_white_connect_client`` submodules they import, so the tests
 run with nothing more than ``pytest`` installed.
 
-In CI, ``pipenv install --dev`` will provide the real upstream client.
-The stub is registered into ``sys.modules`` before the real package is
+If the real upstream client is installed (``pipenv install --dev``),
+the stub is registered into ``sys.modules`` before the real package is
 ever imported, so the stub wins for the duration of the test session;
 its surface is intentionally a superset of what the modules-under-test
 touch, so the test outcome is identical against either.
+
+Pure modules that import their siblings relatively (``from .fault_codes
+import ...``) cannot be imported flat, so we also register a bare
+``custom_components.bradford_white_connect`` package whose ``__path__``
+points at the integration directory. That lets tests import those
+modules by their real dotted name without executing the package
+``__init__`` (and therefore without Home Assistant).
+
+The coordinator tests need Home Assistant itself and are skipped when it
+is not installed; the client stub also covers the names the coordinator
+imports so they can run against it.
+
+The fakes the test modules share (a settable clock and minimal device
+and property dataclasses) live at the bottom of this file.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 import sys
 import types
+from typing import Any
 
 
 def _install_upstream_client_stub() -> None:
@@ -36,9 +52,35 @@ def _install_upstream_client_stub() -> None:
 
         properties: dict | None = None
 
+    class _Property:
+        """Minimal stand-in for the real Property dataclass."""
+
+        def __init__(self, **fields: Any) -> None:
+            self.__dict__.update(fields)
+
+    def _dataclass_from_api(cls: type, data: dict[str, Any]) -> Any:
+        return cls(**data)
+
     types_mod.Device = _Device
+    types_mod.Property = _Property
+    types_mod.dataclass_from_api = _dataclass_from_api
     root.types = types_mod
 
+    class BradfordWhiteConnectAuthenticationError(Exception):
+        """Stand-in for the client's authentication failure."""
+
+    class BradfordWhiteConnectUnknownException(Exception):
+        """Stand-in for the client's catch-all failure."""
+
+    class BradfordWhiteConnectClient:
+        """Stand-in for the client; tests pass their own fakes."""
+
+    root.BradfordWhiteConnectAuthenticationError = (
+        BradfordWhiteConnectAuthenticationError
+    )
+    root.BradfordWhiteConnectUnknownException = BradfordWhiteConnectUnknownException
+    root.BradfordWhiteConnectClient = BradfordWhiteConnectClient
+
     constants_mod = types.ModuleType("bradford_white_connect_client.constants")
 
     class _BradfordWhiteConnectHeatingModes:
@@ -55,9 +97,24 @@ def _install_upstream_client_stub() -> None:
     constants_mod.BradfordWhiteConnectHeatingModes = _BradfordWhiteConnectHeatingModes
     root.constants = constants_mod
 
+    helper_mod = types.ModuleType("bradford_white_connect_client.helper")
+
+    class _BradfordWhiteConnectHelper:
+        @staticmethod
+        def get_appliance_model_heating_modes(appliance_model: str) -> list[int]:
+            modes = _BradfordWhiteConnectHeatingModes
+            base = [modes.ELECTRIC, modes.HEAT_PUMP, modes.VACATION, modes.HYBRID]
+            if appliance_model in ("RE2H50S10-1NCWT", "RE2H65T10-1NCWT"):
+                return base
+            return [*base, modes.HYBRID_PLUS]
+
+    helper_mod.BradfordWhiteConnectHelper = _BradfordWhiteConnectHelper
+    root.helper = helper_mod
+
     sys.modules["bradford_white_connect_client"] = root
     sys.modules["bradford_white_connect_client.types"] = types_mod
     sys.modules["bradford_white_connect_client.constants"] = constants_mod
+    sys.modules["bradford_white_connect_client.helper"] = helper_mod
 
 
 _install_upstream_client_stub()
@@ -70,3 +127,44 @@ _INTEGRATION_DIR = (
 )
 if str(_INTEGRATION_DIR) not in sys.path:
     sys.path.insert(0, str(_INTEGRATION_DIR))
+
+
+def _register_integration_package() -> None:
+    name = "custom_components.bradford_white_connect"
+    if name in sys.modules:
+        return
+    import custom_components  # noqa: F401  # pylint: disable=import-outside-toplevel
+
+    package = types.ModuleType(name)
+    package.__path__ = [str(_INTEGRATION_DIR)]
+    sys.modules[name] = package
+
+
+_register_integration_package()
+
+
+class FakeClock:
+    """Monotonic clock stand-in; tests move ``now`` by hand."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class FakeProperty:
+    """Stand-in for an upstream ``Property``."""
+
+    name: str
+    value: Any
+
+
+@dataclass
+class FakeDevice:
+    """Stand-in for an upstream ``Device`` as listed by ``get_devices``."""
+
+    dsn: str
+    connection_status: str = "Online"
+    properties: Any = None
@@ -0,0 +1,83 @@
+"""Unit tests for the incremental alarm history tracker."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.bradford_white_connect.alarm_history import (
+    AlarmHistoryTracker,
+)
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+CLEAR = "0" * 40
+
+
+def _bitmap(*bits: int) -> str:
+    chars = ["0"] * 40
+    for bit in bits:
+        chars[bit] = "1"
+    return "".join(chars)
+
+
+def test_first_bitmap_is_baseline_without_transitions() -> None:
+    tracker = AlarmHistoryTracker()
+    assert tracker.update("dsn1", _bitmap(13), T0) == []
+    [entry] = tracker.log_for("dsn1")
+    assert entry.bit == 13
+    assert entry.active
+    assert entry.set_count == 0
+
+
+def test_set_and_clear_transitions_are_reported_from_the_diff() -> None:
+    tracker = AlarmHistoryTracker()
+    tracker.update("dsn1", CLEAR, T0)
+
+    transitions = tracker.update("dsn1", _bitmap(0, 13), T0 + timedelta(minutes=5))
+    assert [(t.bit, t.active, t.tentative_code) for t in transitions] == [
+        (0, True, "F1"),
+        (13, True, "F14"),
+    ]
+    assert transitions[1].as_event_data()["state"] == "set"
+
+    transitions = tracker.update("dsn1", _bitmap(13), T0 + timedelta(minutes=10))
+    assert [(t.bit, t.active) for t in transitions] == [(0, False)]
+
+    # No change -> no transitions, but the latched bit is still "seen".
+    later = T0 + timedelta(minutes=15)
+    assert tracker.update("dsn1", _bitmap(13), later) == []
+    entries = {entry.bit: entry for entry in tracker.log_for("dsn1")}
+    assert entries[0].set_count == 1
+    assert entries[0].clear_count == 1
+    assert not entries[0].active
+    assert entries[13].first_seen == T0 + timedelta(minutes=5)
+    assert entries[13].last_seen == later
+
+
+def test_devices_are_tracked_independently() -> None:
+    tracker = AlarmHistoryTracker()
+    tracker.update("dsn1", CLEAR, T0)
+    tracker.update("dsn2", CLEAR, T0)
+    assert tracker.update("dsn2", _bitmap(4), T0) != []
+    assert tracker.update("dsn1", CLEAR, T0) == []
+    assert tracker.log_for("dsn1") == []
+
+
+def test_round_trip_preserves_baseline_and_log() -> None:
+    tracker = AlarmHistoryTracker()
+    tracker.update("dsn1", CLEAR, T0)
+    tracker.update("dsn1", _bitmap(8), T0)
+
+    restored = AlarmHistoryTracker.from_dict(tracker.as_dict())
+    # The restored baseline means the still-latched bit is not "new".
+    assert restored.update("dsn1", _bitmap(8), T0) == []
+    assert restored.log_for("dsn1")[0].set_count == 1
+    assert AlarmHistoryTracker.from_dict(None).as_dict() == {"masks": {}, "log": []}
+
+
+def test_log_is_bounded_and_evicts_inactive_first() -> None:
+    tracker = AlarmHistoryTracker(max_log_entries=2)
+    tracker.update("dsn1", CLEAR, T0)
+    tracker.update("dsn1", _bitmap(1), T0)
+    tracker.update("dsn1", CLEAR, T0)
+    tracker.update("dsn1", _bitmap(2, 3), T0)
+    assert sorted(entry.bit for entry in tracker.log_for("dsn1")) == [2, 3]
@@ -0,0 +1,82 @@
+"""Unit tests for fleet-wide anomaly detection."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.bradford_white_connect.anomaly import (
+    FleetAnomalyDetector,
+    robust_center,
+)
+
+
+def _fleet(superheat: list[float | None], **extra: dict[str, float]) -> dict:
+    devices = {}
+    for index, value in enumerate(superheat):
+        properties = {}
+        if value is not None:
+            properties["superheat_evap"] = SimpleNamespace(value=str(value))
+        for name, values in extra.items():
+            if index in values:
+                properties[name] = SimpleNamespace(value=values[index])
+        devices[f"AC{index}"] = SimpleNamespace(properties=properties)
+    return devices
+
+
+def test_robust_center_resists_the_outlier() -> None:
+    median, scale = robust_center([10.0, 11.0, 9.0, 10.0, 50.0, float("nan")], 0.1)
+    assert median == 10.0
+    assert scale == pytest.approx(1.4826)
+    # More than half agree exactly: fall back to the mean absolute deviation.
+    assert robust_center([5.0, 5.0, 5.0, 9.0], 0.1)[1] == pytest.approx(1.2533)
+    assert robust_center([5.0, 5.0, 5.0], 0.5) == (5.0, 0.5)
+
+
+def test_outlier_is_detected_then_cleared_with_hysteresis() -> None:
+    detector = FleetAnomalyDetector()
+    normal = [10.0, 11.0, 9.0, 10.0, 10.5, 9.5]
+
+    transitions = detector.analyze(_fleet([*normal, 30.0]))
+    assert [(t.dsn, t.property, t.value, t.active) for t in transitions] == [
+        ("AC6", "superheat_evap", 30.0, True)
+    ]
+    assert detector.get("AC6").anomalous
+    assert not detector.get("AC0").anomalous
+    assert transitions[0].as_event_data()["state"] == "detected"
+
+    # Still above the clearing level: no new event.
+    assert detector.analyze(_fleet([*normal, 13.5])) == []
+    assert detector.get("AC6").anomalous
+
+    transitions = detector.analyze(_fleet([*normal, 11.0]))
+    assert [(t.dsn, t.active) for t in transitions] == [("AC6", False)]
+    assert transitions[0].property == "superheat_evap"
+
+
+def test_small_fleets_and_unreported_properties_are_not_compared() -> None:
+    detector = FleetAnomalyDetector()
+    assert detector.analyze(_fleet([10.0, 10.0, 40.0])) == []
+    assert detector.get("AC2").score == 0.0
+    assert detector.compared == []
+
+    # Heaters without the property are left out of its column.
+    fleet = _fleet([10.0, 10.5, 9.5, 10.0, 9.0, None, 11.0])
+    detector.analyze(fleet)
+    assert detector.compared == ["superheat_evap"]
+    assert detector.get("AC5").scores == {}
+
+
+def test_score_is_the_largest_property_deviation() -> None:
+    detector = FleetAnomalyDetector()
+    currents = {index: 5.0 + index * 0.1 for index in range(6)}
+    currents[5] = 9.0
+    detector.analyze(_fleet([10.0, 10.5, 9.5, 10.0, 9.0, 10.0], hp_current=currents))
+
+    result = detector.get("AC5")
+    assert result.property == "hp_current"
+    assert result.score == pytest.approx(abs(result.scores["hp_current"]))
+    diagnostics = detector.as_dict()
+    assert set(diagnostics["compared"]) == {"superheat_evap", "hp_current"}
+    assert diagnostics["anomalous"] == int(result.anomalous)
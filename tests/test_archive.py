@@ -0,0 +1,93 @@
+"""Unit tests for the local telemetry archive."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import math
+from pathlib import Path
+from types import SimpleNamespace
+
+from custom_components.bradford_white_connect.archive import (
+    TelemetryArchive,
+    archive_file,
+    load_device_history,
+    write_archive,
+)
+
+_DAY_1 = datetime(2026, 1, 5, 23, 0, tzinfo=UTC).timestamp()
+_DAY_2 = datetime(2026, 1, 6, 1, 0, tzinfo=UTC).timestamp()
+
+
+def _device(**values: object) -> SimpleNamespace:
+    return SimpleNamespace(
+        properties={
+            name: SimpleNamespace(
+                value=value,
+                base_type="string" if name == "alarm" else "decimal",
+            )
+            for name, value in values.items()
+        }
+    )
+
+
+def test_only_changed_values_are_recorded() -> None:
+    archive = TelemetryArchive()
+    first = _device(tank_temp=120, heat_mode=1)
+    assert archive.record({"AC1": first}, ["AC1"], _DAY_1) == 1
+
+    # Re-read properties with equal values are not recorded again.
+    same = _device(tank_temp=120, heat_mode=1)
+    assert archive.record({"AC1": same}, ["AC1"], _DAY_1 + 60) == 0
+
+    changed = _device(tank_temp=121, heat_mode=1)
+    assert archive.record({"AC1": changed, "AC2": None}, ["AC1", "AC2"], _DAY_2) == 1
+    lines = [line for _, line in archive.drain()]
+    assert lines == [
+        f'{{"t":{_DAY_1},"d":"AC1","p":{{"tank_temp":120,"heat_mode":1}}}}',
+        f'{{"t":{_DAY_2},"d":"AC1","p":{{"tank_temp":121}}}}',
+    ]
+    assert archive.drain() == []
+
+    archive.forget("AC1")
+    assert archive.record({"AC1": changed}, ["AC1"], _DAY_2) == 1
+    assert archive.as_dict()["recorded"] == 3
+
+
+def test_history_round_trips_across_days(tmp_path: Path) -> None:
+    archive = TelemetryArchive()
+    archive.record(
+        {"AC1": _device(tank_temp=120, alarm="0001"), "AC10": _device(tank_temp=90)},
+        ["AC1", "AC10"],
+        _DAY_1,
+    )
+    write_archive(tmp_path, archive.drain())
+    archive.record({"AC1": _device(tank_temp="118.5", alarm="0000")}, ["AC1"], _DAY_2)
+    write_archive(tmp_path, archive.drain())
+    assert archive_file(tmp_path, datetime(2026, 1, 6).date()).exists()
+
+    history = load_device_history(tmp_path, "AC1")
+    assert list(history["tank_temp"].times) == [_DAY_1, _DAY_2]
+    assert list(history["tank_temp"].values) == [120.0, 118.5]
+    # Bitmaps stay strings even though they look like numbers.
+    alarm = history["alarm"]
+    assert all(math.isnan(value) for value in alarm.values)
+    assert alarm.raw == {0: "0001", 1: "0000"}
+
+    history = load_device_history(tmp_path, "AC1", ["tank_temp"], start=_DAY_2)
+    assert list(history) == ["tank_temp"]
+    assert len(history["tank_temp"]) == 1
+    assert load_device_history(tmp_path / "missing", "AC1") == {}
+
+
+def test_non_numeric_values_and_retention(tmp_path: Path) -> None:
+    old = (datetime(2026, 1, 6, tzinfo=UTC) - timedelta(days=30)).timestamp()
+    write_archive(tmp_path, [(old, '{"t":%s,"d":"AC1","p":{"x":1}}' % old)])
+    write_archive(
+        tmp_path,
+        [(_DAY_2, '{"t":%s,"d":"AC1","p":{"name":"Garage"}}' % _DAY_2)],
+        retention=timedelta(days=7),
+    )
+    history = load_device_history(tmp_path, "AC1")
+    assert "x" not in history
+    assert math.isnan(history["name"].values[0])
+    assert history["name"].raw == {0: "Garage"}
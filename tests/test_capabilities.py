@@ -0,0 +1,95 @@
+"""Unit tests for the per-appliance capability registry."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from bradford_white_connect_client.constants import (  # type: ignore[import-not-found]
+    BradfordWhiteConnectHeatingModes as Modes,
+)
+
+from custom_components.bradford_white_connect.capabilities import (
+    UNKNOWN_MODEL,
+    CapabilityIndex,
+    CapabilityRegistry,
+    model_capabilities,
+)
+
+
+def test_unknown_or_blank_model_has_no_modes() -> None:
+    assert model_capabilities(None) is UNKNOWN_MODEL
+    registry = CapabilityRegistry()
+    assert registry.update("dsn1", "   ") is UNKNOWN_MODEL
+    assert registry.get("missing") is UNKNOWN_MODEL
+    assert not UNKNOWN_MODEL.known
+    # Unknown models are permissive so nothing gets filtered by mistake.
+    assert UNKNOWN_MODEL.supports_mode(Modes.HYBRID_PLUS)
+
+
+def test_model_string_is_stripped_and_shared_across_devices() -> None:
+    registry = CapabilityRegistry()
+    first = registry.update("dsn1", "RE2H50S10-1NCWT  ")
+    second = registry.update("dsn2", "RE2H50S10-1NCWT")
+    assert first is second
+    assert first.appliance_model == "RE2H50S10-1NCWT"
+    assert not first.supports_mode(Modes.HYBRID_PLUS)
+    assert first.has_heat_pump
+
+
+def test_capabilities_recomputed_only_when_inputs_change() -> None:
+    registry = CapabilityRegistry()
+    caps = registry.update("dsn1", "RE2H50S10-1NCWT", "63A")
+    assert registry.update("dsn1", "RE2H50S10-1NCWT", "63A") is caps
+    assert registry.get("dsn1") is caps
+
+    changed = registry.update("dsn1", "RE2H80T10-1NCWU", "63A")
+    assert changed is not caps
+    assert changed.supports_mode(Modes.HYBRID_PLUS)
+
+    registry.forget("dsn1")
+    assert registry.get("dsn1") is UNKNOWN_MODEL
+
+
+def _device(connection_status: str | None = "Online", **props: object):
+    return SimpleNamespace(
+        connection_status=connection_status,
+        properties={
+            name: SimpleNamespace(value=value) for name, value in props.items()
+        },
+    )
+
+
+def test_index_reuses_unchanged_devices_and_bumps_version_on_change() -> None:
+    index = CapabilityIndex()
+    fleet = {"dsn1": _device(tank_temp=120, appliance_model_out="RE2H50S10-1NCWT")}
+    assert index.rebuild(fleet)
+    first = index["dsn1"]
+    assert first.property_names == {"tank_temp", "appliance_model_out"}
+    assert first.has_connection_status
+    assert index.model("dsn1") is first.model
+    version = index.version
+
+    # Same properties (values may differ) -> nothing changes.
+    fleet = {"dsn1": _device(tank_temp=121, appliance_model_out="RE2H50S10-1NCWT")}
+    assert not index.rebuild(fleet)
+    assert index["dsn1"] is first
+    assert index.version == version
+
+    # A new property or a new device moves the version.
+    fleet["dsn1"] = _device(
+        tank_temp=121, hp_power=0.4, appliance_model_out="RE2H50S10-1NCWT"
+    )
+    fleet["dsn2"] = _device(connection_status=None)
+    assert index.rebuild(fleet)
+    assert index["dsn1"] is not first
+    assert "hp_power" in index["dsn1"].property_names
+    assert not index["dsn2"].has_connection_status
+    assert index.version == version + 1
+
+
+def test_index_drops_removed_devices() -> None:
+    index = CapabilityIndex()
+    index.rebuild({"dsn1": _device(appliance_model_out="RE2H50S10-1NCWT")})
+    assert index.rebuild({})
+    assert "dsn1" not in index
+    assert index.model("dsn1") is UNKNOWN_MODEL
@@ -0,0 +1,152 @@
+"""Unit tests for cloud response capture and replay indexing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from custom_components.bradford_white_connect.capture import (
+    REDACTED,
+    CaptureRecorder,
+    CapturingSession,
+    ReplayIndex,
+    load_capture,
+    write_capture,
+)
+from .conftest import FakeClock
+
+DEVICES_URL = "https://ads-field.aylanetworks.com/apiv1/devices.json"
+PROPERTIES_URL = "https://ads-field.aylanetworks.com/apiv1/dsns/AC000W1/properties.json"
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: Any, headers: dict[str, str]) -> None:
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def read(self) -> bytes:
+        return json.dumps(self._body).encode()
+
+    async def json(self) -> Any:
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self, response: FakeResponse, clock: FakeClock) -> None:
+        self._response = response
+        self._clock = clock
+
+    async def __aenter__(self) -> FakeResponse:
+        self._clock.now += 0.25
+        return self._response
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class FakeSession:
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.responses: list[FakeResponse] = []
+        self.closed = False
+
+    def get(self, url: str, **kwargs: Any) -> FakeRequest:
+        return FakeRequest(self.responses.pop(0), self.clock)
+
+    post = get
+
+
+def _capture_two_requests() -> CaptureRecorder:
+    clock = FakeClock(100.0)
+    recorder = CaptureRecorder(clock=clock)
+    fake = FakeSession(clock)
+    fake.responses = [
+        FakeResponse(
+            200,
+            [{"device": {"dsn": "AC000W1", "lan_ip": "10.0.0.5", "lat": "40.1"}}],
+            {},
+        ),
+        FakeResponse(
+            200,
+            [
+                {"property": {"name": "tank_temp", "value": 120}},
+                {"property": {"name": "appliance_serial_number_out", "value": "S1"}},
+            ],
+            {"ETag": '"v1"', "Server": "ayla"},
+        ),
+    ]
+    session = CapturingSession(fake, recorder)
+
+    async def _run() -> None:
+        async with session.get(DEVICES_URL) as response:
+            await response.json()
+        async with session.get(
+            PROPERTIES_URL, params=[("names[]", "tank_temp")]
+        ) as response:
+            await response.read()
+
+    asyncio.run(_run())
+    assert session.closed is False
+    return recorder
+
+
+def test_exchanges_are_recorded_with_timing_and_redacted() -> None:
+    recorder = _capture_two_requests()
+    devices, properties = (json.loads(line) for line in recorder.drain())
+
+    assert devices["body"][0]["device"] == {
+        "dsn": "dsn-1",
+        "lan_ip": REDACTED,
+        "lat": REDACTED,
+    }
+    assert devices["ms"] == 250.0
+    assert properties["t"] == 0.25
+    assert properties["url"].endswith("/dsns/dsn-1/properties.json")
+    assert properties["params"] == [["names[]", "tank_temp"]]
+    assert properties["headers"] == {"ETag": '"v1"'}
+    values = [item["property"]["value"] for item in properties["body"]]
+    assert values == [120, REDACTED]
+    assert recorder.as_dict()["pending"] == 0
+    assert recorder.as_dict()["recorded"] == 2
+
+
+def test_capture_file_round_trips_across_appends(tmp_path: Path) -> None:
+    recorder = _capture_two_requests()
+    lines = recorder.drain()
+    path = tmp_path / "capture.jsonl.gz"
+    write_capture(path, lines[:1])
+    write_capture(path, lines[1:])
+    assert [record["url"] for record in load_capture(path)] == [
+        DEVICES_URL,
+        PROPERTIES_URL.replace("AC000W1", "dsn-1"),
+    ]
+
+
+def test_pending_records_are_bounded() -> None:
+    recorder = CaptureRecorder(max_pending=2)
+    for _ in range(3):
+        recorder.record("GET", DEVICES_URL, None, 200, {}, [], recorder.clock())
+    assert len(recorder.drain()) == 2
+    assert recorder.dropped == 1
+
+
+def test_replay_serves_in_order_then_repeats_last() -> None:
+    window = [("filter[created_at_since_date]", "2026-01-01T00:00:00Z")]
+    records = [
+        {"method": "GET", "url": DEVICES_URL, "params": [], "status": 200},
+        {"method": "GET", "url": DEVICES_URL, "params": [], "status": 304},
+        {"method": "GET", "url": PROPERTIES_URL, "params": window, "status": 200},
+    ]
+    index = ReplayIndex(records)
+
+    assert index.next("get", DEVICES_URL, None)["status"] == 200
+    assert index.next("GET", DEVICES_URL, {})["status"] == 304
+    assert index.next("GET", DEVICES_URL, None)["status"] == 304
+    # Time-window filters are ignored so a capture replays on any day.
+    other_day = {"filter[created_at_since_date]": "2026-02-01T00:00:00Z"}
+    assert index.next("GET", PROPERTIES_URL, other_day)["status"] == 200
+    assert index.next("POST", DEVICES_URL, None) is None
+    assert (index.served, index.misses) == (4, 1)
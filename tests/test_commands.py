@@ -0,0 +1,160 @@
+"""Unit tests for per-device command lanes."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.bradford_white_connect.commands import (
+    Command,
+    CommandLanes,
+    same_value,
+)
+from .conftest import FakeClock
+
+
+def test_same_value_compares_numbers_loosely() -> None:
+    assert same_value("120", 120)
+    assert same_value(1, True)
+    assert same_value("Kitchen", "Kitchen")
+    assert not same_value(None, 0)
+    assert not same_value("3", 1)
+
+
+def test_writes_to_one_device_are_ordered_and_devices_run_concurrently() -> None:
+    lanes = CommandLanes()
+    log: list[str] = []
+
+    def sender(label: str, delay: float):
+        async def _send() -> None:
+            log.append(f"start {label}")
+            await asyncio.sleep(delay)
+            log.append(f"end {label}")
+
+        return _send
+
+    async def _run() -> None:
+        await asyncio.gather(
+            lanes.run(
+                Command("a", "mode", 1, "mode"), lambda: None, sender("a1", 0.02)
+            ),
+            lanes.run(Command("a", "mode", 3, "mode"), lambda: None, sender("a2", 0)),
+            lanes.run(Command("b", "mode", 1, "mode"), lambda: None, sender("b1", 0)),
+        )
+
+    asyncio.run(_run())
+    assert log.index("end a1") < log.index("start a2")
+    assert log.index("end b1") < log.index("end a1")
+
+
+def test_writes_matching_the_known_value_are_suppressed() -> None:
+    clock = FakeClock()
+    lanes = CommandLanes(pending_ttl=300, clock=clock)
+    sent: list[int] = []
+
+    async def _set(value: int, cached: int) -> bool:
+        async def _send() -> None:
+            sent.append(value)
+
+        return await lanes.run(
+            Command("a", "mode", value, "mode"), lambda: cached, _send
+        )
+
+    async def _run() -> None:
+        assert not await _set(1, cached=1)
+        assert await _set(3, cached=1)
+        # Not yet confirmed by a poll: going back to 1 is a real change,
+        # and repeating 3 is sent again since the heater may not have it.
+        assert await _set(3, cached=1)
+        assert await _set(1, cached=1)
+
+        lanes.reconcile("a", {"mode": SimpleNamespace(value=1)})
+        assert not await _set(1, cached=1)
+
+    asyncio.run(_run())
+    assert sent == [3, 3, 1]
+    stats = lanes.as_dict()["commands"]["mode"]
+    assert (stats["sent"], stats["suppressed"]) == (3, 2)
+    assert lanes.as_dict()["unconfirmed"] == 0
+
+
+def test_a_write_the_cloud_did_not_apply_can_be_retried() -> None:
+    clock = FakeClock()
+    lanes = CommandLanes(pending_ttl=300, clock=clock)
+    sent: list[int] = []
+
+    async def _send() -> None:
+        sent.append(1)
+
+    async def _run() -> None:
+        assert await lanes.run(Command("a", "mode", 1, "mode"), lambda: 3, _send)
+        clock.now = 10
+        lanes.reconcile("a", {"mode": SimpleNamespace(value=3)})
+        # Still reported as 3 within the TTL: the retry must go out.
+        assert await lanes.run(Command("a", "mode", 1, "mode"), lambda: 3, _send)
+
+    asyncio.run(_run())
+    assert sent == [1, 1]
+
+
+def test_unconfirmed_writes_expire_and_actions_are_always_sent() -> None:
+    clock = FakeClock()
+    lanes = CommandLanes(pending_ttl=300, clock=clock)
+
+    async def _noop() -> None:
+        return None
+
+    async def _run() -> None:
+        assert await lanes.run(Command("a", "mode", 3, "mode"), lambda: 1, _noop)
+        clock.now = 301
+        # The cloud never applied it; trust the cached value again.
+        assert await lanes.run(Command("a", "mode", 3, "mode"), lambda: 1, _noop)
+        reboot = Command("a", "reboot", True, "reboot", idempotent=False)
+        assert await lanes.run(reboot, lambda: 1, _noop)
+
+    asyncio.run(_run())
+
+
+def test_failed_sends_are_counted_and_raised() -> None:
+    lanes = CommandLanes()
+
+    async def _fail() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(lanes.run(Command("a", "mode", 3, "mode"), lambda: 1, _fail))
+    assert lanes.as_dict()["commands"]["mode"]["failed"] == 1
+    assert lanes.as_dict()["unconfirmed"] == 0
+
+    lanes.forget("a")
+    assert lanes.as_dict()["busy_lanes"] == 0
+
+
+def test_unwanted_writes_are_suppressed_inside_the_lane() -> None:
+    lanes = CommandLanes()
+    wanted = True
+    sent: list[int] = []
+
+    def sender(value: int):
+        async def _send() -> None:
+            nonlocal wanted
+            await asyncio.sleep(0)
+            sent.append(value)
+            # The first write settles what the second one was queued for.
+            wanted = False
+
+        return _send
+
+    async def _run() -> list[bool]:
+        return await asyncio.gather(
+            lanes.run(Command("a", "mode", 3, "mode"), lambda: 1, sender(3)),
+            lanes.run(
+                Command("a", "mode", 2, "mode"), lambda: 1, sender(2), lambda: wanted
+            ),
+        )
+
+    assert asyncio.run(_run()) == [True, False]
+    assert sent == [3]
+    assert lanes.as_dict()["commands"]["mode"]["suppressed"] == 1
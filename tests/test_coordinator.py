@@ -0,0 +1,148 @@
+"""Tests for the status coordinator, run against a Home Assistant test instance.
+
+Skipped unless Home Assistant and its custom component test helpers are
+installed (``pip install -r requirements.test.txt``, as CI does).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+# pylint: disable=wrong-import-position
+from bradford_white_connect_client import (  # noqa: E402
+    BradfordWhiteConnectUnknownException,
+)
+from homeassistant.core import HomeAssistant  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+)
+
+from custom_components.bradford_white_connect.commands import Command  # noqa: E402
+from custom_components.bradford_white_connect.const import DOMAIN  # noqa: E402
+from custom_components.bradford_white_connect.coordinator import (  # noqa: E402
+    BradfordWhiteConnectStatusCoordinator,
+)
+from custom_components.bradford_white_connect.outbox import Outbox  # noqa: E402
+from custom_components.bradford_white_connect.scheduler import (  # noqa: E402
+    RequestScheduler,
+)
+from custom_components.bradford_white_connect.snapshot import (  # noqa: E402
+    build_snapshot,
+)
+
+from .conftest import FakeDevice, FakeProperty  # noqa: E402
+
+# Outbox and alarm history saves are delayed writes.
+pytestmark = pytest.mark.parametrize("expected_lingering_timers", [True])
+
+_SETPOINT = "water_setpoint_out"
+
+
+class FakeClient:
+    """Records setpoint writes; ``gate`` holds them until it is set."""
+
+    def __init__(self) -> None:
+        self.writes: list[float] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.error: Exception | None = None
+
+    async def update_device_set_point(self, device: Any, value: float) -> None:
+        await self.gate.wait()
+        self.writes.append(value)
+        if self.error is not None:
+            raise self.error
+
+
+def _listing(**setpoints: float) -> list[tuple[FakeDevice, dict[str, FakeProperty]]]:
+    return [
+        (FakeDevice(dsn), {_SETPOINT: FakeProperty(_SETPOINT, value)})
+        for dsn, value in setpoints.items()
+    ]
+
+
+def _coordinator(
+    hass: HomeAssistant, client: Any
+) -> BradfordWhiteConnectStatusCoordinator:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = BradfordWhiteConnectStatusCoordinator(
+        hass, client, entry, RequestScheduler(100.0, 100)
+    )
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.outbox = Outbox(1800, base_backoff=0)
+    coordinator.data = build_snapshot(None, _listing(AC1=110))
+    return coordinator
+
+
+async def _write_during_flush(
+    hass: HomeAssistant, coordinator: BradfordWhiteConnectStatusCoordinator
+) -> None:
+    """Queue 120, then flush it while a user write of 125 holds the lane."""
+    client = coordinator.client
+    coordinator.outbox.add(
+        Command("AC1", "water_setpoint_in", 120, _SETPOINT), "timeout"
+    )
+    client.gate.clear()
+    user_write = hass.async_create_task(
+        coordinator.async_set_setpoint(coordinator.data["AC1"], 125)
+    )
+    for _ in range(3):
+        await asyncio.sleep(0)
+    flush = hass.async_create_task(coordinator._async_flush_outbox())
+    for _ in range(3):
+        await asyncio.sleep(0)
+    client.gate.set()
+    await asyncio.gather(user_write, flush)
+
+
+async def test_flush_does_not_resend_a_write_the_user_replaced(
+    hass: HomeAssistant,
+) -> None:
+    """A queued write settled by a newer one is neither sent nor counted."""
+    coordinator = _coordinator(hass, FakeClient())
+    await _write_during_flush(hass, coordinator)
+
+    assert coordinator.client.writes == [125]
+    assert coordinator.outbox.depth() == 0
+
+
+async def test_flush_keeps_the_newer_queued_write(hass: HomeAssistant) -> None:
+    """A newer write that failed replaces the queued one and stays queued."""
+    client = FakeClient()
+    client.error = BradfordWhiteConnectUnknownException("down")
+    coordinator = _coordinator(hass, client)
+    await _write_during_flush(hass, coordinator)
+
+    assert client.writes == [125]
+    assert [entry.command.value for entry in coordinator.outbox.due()] == [125]
+
+
+async def test_retiring_a_heater_notifies_listeners(hass: HomeAssistant) -> None:
+    """The poll that retires a heater notifies listeners though data is unchanged."""
+    coordinator = _coordinator(hass, FakeClient())
+    coordinator.data = None
+    listings = iter([_listing(AC1=110), [], [], []])
+
+    async def _poll(previous: Any, priority: Any) -> Any:
+        return build_snapshot(previous, next(listings))
+
+    coordinator.poller.async_poll = _poll
+    seen: list[int] = []
+    unsubscribe = coordinator.async_add_listener(
+        lambda: seen.append(coordinator.inventory.version)
+    )
+    for _ in range(4):
+        await coordinator.async_refresh()
+    unsubscribe()
+
+    # The last two misses return the same snapshot; the third retires AC1.
+    assert "AC1" not in coordinator.inventory
+    assert seen[-1] == coordinator.inventory.version
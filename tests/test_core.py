@@ -0,0 +1,139 @@
+"""Unit tests for the Home Assistant independent poll processing core."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+import logging
+from typing import Any
+
+import pytest
+
+from custom_components.bradford_white_connect.core import FleetState
+from custom_components.bradford_white_connect.refresh_tiers import (
+    RefreshPlan,
+    RefreshTier,
+)
+from custom_components.bradford_white_connect.snapshot import build_snapshot
+from .conftest import FakeDevice, FakeProperty
+
+_NOW = datetime(2026, 1, 5, 12, 0, tzinfo=UTC)
+
+_CLEAR = "0" * 40
+_BIT_3 = "0001" + "0" * 36
+
+
+def _healthy(**overrides: Any) -> dict[str, Any]:
+    return {
+        "tank_temp": 120,
+        "water_setpoint_out": 125,
+        "water_setpoint_min": 95,
+        "water_setpoint_max": 140,
+        "current_heat_mode": 1,
+        "alarm": _CLEAR,
+        "hp_power": 0.45,
+        "available_thermal_capacity": 60,
+        **overrides,
+    }
+
+
+def _poll(state: FleetState, **devices: dict[str, Any]):
+    snapshot = build_snapshot(
+        state.data,
+        [
+            (
+                FakeDevice(dsn),
+                {name: FakeProperty(name, value) for name, value in values.items()},
+            )
+            for dsn, values in devices.items()
+        ],
+    )
+    return state.process(snapshot, 0.0)
+
+
+def _state() -> FleetState:
+    return FleetState(local_now=lambda: _NOW, utc_now=lambda: _NOW)
+
+
+def test_first_poll_discovers_heaters_and_samples_them() -> None:
+    state = _state()
+    result = _poll(state, AC1=_healthy(), AC2=_healthy(hp_power=0.5))
+
+    assert result.changed
+    assert result.inventory.added == {"AC1", "AC2"}
+    assert result.energy_sampled and result.series_sampled
+    assert result.capabilities_changed
+    assert result.alarms == []
+    assert state.fleet.power == pytest.approx(0.95)
+
+    metrics = state.device_metrics("AC1", result.snapshot["AC1"])
+    assert metrics["tank_temp"] == 120.0
+    assert metrics["heat_mode"] == "hybrid"
+    assert metrics["alarm_bits"] == []
+    assert metrics["fill_fraction"] == 0.6
+    assert metrics["heat_pump_energy_today"] == 0.0
+
+
+def test_unchanged_poll_only_samples() -> None:
+    state = _state()
+    _poll(state, AC1=_healthy())
+    version = state.fleet.version
+
+    result = _poll(state, AC1=_healthy())
+    assert not result.changed
+    assert result.energy_sampled
+    assert not result.capabilities_changed
+    assert state.fleet.version == version
+
+
+def test_alarm_transitions_and_retirement() -> None:
+    state = _state()
+    _poll(state, AC1=_healthy(), AC2=_healthy())
+
+    result = _poll(state, AC1=_healthy(alarm=_BIT_3), AC2=_healthy())
+    assert [(t.dsn, t.bit, t.active) for t in result.alarms] == [("AC1", 3, True)]
+    assert state.device_metrics("AC1", result.snapshot["AC1"])["alarm_bits"] == [3]
+
+    for _ in range(3):
+        result = _poll(state, AC1=_healthy(alarm=_BIT_3))
+    assert result.inventory.retired == {"AC2"}
+    assert state.forecasts.get("AC2") is None
+    assert state.fleet.heaters == 1
+
+
+def test_changed_heaters_are_sanity_checked(caplog: pytest.LogCaptureFixture) -> None:
+    state = _state()
+    with caplog.at_level(logging.WARNING):
+        _poll(state, AC1=_healthy(tank_temp=999, current_heat_mode="x"))
+    assert "property tank_temp out of range" in caplog.text
+    assert "non-integer current_heat_mode" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        _poll(state, AC1=_healthy(tank_temp=999, current_heat_mode="x"))
+    assert caplog.text == ""
+
+
+def test_series_properties_are_polled_every_time() -> None:
+    state = _state()
+    plan = RefreshPlan()
+    state.register_refresh_tiers(plan)
+    assert plan.tier("tank_temp") is RefreshTier.REALTIME
+
+
+def test_energy_totals_are_fetched_and_anchored_in_local_time() -> None:
+    # 00:30 local is still the previous day in the cloud's daily totals.
+    local = datetime(2026, 1, 6, 0, 30, tzinfo=timezone(timedelta(hours=-5)))
+    state = FleetState(local_now=lambda: local, utc_now=lambda: _NOW)
+    usage_date = state.energy_usage_date()
+    assert usage_date == datetime(2026, 1, 5, 23, 30)
+
+    noon = local.replace(hour=12)
+    state = FleetState(local_now=lambda: noon, utc_now=lambda: _NOW)
+    state.anchor_energy({"AC1": {"heat_pump": 2.0}}, state.energy_usage_date())
+    assert state.energy_estimates.value("AC1", "heat_pump", noon) == 2.0
+    anchor = state.energy_estimates.as_dict()["AC1"]["heat_pump"]["anchor"]
+    assert anchor == {
+        "day": "2026-01-06",
+        "cloud_kwh": 2.0,
+        "covered_until": noon.replace(minute=0).isoformat(),
+    }
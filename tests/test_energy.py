@@ -0,0 +1,92 @@
+"""Unit tests for power-integrated energy estimates."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.bradford_white_connect.energy import (
+    EnergyEstimates,
+    EnergyEstimator,
+    start_of_day,
+)
+
+TZ = timezone(timedelta(hours=-5))
+DAY = date(2026, 1, 15)
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 1, 15, hour, minute, tzinfo=TZ)
+
+
+def test_constant_power_integrates_linearly() -> None:
+    estimator = EnergyEstimator()
+    for minute in range(0, 61, 5):
+        estimator.add_sample(at(10) + timedelta(minutes=minute), 3.0)
+    assert estimator.value(at(11)) == pytest.approx(3.0)
+
+
+def test_trapezoid_between_samples() -> None:
+    estimator = EnergyEstimator()
+    estimator.add_sample(at(10), 0.0)
+    estimator.add_sample(at(10, 10), 6.0)
+    # Average 3 kW for 10 minutes.
+    assert estimator.value(at(10, 10)) == pytest.approx(0.5)
+
+
+def test_segments_are_split_across_hour_buckets() -> None:
+    estimator = EnergyEstimator()
+    estimator.add_sample(at(10, 55), 1.2)
+    estimator.add_sample(at(11, 5), 1.2)
+    hours = estimator.as_dict()["hours"]
+    assert hours[at(10).isoformat()] == pytest.approx(0.1)
+    assert hours[at(11).isoformat()] == pytest.approx(0.1)
+
+
+def test_gaps_and_missing_samples_are_not_bridged() -> None:
+    estimator = EnergyEstimator(max_gap=timedelta(minutes=10))
+    estimator.add_sample(at(10), 5.0)
+    estimator.add_sample(at(10, 30), 5.0)
+    assert estimator.gaps == 1
+    estimator.add_sample(at(10, 35), None)
+    estimator.add_sample(at(10, 40), 5.0)
+    assert estimator.value(at(10, 40)) == 0.0
+
+
+def test_anchor_replaces_integrated_energy_for_covered_hours() -> None:
+    estimator = EnergyEstimator()
+    for minute in range(0, 121, 5):
+        estimator.add_sample(at(9) + timedelta(minutes=minute), 1.0)
+    assert estimator.value(at(11)) == pytest.approx(2.0)
+
+    # The cloud reports 2.5 kWh through 10:00; 10:00-11:00 is integrated.
+    estimator.anchor(DAY, 2.5, at(10, 20))
+    assert estimator.value(at(11)) == pytest.approx(3.5)
+
+
+def test_value_never_decreases_within_a_day_and_resets_at_midnight() -> None:
+    estimator = EnergyEstimator()
+    estimator.anchor(DAY, 4.0, at(10))
+    assert estimator.value(at(10, 30)) == pytest.approx(4.0)
+
+    estimator.anchor(DAY, 3.0, at(11))
+    assert estimator.value(at(11, 30)) == pytest.approx(4.0)
+
+    tomorrow = datetime(2026, 1, 16, 0, 5, tzinfo=TZ)
+    assert estimator.value(tomorrow) == 0.0
+    assert start_of_day(tomorrow) == datetime(2026, 1, 16, tzinfo=TZ)
+
+
+def test_estimates_are_tracked_per_device_and_type() -> None:
+    estimates = EnergyEstimates()
+    assert estimates.value("a", "heat_pump", at(10)) is None
+
+    estimates.add_samples("a", at(10), {"heat_pump": 1.0, "resistance": 0.0})
+    estimates.add_samples("a", at(10, 6), {"heat_pump": 1.0, "resistance": 0.0})
+    assert estimates.value("a", "heat_pump", at(10, 6)) == pytest.approx(0.1)
+    assert estimates.value("a", "resistance", at(10, 6)) == 0.0
+    assert set(estimates.as_dict()["a"]) == {"heat_pump", "resistance"}
+
+    estimates.forget("a")
+    assert estimates.value("a", "heat_pump", at(10, 6)) is None
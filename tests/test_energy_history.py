@@ -0,0 +1,100 @@
+"""Unit tests for hourly energy history aggregation."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.bradford_white_connect.energy_history import (
+    HourlySeries,
+    hourly_buckets,
+    parse_datapoints,
+    statistic_id,
+)
+
+UTC = timezone.utc
+
+
+def _datapoint(created_at: str, value: str) -> dict:
+    return {"datapoint": {"created_at": created_at, "value": value}}
+
+
+def test_statistic_id_is_a_valid_external_id() -> None:
+    assert (
+        statistic_id("AC000W-123", "heat_pump")
+        == "bradford_white_connect:ac000w_123_heat_pump_energy"
+    )
+
+
+def test_parse_datapoints_skips_malformed_items() -> None:
+    points = parse_datapoints(
+        [
+            _datapoint("2026-01-15T10:00:05Z", "0.25:17"),
+            _datapoint("2026-01-15T11:00:04Z", "garbage"),
+            {"datapoint": {"value": "1.0"}},
+            _datapoint("2026-01-15T12:00:03", "0.5"),
+        ]
+    )
+    assert points == [
+        (datetime(2026, 1, 15, 10, 0, 5, tzinfo=UTC), 0.25),
+        (datetime(2026, 1, 15, 12, 0, 3, tzinfo=UTC), 0.5),
+    ]
+
+
+def test_hourly_buckets_are_utc_hour_starts() -> None:
+    local = timezone(timedelta(hours=-5))
+    buckets = hourly_buckets(
+        [
+            (datetime(2026, 1, 15, 5, 10, tzinfo=local), 0.25),
+            (datetime(2026, 1, 15, 10, 40, tzinfo=UTC), 0.5),
+            (datetime(2026, 1, 15, 11, 0, tzinfo=UTC), 1.0),
+        ]
+    )
+    assert buckets == {
+        datetime(2026, 1, 15, 10, tzinfo=UTC): 0.75,
+        datetime(2026, 1, 15, 11, tzinfo=UTC): 1.0,
+    }
+
+
+def test_series_only_emits_new_hours_with_running_sum() -> None:
+    start = datetime(2026, 1, 15, 10, tzinfo=UTC)
+    series = HourlySeries(last_start=start, last_sum=10.0)
+    assert series.next_start(datetime(2020, 1, 1, tzinfo=UTC)) == start + timedelta(
+        hours=1
+    )
+
+    rows = series.extend(
+        {
+            start: 9.0,
+            start + timedelta(hours=2): 0.5,
+            start + timedelta(hours=1): 0.25,
+        }
+    )
+    assert [row.start for row in rows] == [
+        start + timedelta(hours=1),
+        start + timedelta(hours=2),
+    ]
+    assert [row.state for row in rows] == [0.25, 0.5]
+    assert rows[-1].sum == pytest.approx(10.75)
+    assert series.extend({start + timedelta(hours=2): 0.5}) == []
+
+
+def test_the_hour_in_progress_is_left_for_a_later_import() -> None:
+    start = datetime(2026, 1, 15, 13, tzinfo=UTC)
+    current = start + timedelta(hours=1)
+    series = HourlySeries(last_start=start - timedelta(hours=1), last_sum=1.0)
+
+    rows = series.extend({start: 0.2, current: 0.1}, before=current)
+    assert [row.start for row in rows] == [start]
+    assert series.next_start(start) == current
+
+    # Once the hour is over, everything it gained is imported.
+    rows = series.extend({current: 0.5}, before=current + timedelta(hours=1))
+    assert [(row.start, row.state) for row in rows] == [(current, 0.5)]
+    assert rows[-1].sum == pytest.approx(1.7)
+
+
+def test_new_series_starts_at_the_backfill_horizon() -> None:
+    horizon = datetime(2025, 12, 16, tzinfo=UTC)
+    assert HourlySeries().next_start(horizon) == horizon
@@ -0,0 +1,107 @@
+"""Tests for the status entity base, run against a Home Assistant test instance.
+
+Skipped unless Home Assistant and its custom component test helpers are
+installed (``pip install -r requirements.test.txt``, as CI does).
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+# pylint: disable=wrong-import-position
+from homeassistant.core import HomeAssistant  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+)
+
+from custom_components.bradford_white_connect.const import DOMAIN  # noqa: E402
+from custom_components.bradford_white_connect.coordinator import (  # noqa: E402
+    BradfordWhiteConnectStatusCoordinator,
+)
+from custom_components.bradford_white_connect.entity import (  # noqa: E402
+    BradfordWhiteConnectStatusEntity,
+)
+from custom_components.bradford_white_connect.scheduler import (  # noqa: E402
+    RequestScheduler,
+)
+from custom_components.bradford_white_connect.snapshot import (  # noqa: E402
+    build_snapshot,
+)
+
+from .conftest import FakeDevice, FakeProperty  # noqa: E402
+
+# Creating the coordinator sets up its delayed storage writes.
+pytestmark = pytest.mark.parametrize("expected_lingering_timers", [True])
+
+
+class CountingEntity(BradfordWhiteConnectStatusEntity):
+    """Caches the tank temperature and counts how often it recomputes."""
+
+    updates = 0
+
+    def _update_attrs(self) -> None:
+        self.updates += 1
+        prop = self.device.properties.get("tank_temp")
+        self._attr_state = None if prop is None else prop.value
+
+
+def _listing(**temps: float) -> list[tuple[FakeDevice, dict[str, FakeProperty]]]:
+    return [
+        (FakeDevice(dsn), {"tank_temp": FakeProperty("tank_temp", temp)})
+        for dsn, temp in temps.items()
+    ]
+
+
+def _entity(hass: HomeAssistant, attrs_from_device: bool = True) -> CountingEntity:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = BradfordWhiteConnectStatusCoordinator(
+        hass, Mock(), entry, RequestScheduler(100.0, 100)
+    )
+    coordinator.data = build_snapshot(None, _listing(AC1=120, AC2=110))
+    entity = CountingEntity(coordinator, "AC1", coordinator.data["AC1"])
+    entity._attrs_from_device = attrs_from_device
+    entity.hass = hass
+    entity.entity_id = "sensor.counting"
+    entity.async_write_ha_state = Mock()
+    return entity
+
+
+def _poll(entity: CountingEntity, **temps: float) -> None:
+    coordinator = entity.coordinator
+    coordinator.data = build_snapshot(coordinator.data, _listing(**temps))
+    entity._handle_coordinator_update()
+
+
+async def test_unchanged_device_skips_recomputing(hass: HomeAssistant) -> None:
+    """Only a poll that replaced the entity's device recomputes its state."""
+    entity = _entity(hass)
+    assert entity.updates == 1
+
+    # Another heater changed; this one's device object is reused.
+    _poll(entity, AC1=120, AC2=111)
+    assert entity.updates == 1
+
+    _poll(entity, AC1=121, AC2=111)
+    assert entity.updates == 2
+    assert entity.state == 121
+
+    # While the heater is missing, the last device it rendered is kept.
+    _poll(entity, AC2=111)
+    assert entity.updates == 2
+    assert entity.device.properties["tank_temp"].value == 121
+
+
+async def test_entities_reading_more_than_their_device_always_recompute(
+    hass: HomeAssistant,
+) -> None:
+    """``_attrs_from_device = False`` opts out of the identity check."""
+    entity = _entity(hass, attrs_from_device=False)
+    _poll(entity, AC1=120, AC2=111)
+    _poll(entity, AC1=120, AC2=112)
+    assert entity.updates == 3
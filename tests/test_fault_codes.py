@@ -11,7 +11,11 @@ from __future__ import annotations
 from fault_codes import (  # type: ignore[import-not-found]
     FAULT_CODES,
     HEAT_MODE_NAMES,
+    DecodedAlarm,
+    decode_alarm,
     decode_alarm_bitmap,
+    decode_alarm_bitmap_attributes,
+    decode_alarm_bitmap_state,
     heat_mode_to_name,
 )
 
@@ -66,6 +70,46 @@ def test_decode_alarm_bitmap_unknown_bit_uses_unknown_label() -> None:
     assert decoded[0]["tentative_description"].startswith("Unknown fault")
 
 
+def test_decode_alarm_is_memoized_per_bitmap() -> None:
+    bitmap = "1" + "0" * 12 + "1" + "0" * 26
+    first = decode_alarm(bitmap)
+    # A distinct-but-equal string must hit the same cache entry.
+    second = decode_alarm("".join(list(bitmap)))
+    assert first is second
+    assert isinstance(first, DecodedAlarm)
+    assert first.active_bits == (0, 13)
+    assert first.tentative_codes == ("F1", "F14")
+
+
+def test_decode_alarm_all_zero_fast_path_keeps_raw_bitmap() -> None:
+    decoded = decode_alarm("0" * 40)
+    assert decoded.is_clear
+    assert decoded.state == "OK"
+    assert decoded.raw_bitmap == "0" * 40
+    assert decode_alarm(None).raw_bitmap is None
+
+
+def test_decode_alarm_state_and_attributes_share_decode() -> None:
+    bitmap = "0" * 13 + "1" + "0" * 26
+    assert decode_alarm_bitmap_state(bitmap) == "bit 13 (tentative F14)"
+    attrs = decode_alarm_bitmap_attributes(bitmap)
+    assert attrs["raw_bitmap"] == bitmap
+    assert attrs["active_bits"] == [13]
+    assert attrs["tentative_codes"] == ["F14"]
+    assert attrs["tentative_descriptions"] == [f"F14: {FAULT_CODES[14]}"]
+    # Callers get a fresh dict; mutating it must not poison the cache.
+    attrs["active_bits"].append(99)
+    assert decode_alarm_bitmap_attributes(bitmap)["active_bits"] == [13]
+
+
+def test_decode_alarm_bits_beyond_label_table() -> None:
+    bitmap = "0" * 70 + "1"
+    decoded = decode_alarm(bitmap)
+    assert decoded.active_bits == (70,)
+    assert decoded.tentative_codes == ("F71",)
+    assert decoded.tentative_labels == ("F71: Unknown fault (bit 70)",)
+
+
 def test_heat_mode_to_name_none_returns_none() -> None:
     assert heat_mode_to_name(None) is None
 
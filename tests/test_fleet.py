@@ -0,0 +1,71 @@
+"""Unit tests for the incrementally maintained account aggregates."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.bradford_white_connect.fleet import FleetAggregates
+
+
+def _device(**values: object) -> SimpleNamespace:
+    return SimpleNamespace(
+        properties={
+            name: SimpleNamespace(value=value) for name, value in values.items()
+        }
+    )
+
+
+def test_totals_follow_changed_and_removed_heaters() -> None:
+    fleet = FleetAggregates()
+    devices = {
+        "AC1": _device(hp_power="0.45", daily_total_energy=1.2, current_heat_mode=0),
+        "AC2": _device(hp_power=0.5, re_power=4.5, global_error=1),
+        "AC3": _device(tank_temp=120),
+    }
+    assert fleet.update(devices, devices)
+    assert fleet.heaters == 3
+    assert fleet.power == pytest.approx(5.45)
+    assert fleet.hp_power == pytest.approx(0.95)
+    assert fleet.daily_energy == pytest.approx(1.2)
+    assert fleet.errors == 1
+    version = fleet.version
+
+    # An unchanged heater being re-read changes nothing.
+    assert not fleet.update(devices, ["AC3"])
+    assert fleet.version == version
+
+    devices["AC2"] = _device(hp_power=0.5, re_power=0, global_error=0)
+    del devices["AC1"]
+    assert fleet.update(devices, ["AC1", "AC2"])
+    assert fleet.heaters == 2
+    assert fleet.power == 0.5
+    assert fleet.daily_energy is None
+    assert fleet.errors == 0
+    assert sum(fleet.as_dict()["modes"].values()) == 0
+
+
+def test_incremental_totals_match_a_full_rebuild() -> None:
+    rng = random.Random(3)
+    fleet = FleetAggregates()
+    devices: dict[str, SimpleNamespace] = {}
+    for _ in range(500):
+        dsns = rng.sample([f"AC{index}" for index in range(20)], 3)
+        for dsn in dsns:
+            if rng.random() < 0.1:
+                devices.pop(dsn, None)
+            else:
+                devices[dsn] = _device(
+                    hp_power=round(rng.uniform(0, 0.6), 3),
+                    re_power=rng.choice([0, 4.5]),
+                    daily_total_energy=round(rng.uniform(0, 9), 2),
+                    current_heat_mode=rng.randrange(5),
+                    global_error=rng.randrange(2),
+                )
+        fleet.update(devices, dsns)
+
+    rebuilt = FleetAggregates()
+    rebuilt.update(devices, devices)
+    assert fleet.as_dict() | {"version": 0} == rebuilt.as_dict() | {"version": 0}
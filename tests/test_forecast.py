@@ -0,0 +1,92 @@
+"""Unit tests for the hot water availability forecaster."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.bradford_white_connect.forecast import (
+    CapacityForecaster,
+    CapacityForecasts,
+    Phase,
+    fill_fraction,
+)
+
+
+def _properties(**values: object) -> dict[str, SimpleNamespace]:
+    return {name: SimpleNamespace(value=value) for name, value in values.items()}
+
+
+def _feed(
+    forecaster: CapacityForecaster, start: float, fractions: list[float]
+) -> float:
+    """Feed one sample per five-minute poll; return the next poll time."""
+    at = start
+    for fraction in fractions:
+        forecaster.update(at, fraction)
+        at += 300.0
+    return at
+
+
+def test_fill_fraction_prefers_percentage_then_ratio() -> None:
+    assert fill_fraction(_properties(available_thermal_capacity="40")) == 0.4
+    assert (
+        fill_fraction(
+            _properties(stored_thermal_capacity=30, max_thermal_capacity="60")
+        )
+        == 0.5
+    )
+    assert fill_fraction(_properties(available_thermal_capacity=140)) == 1.0
+    assert fill_fraction(_properties(stored_thermal_capacity=30)) is None
+    assert fill_fraction(None) is None
+
+
+def test_recovery_forecasts_time_until_full() -> None:
+    forecaster = CapacityForecaster()
+    # Recovering 5 % per poll, i.e. 60 % per hour.
+    _feed(forecaster, 0.0, [0.30, 0.35, 0.40, 0.45])
+
+    assert forecaster.phase is Phase.RECOVERING
+    assert forecaster.recovery_rate * 3600 == pytest.approx(0.6)
+    assert forecaster.time_until_full() == pytest.approx((0.99 - 0.45) / 0.6 * 3600)
+    assert forecaster.time_until_depleted() is None
+
+
+def test_draw_and_recovery_rates_are_learned_separately() -> None:
+    forecaster = CapacityForecaster()
+    at = _feed(forecaster, 0.0, [0.30, 0.35, 0.40])
+    # A shower drains 10 % per poll.
+    _feed(forecaster, at, [0.30, 0.20, 0.10])
+
+    assert forecaster.phase is Phase.DRAWING
+    assert forecaster.recovery_rate * 3600 == pytest.approx(0.6)
+    assert forecaster.draw_rate * 3600 == pytest.approx(1.2)
+    assert forecaster.time_until_depleted() == pytest.approx((0.10 - 0.01) / 1.2 * 3600)
+    assert forecaster.time_until_full() is None
+
+
+def test_idle_full_and_gaps() -> None:
+    forecaster = CapacityForecaster()
+    at = _feed(forecaster, 0.0, [0.80, 0.80, 0.80])
+    assert forecaster.phase is Phase.IDLE
+    assert forecaster.time_until_full() is None
+
+    # A step across a long gap teaches nothing.
+    forecaster.update(at + 3600.0, 0.95)
+    assert forecaster.recovery_rate is None
+
+    forecaster.update(at + 3900.0, 1.0)
+    assert forecaster.time_until_full() == 0.0
+
+
+def test_forecasts_collection_tracks_heaters_with_a_capacity() -> None:
+    forecasts = CapacityForecasts()
+    assert not forecasts.update("AC1", 0.0, _properties(tank_temp=120))
+    assert forecasts.get("AC1") is None
+
+    assert forecasts.update("AC1", 0.0, _properties(available_thermal_capacity=50))
+    assert forecasts.as_dict()["AC1"]["fraction"] == 0.5
+
+    forecasts.forget("AC1")
+    assert forecasts.get("AC1") is None
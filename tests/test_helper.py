@@ -4,6 +4,8 @@ The helpers are tested against a hand-rolled stub ``Device`` (a
 ``SimpleNamespace`` whose ``properties`` is a ``dict[str, SimpleNamespace]``
 mirroring the upstream client's shape) so the tests run without needing a
 live Home Assistant instance or the upstream client's dataclasses.
+``has_property`` checks run against the ``DeviceCapabilities`` the
+coordinator's ``CapabilityIndex`` builds from such a device.
 """
 
 from __future__ import annotations
@@ -15,6 +17,8 @@ from helper import (  # type: ignore[import-not-found]
     has_property,
 )
 
+from custom_components.bradford_white_connect.capabilities import CapabilityIndex
+
 
 def _make_device(**props: object) -> SimpleNamespace:
     """Build a stub device whose ``properties`` is ``{name: SimpleNamespace(value=...)}``.
@@ -53,16 +57,22 @@ def test_get_device_property_value_when_properties_is_none() -> None:
     assert get_device_property_value(device, "anything") is None
 
 
+def _capabilities(device: SimpleNamespace):
+    index = CapabilityIndex()
+    index.rebuild({"dsn": device})
+    return index["dsn"]
+
+
 def test_has_property_true_when_present() -> None:
     device = _make_device(foo=1)
-    assert has_property("foo")(device) is True
+    assert has_property("foo")(_capabilities(device)) is True
 
 
 def test_has_property_false_when_absent() -> None:
     device = _make_device(bar=1)
-    assert has_property("foo")(device) is False
+    assert has_property("foo")(_capabilities(device)) is False
 
 
 def test_has_property_does_not_raise_when_properties_is_none() -> None:
     device = SimpleNamespace(properties=None)
-    assert has_property("foo")(device) is False
+    assert has_property("foo")(_capabilities(device)) is False
@@ -0,0 +1,77 @@
+"""Unit tests for the conditional-request cache."""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.bradford_white_connect.http_cache import ConditionalCache
+
+BODY = json.dumps([{"property": {"name": "tank_temp", "value": 120}}]).encode()
+
+
+def _parse(body: bytes) -> list:
+    return json.loads(body)
+
+
+def test_first_response_is_parsed_and_validators_replayed() -> None:
+    cache = ConditionalCache()
+    assert cache.request_headers("a") == {}
+
+    payload, changed = cache.resolve(
+        "a", BODY, _parse, etag='"v1"', last_modified="Mon", wire_bytes=20
+    )
+    assert changed
+    assert payload[0]["property"]["value"] == 120
+    assert cache.request_headers("a") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon",
+    }
+    assert cache.metrics.parsed == 1
+    assert cache.metrics.wire_bytes == 20
+    assert cache.metrics.body_bytes == len(BODY)
+
+
+def test_identical_body_skips_parsing_and_returns_same_payload() -> None:
+    cache = ConditionalCache()
+    first, _ = cache.resolve("a", BODY, _parse)
+
+    calls = []
+
+    def _counting_parse(body: bytes) -> list:
+        calls.append(body)
+        return _parse(body)
+
+    second, changed = cache.resolve("a", bytes(BODY), _counting_parse)
+    assert not changed
+    assert second is first
+    assert not calls
+    assert cache.metrics.unchanged_body == 1
+    assert cache.metrics.wire_bytes == 2 * len(BODY)
+
+
+def test_not_modified_returns_cached_payload() -> None:
+    cache = ConditionalCache()
+    first, _ = cache.resolve("a", BODY, _parse, etag='"v1"')
+    assert cache.not_modified("a") is first
+    assert cache.metrics.not_modified == 1
+    assert cache.metrics.requests == 2
+
+
+def test_changed_body_is_reparsed() -> None:
+    cache = ConditionalCache()
+    cache.resolve("a", BODY, _parse)
+    other = BODY.replace(b"120", b"121")
+    payload, changed = cache.resolve("a", other, _parse)
+    assert changed
+    assert payload[0]["property"]["value"] == 121
+
+
+def test_entries_are_bounded_and_forgettable() -> None:
+    cache = ConditionalCache(max_entries=2)
+    for key in (("x", 1), ("y", 1), ("y", 2)):
+        cache.resolve(key, BODY, _parse, etag="e")
+    assert cache.request_headers(("x", 1)) == {}
+
+    cache.forget(lambda key: key[0] == "y")
+    assert cache.request_headers(("y", 1)) == {}
+    assert cache.request_headers(("y", 2)) == {}
@@ -0,0 +1,46 @@
+"""Unit tests for account device inventory tracking."""
+
+from __future__ import annotations
+
+from custom_components.bradford_white_connect.inventory import DeviceInventory
+
+
+def test_new_devices_are_reported_once() -> None:
+    inventory = DeviceInventory()
+    change = inventory.update(["a", "b"])
+    assert change.added == {"a", "b"}
+    assert not change.retired
+    assert inventory.version == 1
+
+    assert not inventory.update(["a", "b"])
+    assert inventory.version == 1
+
+    change = inventory.update(["a", "b", "c"])
+    assert change.added == {"c"}
+    assert "c" in inventory
+    assert inventory.version == 2
+
+
+def test_missing_device_is_retired_only_after_grace_period() -> None:
+    inventory = DeviceInventory(stale_after=2)
+    inventory.update(["a", "b"])
+
+    assert not inventory.update(["a"])
+    assert "b" in inventory
+
+    change = inventory.update(["a"])
+    assert change.retired == {"b"}
+    assert "b" not in inventory
+    assert inventory.last_change is change
+
+
+def test_device_that_comes_back_resets_its_grace_period() -> None:
+    inventory = DeviceInventory(stale_after=2)
+    inventory.update(["a", "b"])
+    inventory.update(["a"])
+    # Back before being retired: not "added" again.
+    assert not inventory.update(["a", "b"])
+    assert not inventory.update(["a"])
+    assert inventory.update(["a"]).retired == {"b"}
+    # A retired device that reappears is new again.
+    assert inventory.update(["a", "b"]).added == {"b"}
@@ -0,0 +1,76 @@
+"""Unit tests for write propagation latency tracking."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.bradford_white_connect.latency import (
+    MIN_WINDOW,
+    PropagationTracker,
+    percentile,
+)
+from .conftest import FakeClock
+
+
+def props(**values: object) -> dict[str, SimpleNamespace]:
+    return {name: SimpleNamespace(value=value) for name, value in values.items()}
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.9) == 5.0
+    assert percentile([7.0], 0.9) == 7.0
+
+
+def test_write_is_timed_until_its_output_property_reflects_it() -> None:
+    clock = FakeClock()
+    tracker = PropagationTracker(timeout=900, clock=clock)
+    tracker.start("a", "water_setpoint_out", 125)
+    assert tracker.pending() == tracker.pending("a") == 1
+
+    clock.now = 10
+    assert tracker.observe("a", props(water_setpoint_out="120")) == []
+    clock.now = 42
+    assert tracker.observe("b", props(water_setpoint_out="125")) == []
+    assert tracker.observe("a", props(water_setpoint_out="125")) == [42]
+    assert tracker.pending() == 0
+
+    report = tracker.as_dict(300)
+    assert report["by_property"]["water_setpoint_out"]["p50_s"] == 42
+    assert report["by_device"]["a"]["count"] == 1
+
+
+def test_unreflected_writes_time_out() -> None:
+    clock = FakeClock()
+    tracker = PropagationTracker(timeout=900, clock=clock)
+    tracker.start("a", "current_heat_mode", 3)
+    clock.now = 901
+    assert tracker.pending() == 0
+    assert tracker.as_dict(300)["overall"]["timeouts"] == 1
+
+
+def test_fast_window_follows_measured_latencies() -> None:
+    clock = FakeClock()
+    tracker = PropagationTracker(timeout=900, clock=clock)
+    assert tracker.fast_window(300) == 300
+
+    for latency in (10, 12, 14, 16, 40):
+        clock.now = 0
+        tracker.start("a", "current_heat_mode", latency)
+        clock.now = latency
+        tracker.observe("a", props(current_heat_mode=latency))
+    assert tracker.fast_window(300) == pytest.approx(60)
+
+    fast = PropagationTracker(timeout=900, clock=clock)
+    for _ in range(5):
+        clock.now = 0
+        fast.start("a", "x", 1)
+        clock.now = 2
+        fast.observe("a", props(x=1))
+    assert fast.fast_window(300) == MIN_WINDOW
+
+    fast.forget("a")
+    assert "a" not in fast.as_dict(300)["by_device"]
@@ -0,0 +1,93 @@
+"""Unit tests for the OpenMetrics exposition."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.bradford_white_connect.commands import CommandLanes
+from custom_components.bradford_white_connect.http_cache import ResponseMetrics
+from custom_components.bradford_white_connect.metrics import (
+    MetricFamily,
+    OpenMetricsExposition,
+    RefreshMetrics,
+    integration_families,
+    render_device,
+)
+from custom_components.bradford_white_connect.outbox import Outbox
+from custom_components.bradford_white_connect.scheduler import RequestScheduler
+
+
+def _device(**properties: tuple[object, str | None]) -> SimpleNamespace:
+    return SimpleNamespace(
+        properties={
+            name: SimpleNamespace(value=value, base_type=base_type)
+            for name, (value, base_type) in properties.items()
+        }
+    )
+
+
+def test_only_numeric_properties_are_rendered() -> None:
+    device = _device(
+        tank_temp=(120, "integer"),
+        hp_power=("0.45", "decimal"),
+        alarm=("0001" + "0" * 36, "string"),
+        controller_sw=("1.2.3", "string"),
+        heater_name=('Garage "west"', "string"),
+    )
+    assert render_device('AC"1', device) == (
+        'bradford_white_connect_property{dsn="AC\\"1",property="hp_power"} 0.45\n'
+        'bradford_white_connect_property{dsn="AC\\"1",property="tank_temp"} 120\n'
+    )
+
+
+def test_body_is_cached_until_invalidated() -> None:
+    exposition = OpenMetricsExposition()
+    collected = 0
+
+    def families() -> list[MetricFamily]:
+        nonlocal collected
+        collected += 1
+        return [MetricFamily("x_refreshes", "counter", "Refreshes.", [({}, 3)])]
+
+    unchanged = _device(tank_temp=(120, "integer"))
+    devices = {"AC1": unchanged, "AC2": _device(tank_temp=(118, "integer"))}
+    body = exposition.body(devices, families)
+    assert exposition.body(devices, families) is body
+    assert collected == 1
+    assert body.startswith(b"# TYPE bradford_white_connect_property gauge\n")
+    assert b"# TYPE x_refreshes counter\n" in body
+    assert b"\nx_refreshes_total 3\n" in body
+    assert body.endswith(b"# EOF\n")
+
+    # Only the replaced device is rendered again.
+    exposition.invalidate()
+    devices = {"AC1": unchanged, "AC2": _device(tank_temp=(119, "integer"))}
+    body = exposition.body(devices, families)
+    assert b'dsn="AC2",property="tank_temp"} 119\n' in body
+    assert (exposition.renders, exposition.device_renders, collected) == (2, 3, 2)
+
+
+def test_integration_families() -> None:
+    refresh = RefreshMetrics()
+    refresh.record(1.5, True)
+    refresh.record(0.5, False)
+    families = {
+        family.name: family
+        for family in integration_families(
+            refresh,
+            RequestScheduler(2.0, 10),
+            ResponseMetrics(not_modified=4, parsed=2),
+            CommandLanes(300),
+            Outbox(1800),
+        )
+    }
+    assert families["bradford_white_connect_refreshes"].samples == [({}, 2)]
+    assert families["bradford_white_connect_refresh_failures"].samples == [({}, 1)]
+    assert families["bradford_white_connect_refresh_success"].samples == [({}, False)]
+    assert families["bradford_white_connect_refresh_duration_seconds"].samples == [
+        ({}, 0.5)
+    ]
+    assert ({"result": "not_modified"}, 4) in families[
+        "bradford_white_connect_property_responses"
+    ].samples
+    assert refresh.as_dict()["mean_duration_s"] == 1.0
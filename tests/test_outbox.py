@@ -0,0 +1,87 @@
+"""Unit tests for the durable write outbox."""
+
+from __future__ import annotations
+
+from custom_components.bradford_white_connect.commands import Command
+from custom_components.bradford_white_connect.outbox import Outbox
+from .conftest import FakeClock
+
+LOADUP = Command("a", "drm_advanced_loadup", 1, "drm_advanced_loadup")
+
+
+def test_failed_write_backs_off_exponentially() -> None:
+    clock = FakeClock(1_000.0)
+    outbox = Outbox(ttl=1800, base_backoff=30, max_backoff=100, clock=clock)
+    entry = outbox.add(LOADUP, "timeout")
+    assert outbox.depth() == outbox.depth("a") == 1
+    assert outbox.depth("b") == 0
+    assert outbox.due() == []
+
+    clock.now += 30
+    assert outbox.due() == [entry]
+    outbox.retry_later(entry, "timeout")
+    assert entry.next_attempt == clock.now + 60
+    outbox.retry_later(entry, "timeout")
+    assert entry.next_attempt == clock.now + 100
+    assert entry.attempts == 3
+
+
+def test_newer_writes_supersede_queued_ones() -> None:
+    outbox = Outbox(ttl=1800, clock=FakeClock(1_000.0))
+    outbox.add(LOADUP, "down")
+    outbox.add(Command("a", "drm_advanced_loadup", 0, "drm_advanced_loadup"), "down")
+    assert outbox.pending_for("a") == ["drm_advanced_loadup"]
+    assert outbox.superseded == 1
+
+    # A direct write of a different value cancels the queued one.
+    assert outbox.discard(LOADUP)
+    assert outbox.superseded == 2
+    assert not outbox.discard(LOADUP)
+
+    outbox.add(LOADUP, "down")
+    assert outbox.discard(LOADUP)
+    assert outbox.delivered == 1
+    assert outbox.depth() == 0
+
+
+def test_replayed_entries_are_only_removed_while_still_queued() -> None:
+    outbox = Outbox(ttl=1800, clock=FakeClock(1_000.0))
+    stale = outbox.add(LOADUP, "down")
+    newer = outbox.add(
+        Command("a", "drm_advanced_loadup", 0, "drm_advanced_loadup"), "down"
+    )
+    assert not outbox.holds(stale)
+    assert not outbox.remove(stale, delivered=True)
+    assert outbox.depth() == 1
+
+    assert outbox.remove(newer, delivered=True)
+    assert not outbox.holds(newer)
+    assert outbox.delivered == 1
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock(1_000.0)
+    outbox = Outbox(ttl=60, base_backoff=30, clock=clock)
+    outbox.add(LOADUP, "down")
+    outbox.dirty = False
+    clock.now += 60
+    assert outbox.due() == []
+    assert [entry.command for entry in outbox.expire()] == [LOADUP]
+    assert outbox.expired == 1
+    assert outbox.dirty
+
+
+def test_outbox_round_trips_through_storage() -> None:
+    clock = FakeClock(1_000.0)
+    outbox = Outbox(ttl=1800, clock=clock)
+    outbox.add(LOADUP, "down")
+    outbox.add(Command("b", "set_heat_mode", 3, "current_heat_mode"), "auth")
+
+    restored = Outbox.from_dict(outbox.as_dict(), ttl=1800, clock=clock)
+    assert restored.as_dict() == outbox.as_dict()
+    assert restored.depth() == 2
+    restored.forget("b")
+    assert restored.pending_for("b") == []
+
+    assert Outbox.from_dict(None, ttl=1800).depth() == 0
+    assert Outbox.from_dict({"entries": [{"dsn": "a"}]}, ttl=1800).depth() == 0
@@ -0,0 +1,83 @@
+"""Unit tests for the diagnostics redaction helpers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from custom_components.bradford_white_connect.redaction import (
+    REDACTED,
+    bound_estimates,
+    device_to_dict,
+    field_plan,
+    head,
+    pseudonymize,
+    pseudonyms,
+    tail,
+)
+
+
+@dataclass
+class FakeProperty:
+    name: str
+    value: object
+    dsn: str
+
+
+def test_device_payload_is_redacted_by_plan() -> None:
+    assert field_plan(FakeProperty) == (
+        ("name", False),
+        ("value", False),
+        ("dsn", True),
+    )
+    device = SimpleNamespace(
+        product_name="Heater",
+        dsn="AC000W1",
+        lat="41.0",
+        properties={
+            "tank_temp": FakeProperty("tank_temp", 120, "AC000W1"),
+            "appliance_serial_number_out": FakeProperty("serial", "X", "AC000W1"),
+        },
+    )
+    assert device_to_dict(device) == {
+        "product_name": "Heater",
+        "dsn": REDACTED,
+        "lat": REDACTED,
+        "properties": {
+            "tank_temp": {"name": "tank_temp", "value": 120, "dsn": REDACTED},
+            "appliance_serial_number_out": REDACTED,
+        },
+    }
+
+
+def test_dsns_are_replaced_in_keys_and_values() -> None:
+    names = pseudonyms(["AC000W2", "AC000W1", "AC000W1"])
+    assert names == {"AC000W1": "dsn-1", "AC000W2": "dsn-2"}
+    sections = {
+        "series": {"AC000W2": {"tank_temp": [1, 2]}},
+        "changed": {"AC000W1"},
+        "statistics": {"bradford_white_connect:ac000w1_heat_pump_energy": 3},
+        "log": [{"note": "AC000W2 tripped", "count": 1}],
+    }
+    assert pseudonymize(sections, names) == {
+        "series": {"dsn-2": {"tank_temp": [1, 2]}},
+        "changed": ["dsn-1"],
+        "statistics": {"bradford_white_connect:dsn-1_heat_pump_energy": 3},
+        "log": [{"note": "dsn-2 tripped", "count": 1}],
+    }
+    assert pseudonymize(sections, {}) is sections
+
+
+def test_history_buffers_are_bounded() -> None:
+    assert tail([1, 2, 3, 4], 3) == {"rows": [2, 3, 4], "truncated": 1}
+    assert tail([1], 3) == {"rows": [1], "truncated": 0}
+    assert head([("a", 1), ("b", 2), ("c", 3)], 2) == {
+        "rows": {"a": 1, "b": 2},
+        "truncated": 1,
+    }
+    estimates = {
+        "heat_pump": {"total": 1.5, "hours": {"10": 0.5, "11": 0.25, "12": 0.75}},
+    }
+    assert bound_estimates(estimates, 2) == {
+        "heat_pump": {"total": 1.5, "hours": {"11": 0.25, "12": 0.75}},
+    }
@@ -0,0 +1,121 @@
+"""Unit tests for tiered property refresh planning."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from custom_components.bradford_white_connect.helper import has_property
+from custom_components.bradford_white_connect.refresh_tiers import (
+    RefreshPlan,
+    RefreshTier,
+    tier_for,
+)
+
+
+@dataclass
+class FakeDescription:
+    supported_fn: Any
+    entity_category: str | None = None
+    device_class: str | None = None
+
+
+def test_tier_for_descriptions() -> None:
+    assert tier_for(None, "temperature") is RefreshTier.REALTIME
+    assert tier_for("config", None) is RefreshTier.NORMAL
+    assert tier_for("diagnostic", "voltage") is RefreshTier.SLOW
+    assert tier_for("diagnostic", "current") is RefreshTier.NORMAL
+    assert tier_for("diagnostic", "duration") is RefreshTier.SLOW
+    assert tier_for("diagnostic", None) is RefreshTier.SLOW
+
+
+def test_register_descriptions_uses_the_property_behind_supported_fn() -> None:
+    plan = RefreshPlan()
+    plan.register_descriptions(
+        [
+            FakeDescription(has_property("comp_hours"), "diagnostic", "duration"),
+            FakeDescription(has_property("hp_power"), None, "power"),
+            FakeDescription(lambda capabilities: True, "diagnostic"),
+            # Pinned properties keep their pinned tier.
+            FakeDescription(has_property("tank_size_out"), "diagnostic", "volume"),
+            FakeDescription(has_property("alarm"), "diagnostic"),
+        ]
+    )
+    assert plan.tier("comp_hours") is RefreshTier.SLOW
+    assert plan.tier("hp_power") is RefreshTier.REALTIME
+    assert plan.tier("tank_size_out") is RefreshTier.STATIC
+    assert plan.tier("alarm") is RefreshTier.REALTIME
+    assert plan.tier("never_registered") is RefreshTier.SLOW
+
+
+def test_most_frequent_registration_wins() -> None:
+    plan = RefreshPlan()
+    plan.register("x", RefreshTier.SLOW)
+    plan.register("x", RefreshTier.NORMAL)
+    plan.register("x", RefreshTier.SLOW)
+    assert plan.tier("x") is RefreshTier.NORMAL
+
+
+def test_first_poll_and_new_devices_fetch_everything() -> None:
+    plan = RefreshPlan()
+    due = plan.due_tiers(0.0)
+    assert due == frozenset(RefreshTier)
+    assert plan.names_to_fetch(due, {"tank_temp"}, 0.0) is None
+
+    plan.mark_fetched(due, 0.0)
+    due = plan.due_tiers(300.0)
+    assert due == {RefreshTier.REALTIME}
+    assert plan.names_to_fetch(due, None, 300.0) is None
+
+
+def test_tiers_come_due_on_their_own_schedule() -> None:
+    plan = RefreshPlan()
+    plan.register("hp_power", RefreshTier.REALTIME)
+    plan.register("mains_current", RefreshTier.NORMAL)
+    known = {"tank_temp", "hp_power", "mains_current", "comp_hours", "type_out"}
+    plan.mark_fetched(plan.due_tiers(0.0), 0.0)
+
+    due = plan.due_tiers(300.0)
+    assert plan.names_to_fetch(due, known, 300.0) == {"tank_temp", "hp_power"}
+    plan.mark_fetched(due, 300.0)
+
+    due = plan.due_tiers(900.0)
+    assert plan.names_to_fetch(due, known, 900.0) == {
+        "tank_temp",
+        "hp_power",
+        "mains_current",
+    }
+    plan.mark_fetched(due, 900.0)
+
+    due = plan.due_tiers(3600.0)
+    assert RefreshTier.SLOW in due
+    assert "comp_hours" in plan.names_to_fetch(due, known, 3600.0)
+    plan.mark_fetched(due, 3600.0)
+
+    assert plan.names_to_fetch(plan.due_tiers(86400.0), known, 86400.0) is None
+
+
+def test_promoted_property_is_fetched_every_poll_until_expiry() -> None:
+    plan = RefreshPlan()
+    plan.mark_fetched(plan.due_tiers(0.0), 0.0)
+    plan.promote("set_vacation_mode_days", until=310.0)
+    known = {"tank_temp", "set_vacation_mode_days"}
+
+    due = plan.due_tiers(5.0)
+    assert "set_vacation_mode_days" in plan.names_to_fetch(due, known, 5.0)
+    assert plan.as_dict()["promoted"] == ["set_vacation_mode_days"]
+
+    due = plan.due_tiers(320.0)
+    assert plan.names_to_fetch(due, known, 320.0) == {"tank_temp"}
+    assert plan.as_dict()["promoted"] == []
+
+
+def test_fetch_counters() -> None:
+    plan = RefreshPlan()
+    plan.record_fetch(None, 120)
+    plan.record_fetch(frozenset({"tank_temp"}), 1)
+    data = plan.as_dict()
+    assert data["full_fetches"] == 1
+    assert data["partial_fetches"] == 1
+    assert data["properties_fetched"] == 121
+    assert "tank_temp" in data["tiers"]["realtime"]
@@ -0,0 +1,98 @@
+"""Unit tests for the account-wide request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.bradford_white_connect.scheduler import (
+    RequestPriority,
+    RequestScheduler,
+)
+from .conftest import FakeClock
+
+
+def test_burst_is_granted_without_queueing() -> None:
+    async def scenario() -> None:
+        scheduler = RequestScheduler(rate=1.0, burst=3, clock=FakeClock())
+        for _ in range(3):
+            await scheduler.acquire(RequestPriority.STATUS, "a")
+        metrics = scheduler.metrics[RequestPriority.STATUS]
+        assert metrics.granted == 3
+        assert metrics.waited == 0
+        assert scheduler.queue_depth == 0
+
+    asyncio.run(scenario())
+
+
+def test_run_returns_request_result() -> None:
+    async def scenario() -> None:
+        scheduler = RequestScheduler(rate=1.0, burst=1)
+
+        async def request() -> str:
+            return "ok"
+
+        assert await scheduler.run(RequestPriority.USER_WRITE, "a", request) == "ok"
+
+    asyncio.run(scenario())
+
+
+def test_waiting_requests_are_granted_by_priority() -> None:
+    async def scenario() -> None:
+        scheduler = RequestScheduler(rate=200.0, burst=1)
+        await scheduler.acquire(RequestPriority.STATUS, "a")
+
+        order: list[RequestPriority] = []
+
+        async def request(priority: RequestPriority) -> None:
+            await scheduler.acquire(priority, "a")
+            order.append(priority)
+
+        await asyncio.gather(
+            request(RequestPriority.DIAGNOSTICS),
+            request(RequestPriority.ENERGY),
+            request(RequestPriority.USER_WRITE),
+            request(RequestPriority.STATUS),
+        )
+        assert order == [
+            RequestPriority.USER_WRITE,
+            RequestPriority.STATUS,
+            RequestPriority.ENERGY,
+            RequestPriority.DIAGNOSTICS,
+        ]
+        assert scheduler.metrics[RequestPriority.ENERGY].waited == 1
+
+    asyncio.run(scenario())
+
+
+def test_devices_are_served_round_robin_within_a_priority() -> None:
+    async def scenario() -> None:
+        scheduler = RequestScheduler(rate=200.0, burst=1)
+        await scheduler.acquire(RequestPriority.STATUS, None)
+
+        order: list[str] = []
+
+        async def request(dsn: str) -> None:
+            await scheduler.acquire(RequestPriority.STATUS, dsn)
+            order.append(dsn)
+
+        await asyncio.gather(*(request(dsn) for dsn in ("a", "a", "a", "b", "b")))
+        assert order == ["a", "b", "a", "b", "a"]
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_cancels_waiters() -> None:
+    async def scenario() -> None:
+        scheduler = RequestScheduler(rate=0.001, burst=1)
+        await scheduler.acquire(RequestPriority.STATUS, "a")
+        waiter = asyncio.ensure_future(scheduler.acquire(RequestPriority.ENERGY, "a"))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 1
+        assert scheduler.as_dict()["priorities"]["energy"]["queue_depth"] == 1
+
+        await scheduler.async_shutdown()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert waiter.cancelled()
+        assert scheduler.queue_depth == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,88 @@
+"""Unit tests for immutable, structurally shared status snapshots."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.bradford_white_connect.snapshot import (
+    Snapshot,
+    build_snapshot,
+)
+from .conftest import FakeDevice, FakeProperty
+
+
+def _poll(*devices: tuple[str, dict[str, Any]], status: str = "Online") -> list:
+    """Build a fresh listing, as ``get_devices`` + property fetches would."""
+    return [
+        (
+            FakeDevice(dsn, status),
+            {name: FakeProperty(name, value) for name, value in values.items()},
+        )
+        for dsn, values in devices
+    ]
+
+
+def test_first_snapshot_copies_devices_and_freezes_properties() -> None:
+    listing = _poll(("A", {"tank_temp": 120}))
+    snapshot = build_snapshot(None, listing)
+
+    assert snapshot.version == 1
+    assert snapshot.changed == {"A"}
+    device = snapshot["A"]
+    assert device is not listing[0][0]
+    assert listing[0][0].properties is None
+    assert device.properties["tank_temp"].value == 120
+    with pytest.raises(TypeError):
+        device.properties["tank_temp"] = FakeProperty("tank_temp", 0)
+
+
+def test_unchanged_poll_returns_the_previous_snapshot() -> None:
+    first = build_snapshot(None, _poll(("A", {"tank_temp": 120}), ("B", {})))
+    second = build_snapshot(first, _poll(("A", {"tank_temp": 120}), ("B", {})))
+
+    assert second is first
+    assert second == first
+
+
+def test_changed_device_is_new_and_others_are_shared() -> None:
+    first = build_snapshot(
+        None,
+        _poll(("A", {"tank_temp": 120, "alarm": 0}), ("B", {"tank_temp": 110})),
+    )
+    second = build_snapshot(
+        first,
+        _poll(("A", {"tank_temp": 121, "alarm": 0}), ("B", {"tank_temp": 110})),
+    )
+
+    assert second.version == 2
+    assert second.changed == {"A"}
+    assert second != first
+    assert second["B"] is first["B"]
+    assert second["A"] is not first["A"]
+    # The unchanged property is shared even though the device changed.
+    assert second["A"].properties["alarm"] is first["A"].properties["alarm"]
+    # The earlier snapshot still shows the earlier reading.
+    assert first["A"].properties["tank_temp"].value == 120
+
+
+def test_metadata_property_set_and_removal_changes() -> None:
+    first = build_snapshot(None, _poll(("A", {"tank_temp": 120}), ("B", {})))
+
+    offline = build_snapshot(
+        first, _poll(("A", {"tank_temp": 120}), ("B", {}), status="Offline")
+    )
+    assert offline.changed == {"A", "B"}
+
+    grown = build_snapshot(offline, _poll(("A", {"tank_temp": 120, "alarm": 0})))
+    assert grown.changed == {"A"}
+    assert grown.removed == {"B"}
+    assert "B" not in grown
+
+
+def test_snapshots_compare_by_device_identity() -> None:
+    snapshot = build_snapshot(None, _poll(("A", {"tank_temp": 120})))
+    assert Snapshot(snapshot, version=7) == snapshot
+    assert Snapshot() != snapshot
+    assert dict(snapshot) == {"A": snapshot["A"]}
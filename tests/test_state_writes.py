@@ -0,0 +1,59 @@
+"""Unit tests for recorder write accounting and deadbands."""
+
+from __future__ import annotations
+
+from custom_components.bradford_white_connect.state_writes import (
+    StateWriteTracker,
+    within_deadband,
+)
+from .conftest import FakeClock
+
+
+def test_within_deadband_only_compares_numbers() -> None:
+    assert within_deadband("120", 120.5, 1.0)
+    assert not within_deadband(120, 121, 1.0)
+    assert not within_deadband("OK", "bit 3", 1.0)
+    assert not within_deadband(None, 1.0, 1.0)
+    assert not within_deadband(True, False, 1.0)
+
+
+def test_changes_are_counted_and_repeats_are_not() -> None:
+    tracker = StateWriteTracker()
+    assert tracker.should_write("sensor.a", 1.0, True)
+    assert tracker.should_write("sensor.a", 1.0, True)
+    assert tracker.should_write("sensor.a", 1.1, True)
+    assert tracker.report()["sensor.a"]["rows"] == 2
+
+
+def test_deadband_suppresses_small_drift_until_it_adds_up() -> None:
+    tracker = StateWriteTracker()
+    assert tracker.should_write("sensor.a", 10.0, True, deadband=0.5)
+    assert not tracker.should_write("sensor.a", 10.2, True, deadband=0.5)
+    assert not tracker.should_write("sensor.a", 10.4, True, deadband=0.5)
+    assert tracker.should_write("sensor.a", 10.6, True, deadband=0.5)
+    report = tracker.report()["sensor.a"]
+    assert report["rows"] == 2
+    assert report["suppressed"] == 2
+
+
+def test_availability_changes_are_never_suppressed() -> None:
+    tracker = StateWriteTracker()
+    tracker.should_write("sensor.a", 10.0, True, deadband=5)
+    assert tracker.should_write("sensor.a", 10.1, False, deadband=5)
+    assert tracker.should_write("sensor.a", 10.1, True, deadband=5)
+
+
+def test_report_extrapolates_rows_per_day_busiest_first() -> None:
+    clock = FakeClock()
+    tracker = StateWriteTracker(clock)
+    for value in range(12):
+        tracker.should_write("sensor.busy", value, True)
+    tracker.should_write("sensor.quiet", 1, True)
+    clock.now = 43200.0
+
+    report = tracker.report()
+    assert list(report) == ["sensor.busy", "sensor.quiet"]
+    assert report["sensor.busy"]["rows_per_day"] == 24.0
+
+    tracker.forget("sensor.busy")
+    assert "sensor.busy" not in tracker.report()
@@ -0,0 +1,88 @@
+"""Unit tests for the per-property sample ring buffers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.bradford_white_connect.timeseries import (
+    PropertySeries,
+    SampleBuffer,
+    minutes_to_target,
+    rate_per_hour,
+)
+
+
+def _least_squares_slope(samples: list[tuple[float, float]]) -> float:
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_v = sum(v for _, v in samples) / n
+    covariance = sum((t - mean_t) * (v - mean_v) for t, v in samples)
+    return covariance / sum((t - mean_t) ** 2 for t, _ in samples)
+
+
+def test_mean_and_slope_of_a_recovering_tank() -> None:
+    buffer = SampleBuffer()
+    for minute in range(0, 30, 5):
+        assert buffer.append(minute * 60.0, 100 + minute * 0.5)
+
+    assert len(buffer) == 6
+    assert buffer.mean() == pytest.approx(106.25)
+    # Half a degree per minute.
+    assert rate_per_hour(buffer) == pytest.approx(30.0)
+    assert minutes_to_target(buffer, 120.0) == pytest.approx(15.0)
+    assert minutes_to_target(buffer, 110.0) == 0.0
+
+
+def test_too_close_and_non_finite_samples_are_dropped() -> None:
+    buffer = SampleBuffer(min_spacing=30.0)
+    assert buffer.append(0.0, 120.0)
+    assert not buffer.append(5.0, 121.0)
+    assert not buffer.append(40.0, float("nan"))
+    assert buffer.append(40.0, 121.0)
+    assert list(buffer) == [(0.0, 120.0), (40.0, 121.0)]
+    # Not enough time covered for a trend yet.
+    assert rate_per_hour(buffer) is None
+
+
+def test_eviction_by_capacity_and_age_keeps_sums_exact() -> None:
+    buffer = SampleBuffer(capacity=8, max_age=600.0, min_spacing=0.0)
+    at = 1_000_000.0
+    for step in range(50):
+        buffer.append(at + step * 60.0, (step % 7) * 1.5)
+    samples = list(buffer)
+    assert len(samples) == 8
+    assert buffer.mean() == pytest.approx(sum(v for _, v in samples) / 8)
+    assert buffer.slope() == pytest.approx(_least_squares_slope(samples))
+
+    # A long gap ages out everything but the new sample.
+    buffer.append(at + 10_000.0, 5.0)
+    assert list(buffer) == [(at + 10_000.0, 5.0)]
+    assert buffer.mean() == 5.0
+    assert buffer.slope() is None
+
+
+def test_draining_or_steady_tank_has_no_time_to_setpoint() -> None:
+    buffer = SampleBuffer()
+    for minute in range(0, 30, 5):
+        buffer.append(minute * 60.0, 118 - minute * 0.2)
+    assert rate_per_hour(buffer) == pytest.approx(-12.0)
+    assert minutes_to_target(buffer, 120.0) is None
+    assert minutes_to_target(SampleBuffer(), 120.0) is None
+
+
+def test_property_series_samples_tracked_numeric_properties() -> None:
+    series = PropertySeries(names=("tank_temp", "hp_power"))
+    properties = {
+        "tank_temp": SimpleNamespace(value="118"),
+        "hp_power": SimpleNamespace(value=None),
+        "alarm": SimpleNamespace(value=0),
+    }
+    assert series.add_samples("AC1", 0.0, properties)
+    assert not series.add_samples("AC1", 1.0, properties)
+    assert series.get("AC1", "hp_power") is None
+    assert series.as_dict()["AC1"]["tank_temp"]["latest"] == 118.0
+
+    series.forget("AC1")
+    assert series.get("AC1", "tank_temp") is None